@@ -5,7 +5,7 @@
 # APPLICATION INFORMATION
 #   Written by Daniel Grimes & Justin Grimes.
 #   https://github.com/zelon88/Robot_Motion
-#   Version v4.6, January 1st, 2023
+#   Version v4.7, October 17th, 2026
 #   Licensed Under GNU GPLv3
 
 # APPLICATION DESCRIPTION
@@ -126,12 +126,18 @@ def ImportLibraries(LastMessage):
   # Announce the start of the operation if Debug is enabled by configuration.
   if Debug == True:
     LastMessage = PrintMessage(LastMessage, 'Importing Required Libraries...')
-  try:
-    import RPi.GPIO as GPIO
-  # Handle the exception that is raised if the RPi library is missing.
-  except ModuleNotFoundError as LibErrorA:
-    LibErrorB, MissingLibs = True, ' RPi'
-    PrintError(1, 'Captured Exception, '+str(LibErrorA)+'.', False)
+  # The GPIOChip backend drives the GPIO lines through the kernel & the Mock backend drives no GPIO lines. Both only need the pin values used by the RPi library.
+  if GPIOBackend in ('GPIOChip', 'Mock'):
+    import types as Types
+    GPIO = Types.SimpleNamespace(HIGH=1, LOW=0)
+  else:
+    # Attempt to import the RPi Library.
+    try:
+      import RPi.GPIO as GPIO
+    # Handle the exception that is raised if the RPi library is missing.
+    except ModuleNotFoundError as LibErrorA:
+      LibErrorB, MissingLibs = True, ' RPi'
+      PrintError(1, 'Captured Exception, '+str(LibErrorA)+'.', False)
   # Attempt to import the Time Library.
   try:
     import time as Time
@@ -139,13 +145,31 @@ def ImportLibraries(LastMessage):
   except ModuleNotFoundError as LibErrorA:
     LibErrorB, MissingLibs = True, MissingLibs+' time'
     PrintError(2, 'Captured Exception, '+str(LibErrorA)+'.', False)
-  # Attempt to import the Keyboard Library.
+  # The Evdev & Terminal keyboard input backends read key events directly & do not use the keyboard library.
+  if KeyboardInputBackend in ('Evdev', 'Terminal'):
+    KB = None
+  else:
+    # Attempt to import the Keyboard Library.
+    try:
+      import keyboard as KB
+    # Handle the exception that is raised if the keyboard library is missing.
+    except ModuleNotFoundError as LibErrorA:
+      LibErrorB, MissingLibs = True, MissingLibs+' keyboard'
+      PrintError(3, 'Captured Exception, '+str(LibErrorA)+'.', False)
+  # Attempt to import the Threading Library.
   try:
-    import keyboard as KB
-  # Handle the exception that is raised if the keyboard library is missing.
+    import threading as Threading
+  # Handle the exception that is raised if the threading library is missing.
   except ModuleNotFoundError as LibErrorA:
-    LibErrorB, MissingLibs = True, MissingLibs+' keyboard'
-    PrintError(3, 'Captured Exception, '+str(LibErrorA)+'.', False)
+    LibErrorB, MissingLibs = True, MissingLibs+' threading'
+    PrintError(8, 'Captured Exception, '+str(LibErrorA)+'.', False)
+  # Attempt to import the Queue Library.
+  try:
+    import queue as Queue
+  # Handle the exception that is raised if the queue library is missing.
+  except ModuleNotFoundError as LibErrorA:
+    LibErrorB, MissingLibs = True, MissingLibs+' queue'
+    PrintError(9, 'Captured Exception, '+str(LibErrorA)+'.', False)
   # Consolidate error flags to determine if any errors happened.
   if LibErrorB == False:
     # Announce the end of the operation only if Debug is enabled by configuration.
@@ -154,7 +178,7 @@ def ImportLibraries(LastMessage):
   else:
     # Announce a fatal error if the required libraries are not installed.
     LastMessage = PrintError(4, 'Could not Import Required Libraries. \nPlease install the following libraries: '+MissingLibs+'.', True)
-  return LastMessage, GPIO, Time, KB
+  return LastMessage, GPIO, Time, KB, Threading, Queue
 #--------------------
 
 #--------------------
@@ -166,11 +190,11 @@ def InitializeSoftwareEnvironment(LastMessage, Debug):
   if Debug == True:
     LastMessage = PrintMessage(LastMessage, 'Initializing Software Operating Environment...')
   # Import required libraries.
-  LastMessage, GPIO, Time, KB = ImportLibraries(LastMessage)
+  LastMessage, GPIO, Time, KB, Threading, Queue = ImportLibraries(LastMessage)
   # Announce the end of the operation if Debug is enabled by configuration.
   if Debug == True:
     LastMessage = PrintMessage(LastMessage, 'Software Operating Environment Initialized Successfully.')
-  return LastMessage, LoopCounter, LoopTracker, GPIO, Time, KB
+  return LastMessage, LoopCounter, LoopTracker, GPIO, Time, KB, Threading, Queue
 #--------------------
 
 #--------------------
@@ -223,11 +247,11 @@ def Beep(SpeakerGPIO, BeepDuration, NumberOfBuzzes, Time):
     # Count this iteration of the loop.
     BuzzCount = BuzzCount + 1
     # Set the speaker GPIO pin to high.
-    GPIO.output(SpeakerGPIO, GPIO.HIGH)
+    OutputSpeakerState(SpeakerGPIO, GPIO.HIGH)
     # Pause for a moment.
     Time.sleep(BeDuration)
     # Set the speaker GPIO pin to low.
-    GPIO.output(SpeakerGPIO, GPIO.LOW)
+    OutputSpeakerState(SpeakerGPIO, GPIO.LOW)
     # Determine if the maximum number of buzzes has been met.
     if BuzzCount < NumberOfBuzzes:
       # If there is another iteration coming then pause for a moment.
@@ -247,20 +271,81 @@ def CalculateExecutionDuration(RequestedSpeed, DefaultSensitivity):
   return ExecutionDuration
 #--------------------
 
+#--------------------
+# Build the table of execution durations for every throttle position.
+# The table converts a throttle position between 0.0 & 1.0 into an execution duration in nanoseconds with a single lookup.
+# The table is only rebuilt when the sensitivity, the dwell duration or the modulation mode has changed since it was last built.
+# In SigmaDelta modulation mode the execution duration is proportional to the throttle position & the sensitivity is not used.
+# Set DutyTable to the table to update. Set to an empty dictionary to build a new table.
+# Set ThrottleResolution to the number of throttle steps between stopped & full throttle.
+def UpdateDutyTable(DutyTable, CurrentSensitivity, DefaultDwellDuration, ThrottleResolution):
+  # Determine if the table was already built for the current settings.
+  if DutyTable.get('Sensitivity') != CurrentSensitivity or DutyTable.get('DwellDuration') != DefaultDwellDuration or DutyTable.get('Resolution') != ThrottleResolution or \
+    DutyTable.get('ModulationMode') != ModulationMode:
+    # Initialize the list of execution durations & convert the clock cycle to nanoseconds.
+    ExecutionTimes, CycleDuration, Resolution = [], int(DefaultDwellDuration * 1000000000), max(ThrottleResolution, 1)
+    # Calculate the execution duration for each throttle position.
+    for Step in range(Resolution + 1):
+      if ModulationMode == 'SigmaDelta':
+        # The average execution duration is proportional to the throttle position.
+        ExecutionTimes.append(CycleDuration * Step // Resolution)
+      else:
+        # Scale the throttle position to the speed levels used by CalculateExecutionDuration() & do not exceed the clock cycle.
+        ExecutionTimes.append(min(int(CalculateExecutionDuration(Step * 10 / Resolution, CurrentSensitivity) * 1000000000), CycleDuration))
+    # Full throttle always consumes the entire clock cycle.
+    ExecutionTimes[Resolution] = CycleDuration
+    # Replace the contents of the table & discard the execution durations of the speed levels from the previous table.
+    DutyTable.update({'Sensitivity': CurrentSensitivity, 'DwellDuration': DefaultDwellDuration, 'Resolution': Resolution, 'ModulationMode': ModulationMode, 'ExecutionTimes': ExecutionTimes, \
+      'SpeedTimes': {}})
+    # Look up the execution duration of every speed level in advance so the throttle positions staged by the keyboard are never converted into a table index.
+    SpeedTimes = {}
+    for Speed in range(10):
+      SpeedTimes[SpeedToThrottle(Speed)] = ThrottleToExecutionTime(DutyTable, SpeedToThrottle(Speed))
+    DutyTable['SpeedTimes'] = SpeedTimes
+  return DutyTable
+#--------------------
+
+#--------------------
+# Look up the execution duration for a throttle position, in nanoseconds.
+# Set Throttle to a number between 0.0 (stopped) & 1.0 (full throttle).
+def ThrottleToExecutionTime(DutyTable, Throttle):
+  # Return the execution duration of a speed level without calculating the table index.
+  ExecutionTime = DutyTable['SpeedTimes'].get(Throttle)
+  if ExecutionTime is not None:
+    return ExecutionTime
+  # Keep the throttle position within boundaries.
+  if Throttle <= 0:
+    return 0
+  if Throttle >= 1:
+    return DutyTable['ExecutionTimes'][-1]
+  # Look up the nearest throttle step.
+  return DutyTable['ExecutionTimes'][int(Throttle * DutyTable['Resolution'] + 0.5)]
+#--------------------
+
+#--------------------
+# Convert a speed level into a throttle position between 0.0 & 1.0.
+# Speed level 0 & anything higher than 9 is full throttle.
+def SpeedToThrottle(Speed):
+  # Determine if full throttle is requested.
+  if Speed == 0 or Speed > 9:
+    return 1.0
+  return Speed / 10
+#--------------------
+
 #--------------------
 # Update the speed setting for the motors.
-def UpdateSpeed(RequestedSpeed, ExecutionDuration, DefaultDwellDuration, DefaultSensitivity):
+# The execution duration is looked up from the duty table.
+# The current speed & execution duration of the controller state are updated in place.
+def UpdateSpeed(Controller, RequestedSpeed):
   # Set the upper boundary for the RequestedSpeed variable to 9.
   # Anything higher than 9 will be considered a request for full throttle.
   if RequestedSpeed > 9:
     RequestedSpeed = 0
+  # Look up what the execution time should be for the requested speed.
   # If full throttle has been requested the ExecutionDuration will consume the entire clock cycle.
-  if RequestedSpeed == 0:
-    ExecutionDuration = DefaultDwellDuration
-  # Calculate what the execution time should be when partial throttle is requested.
-  if RequestedSpeed > 0 and RequestedSpeed <= 9:
-    ExecutionDuration = CalculateExecutionDuration(RequestedSpeed, DefaultSensitivity)
-  return ExecutionDuration, RequestedSpeed
+  if RequestedSpeed >= 0 and RequestedSpeed <= 9:
+    Controller.ExecutionDuration = ThrottleToExecutionTime(DutyTable, SpeedToThrottle(RequestedSpeed)) / 1000000000
+  Controller.CurrentSpeed = RequestedSpeed
 #--------------------
 
 #--------------------
@@ -272,11 +357,14 @@ def InitializeHardwareEnvironment(LastMessage, GPIO, GPIOWarnings, SpeakerGPIO,
   # Announce the start of the operation if Debug is enabled by configuration.
   if Debug == True:
     LastMessage = PrintMessage(LastMessage, 'Initializing Hardware  Operating Environment...')
-  # Initialize the GPIO environment.
-  GPIO = InitializeGPIO(LastMessage, GPIO, GPIOMode, GPIOWarnings, SpeakerGPIO, MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, \
-    MotorRelayTwoNegativeGPIO)
+  # Initialize the GPIO environment. The GPIOChip backend configures its own GPIO lines.
+  if GPIOBackend not in ('GPIOChip', 'Mock'):
+    GPIO = InitializeGPIO(LastMessage, GPIO, GPIOMode, GPIOWarnings, SpeakerGPIO, MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, \
+      MotorRelayTwoNegativeGPIO)
   # Calculate the default speed before a specific speed has been requested by the user. 
-  ExecutionDuration, CurrentSpeed = UpdateSpeed(DefaultSpeed, DefaultExecutionDuration, DefaultDwellDuration, DefaultSensitivity)
+  ExecutionDuration, CurrentSpeed = DefaultExecutionDuration, DefaultSpeed
+  if DefaultSpeed >= 0 and DefaultSpeed <= 9:
+    ExecutionDuration = ThrottleToExecutionTime(DutyTable, SpeedToThrottle(DefaultSpeed)) / 1000000000
   OriginalSpeed = CurrentSpeed
   # Set the clock speed for the session based on configuration.
   DwellDuration = DefaultDwellDuration
@@ -290,172 +378,656 @@ def InitializeHardwareEnvironment(LastMessage, GPIO, GPIOWarnings, SpeakerGPIO,
 # Initialize the entire operational environment for the application & attached hardware.
 def InitializeEnvironment(SpeakerGPIO, MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO, DefaultSpeed, \
   DefaultExecutionDuration, DefaultDwellDuration, DefaultSensitivity, Debug):
-  LastMessage, SensitivityCounter, SpeedCounter, Boosted = 'Init', 0, 0, False
+  LastMessage, SensitivityReadyTime, SpeedReadyTime, Boosted = 'Init', 0, 0, False
   # Announce the start of the operation if Debug is enabled by configuration.
   if Debug == True:
     LastMessage = PrintMessage(LastMessage, 'Initializing Operating Environment...')  
   # Initialize the BreakLoop variable to False. This will allow the main loop to start which controls timing of the ESC.
   BreakLoop = False
   # Initialize the software environment.
-  LastMessage, LoopCounter, LoopTracker, GPIO, Time, KB = InitializeSoftwareEnvironment(LastMessage, Debug)
+  LastMessage, LoopCounter, LoopTracker, GPIO, Time, KB, Threading, Queue = InitializeSoftwareEnvironment(LastMessage, Debug)
   # Initialize the hardware environment.
   LastMessage, ExecutionDuration, CurrentSpeed, OriginalSpeed, DwellDuration, CurrentSensitivity = InitializeHardwareEnvironment(LastMessage, GPIO, GPIOWarnings, SpeakerGPIO, MotorRelayOnePositiveGPIO, \
     MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO, DefaultSpeed, DefaultExecutionDuration, DefaultDwellDuration, DefaultSensitivity, Debug)
   # Announce the end of the operation if Debug is enabled by configuration.
   if Debug == True:
     LastMessage = PrintMessage(LastMessage, 'Operating Environment Initialized Successfully.')
-  return LastMessage, SensitivityCounter, SpeedCounter, LoopCounter, LoopTracker, ExecutionDuration, CurrentSpeed, OriginalSpeed, CurrentSensitivity, DwellDuration, BreakLoop, Boosted, GPIO, Time, KB
+  return LastMessage, SensitivityReadyTime, SpeedReadyTime, LoopCounter, LoopTracker, ExecutionDuration, CurrentSpeed, OriginalSpeed, CurrentSensitivity, DwellDuration, BreakLoop, Boosted, GPIO, Time, KB, Threading, Queue
+#--------------------
+
+#--------------------
+# The state of the controller that is updated in place by the input functions every input cycle.
+# The attributes are declared as slots so they are stored at fixed offsets in the object instead of in a dictionary.
+# SensitivityReadyTime & SpeedReadyTime are the monotonic times in nanoseconds that the sensitivity & speed keys are accepted again after a change.
+class ControllerState:
+  __slots__ = ('ExecutionDuration', 'CurrentSpeed', 'OriginalSpeed', 'CurrentSensitivity', 'SensitivityReadyTime', 'SpeedReadyTime', 'Boosted')
+  def __init__(self, ExecutionDuration, CurrentSpeed, OriginalSpeed, CurrentSensitivity, SensitivityReadyTime, SpeedReadyTime, Boosted):
+    self.ExecutionDuration, self.CurrentSpeed, self.OriginalSpeed, self.CurrentSensitivity = ExecutionDuration, CurrentSpeed, OriginalSpeed, CurrentSensitivity
+    self.SensitivityReadyTime, self.SpeedReadyTime, self.Boosted = SensitivityReadyTime, SpeedReadyTime, Boosted
 #--------------------
 
 #--------------------
 # Remove boost from completed turn operations.
-def RemoveBoost(Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity):
+def RemoveBoost(Controller):
   # Detect leftover boost or reduction from completed turn commands.
-  if Boosted == True:
+  if Controller.Boosted == True:
     # Set the speed back to the original speed.
-    ExecutionDuration, CurrentSpeed = UpdateSpeed(OriginalSpeed, ExecutionDuration, DefaultDwellDuration, DefaultSensitivity)
+    UpdateSpeed(Controller, Controller.OriginalSpeed)
     # Reset speed related variables.
-    Boosted, OriginalSpeed = False, CurrentSpeed;
-  return Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed
+    Controller.Boosted, Controller.OriginalSpeed = False, Controller.CurrentSpeed
 #--------------------
 
 #--------------------
 # Calculate the final speed should be with all boost & reduction applied.
-def CalculateBoost(Boosted, CurrentSpeed, RightTotalBoost, LeftTotalBoost):
-  # Detect if boost is already applied & do not apply boost more than once.
-  if Boosted == False:
-    # Set the upper limit for boost to 0.
-    if CurrentSpeed == 0:
-      RightBoosted, LeftBoosted = 10, 10
-    else:
-      RightBoosted, LeftBoosted = CurrentSpeed, CurrentSpeed
-    # Set variables bounc by initial upper limit.
-    RightMoving, LeftMoving = RightBoosted + RightTotalBoost, LeftBoosted + LeftTotalBoost
-    # Set the lower limit for reduction.
-    if CurrentSpeed != 0 and RightMoving <= 0:
-      RightMoving = 1
-    if CurrentSpeed != 0 and LeftMoving <= 0:
-      LeftMoving = 1
-    # Reset the upperr limit for boost.
-    if RightMoving >= 10:
-      RightMoving = 0
-    if LeftMoving >= 10:
-      LeftMoving = 0
-  # If boost is already applied set the speed level for each channel to the currrent speed.
+# Boost is always calculated from the speed that was set before any boost was applied.
+# This allows each motor channel to keep its own boosted speed for as long as a turn is requested.
+def CalculateBoost(Controller, RightTotalBoost, LeftTotalBoost):
+  # Detect if boost is already applied & calculate boost from the original speed instead.
+  CurrentSpeed = Controller.CurrentSpeed
+  if Controller.Boosted == True:
+    CurrentSpeed = Controller.OriginalSpeed
+  # Set the upper limit for boost to 0.
+  if CurrentSpeed == 0:
+    RightBoosted, LeftBoosted = 10, 10
   else:
-    RightMoving, LeftMoving = CurrentSpeed, CurrentSpeed
+    RightBoosted, LeftBoosted = CurrentSpeed, CurrentSpeed
+  # Set variables bounc by initial upper limit.
+  RightMoving, LeftMoving = RightBoosted + RightTotalBoost, LeftBoosted + LeftTotalBoost
+  # Set the lower limit for reduction.
+  if CurrentSpeed != 0 and RightMoving <= 0:
+    RightMoving = 1
+  if CurrentSpeed != 0 and LeftMoving <= 0:
+    LeftMoving = 1
+  # Reset the upperr limit for boost.
+  if RightMoving >= 10:
+    RightMoving = 0
+  if LeftMoving >= 10:
+    LeftMoving = 0
   return RightMoving, LeftMoving
 #--------------------
 
 #--------------------
 # Apply any needed boost or reduction to a requested turn operation.
-def AddBoost(Moving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity):
+def AddBoost(Controller, Moving):
   # Detect if boost is currently applied.
-  if Moving != CurrentSpeed and Boosted == False:
+  if Moving != Controller.CurrentSpeed and Controller.Boosted == False:
     # Set variables to boosted values.
-    Boosted, OriginalSpeed = True, CurrentSpeed
+    Controller.Boosted, Controller.OriginalSpeed = True, Controller.CurrentSpeed
     # Update speed related variables to the new boosted values.
-    ExecutionDuration, CurrentSpeed = UpdateSpeed(Moving, ExecutionDuration, DefaultDwellDuration, DefaultSensitivity)
-  return Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed
+    UpdateSpeed(Controller, Moving)
 #--------------------
 
 #--------------------
-# Motor One Stop Command.
-# Command motor channel one to stop.
-def MotorOneStop(MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO):
-  # Deactivate the motor one positive GPIO pin.
-  GPIO.output(MotorRelayOnePositiveGPIO, GPIO.LOW)
-  # Deactivate the motor one negative GPIO pin.
-  GPIO.output(MotorRelayOneNegativeGPIO, GPIO.LOW)
+# Stage a value for a motor GPIO pin.
+# Motor commands are staged in the pending motor state & published to the PWM thread once per cycle.
+# The PWM thread is the only code that writes to the motor GPIO pins.
+def WriteMotorPin(Pin, Value):
+  # Stage the requested value for the specified GPIO pin.
+  PendingMotorState[Pin] = Value
 #--------------------
 
 #--------------------
-# Motor Two Stop Command.
-# Command motor channel two to stop.
-def MotorTwoStop(MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO):
-  # Deactivate the motor two positive GPIO pin.
-  GPIO.output(MotorRelayTwoPositiveGPIO, GPIO.LOW)
-  # Deactivate the motor two negative GPIO pin.
-  GPIO.output(MotorRelayTwoNegativeGPIO, GPIO.LOW)
+# Stage the throttle position for each motor channel from a detected motion request.
+# Motor channel one is the right channel & motor channel two is the left channel.
+# Set RightMoving & LeftMoving to the speed levels returned by a request. Values other than speed levels are ignored.
+def WriteChannelSpeeds(RightMoving, LeftMoving):
+  # Stage the throttle position for the right channel.
+  if type(RightMoving) == int:
+    PendingChannelThrottles[0] = SpeedToThrottle(RightMoving)
+  # Stage the throttle position for the left channel.
+  if type(LeftMoving) == int:
+    PendingChannelThrottles[1] = SpeedToThrottle(LeftMoving)
 #--------------------
 
 #--------------------
-# Motor One Forward Command.
-# Command motor channel one to rotate forward.
-def MotorOneForward(MotorRelayOnePositiveGPIO):
-  # Activate motor one positive GPIO pin.
-  GPIO.output(MotorRelayOnePositiveGPIO, GPIO.HIGH)
+# Stage the throttle position for a single motor channel.
+# Set Channel to 0 for the right channel or 1 for the left channel.
+# Set Throttle to a throttle position from 0 to 1. The throttle position is applied when the motor state is written.
+def WriteChannelThrottle(Channel, Throttle):
+  PendingChannelThrottles[Channel] = Throttle
 #--------------------
 
 #--------------------
-# Motor Two Forward Command.
-# Command motor channel two to rotate forward.
-def MotorTwoForward(MotorRelayTwoPositiveGPIO):
-  # Activate motor two positive GPIO pin.
-  GPIO.output(MotorRelayTwoPositiveGPIO, GPIO.HIGH)
+# Stage the direction & throttle position of each channel with a throttle position other than zero. Positive throttle positions rotate the channel forward.
+# Set ChannelThrottles to a signed throttle position from -1 to 1 for each channel. Channels with a throttle position of zero are left unchanged.
+# Set ThrottleScale to the fraction of each throttle position that is staged, such as the current speed.
+def WriteSignedThrottles(MotorChannels, ChannelThrottles, ThrottleScale):
+  for Channel in range(len(MotorChannels)):
+    ChannelThrottle = ChannelThrottles[Channel]
+    if ChannelThrottle != 0:
+      WriteMotorPin(MotorChannels[Channel][0], GPIO.HIGH if ChannelThrottle > 0 else GPIO.LOW)
+      WriteMotorPin(MotorChannels[Channel][1], GPIO.LOW if ChannelThrottle > 0 else GPIO.HIGH)
+      WriteChannelThrottle(Channel, abs(ChannelThrottle) * ThrottleScale)
 #--------------------
 
 #--------------------
-# Motor One Reverse Command.
-# Command motor channel one to rotate backward.
-def MotorOneReverse(MotorRelayOneNegativeGPIO):
-  # Activate motor one negative GPIO pin.
-  GPIO.output(MotorRelayOneNegativeGPIO, GPIO.HIGH)
+# Convert a motor state into a pair of bitmasks.
+# Set MotorState to an iterable of (Pin, Value) pairs.
+# Returns a tuple of (SetMask, ClearMask) where each bit represents the GPIO pin with the same number.
+def MotorStateToMask(MotorState):
+  # Initialize both bitmasks to no pins.
+  SetMask, ClearMask = 0, 0
+  # Add each pin to the bitmask that matches its value.
+  for Pin, Value in MotorState:
+    if Value == GPIO.HIGH:
+      SetMask = SetMask | (1 << Pin)
+    else:
+      ClearMask = ClearMask | (1 << Pin)
+  return SetMask, ClearMask
 #--------------------
 
 #--------------------
-# Motor Two Reverse Command.
-# Command motor channel two to rotate backward.
-def MotorTwoReverse(MotorRelayTwoNegativeGPIO):
-  # Activate motor two negative GPIO pin.
-  GPIO.output(MotorRelayTwoNegativeGPIO, GPIO.HIGH)
+# Write a motor state to the motor GPIO pins using the RPi library.
+# The pins & values for each motor state are collected once & written with a single call to the RPi library.
+def WriteGPIOPins(OutputBackend, SetMask, ClearMask):
+  # Look up the pins & values for this motor state.
+  Batch = OutputBackend['Batches'].get((SetMask, ClearMask))
+  if Batch is None:
+    # Collect the pins & values for a motor state that has not been written before.
+    Pins = [Pin for Pin in OutputBackend['Pins'] if (SetMask | ClearMask) & (1 << Pin)]
+    Batch = OutputBackend['Batches'][(SetMask, ClearMask)] = (Pins, tuple(GPIO.HIGH if SetMask & (1 << Pin) else GPIO.LOW for Pin in Pins))
+  # Write every pin of the motor state at once.
+  if Batch[0]:
+    GPIO.output(Batch[0], Batch[1])
 #--------------------
 
 #--------------------
-# All Motors Stop Command.
-# Command all motor channels to stop.
-def AllMotorsStop(MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO):
-  # Deactivate motor.
-  MotorOneStop(MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO)
-  # Deactivate motor.
-  MotorTwoStop(MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO)
+# Write a motor state to the motor GPIO pins using the memory mapped GPIO registers.
+# Every pin that is cleared is written with a single write to the clear register & every pin that is set is written with a single write to the set register.
+# Pins are cleared first so both relay pins of a channel are never active at the same time.
+def WriteGPIORegisters(OutputBackend, SetMask, ClearMask):
+  # Look up the memory mapped registers.
+  Registers = OutputBackend['Registers']
+  # Deactivate the pins that are cleared.
+  if ClearMask:
+    Registers[OutputBackend['ClearRegister']] = ClearMask
+  # Activate the pins that are set.
+  if SetMask:
+    Registers[OutputBackend['SetRegister']] = SetMask
+  # A file that stands in for the GPIO registers does not update the level register by itself.
+  if OutputBackend['StandIn'] == True:
+    Registers[OutputBackend['LevelRegister']] = (Registers[OutputBackend['LevelRegister']] | SetMask) & ~ClearMask & 0xFFFFFFFF
 #--------------------
 
 #--------------------
-# All Motors Forward Command.
-# Command all motor channels to rotate forward.
-def AllMotorsForward(MotorRelayOnePositiveGPIO, MotorRelayTwoPositiveGPIO):
-  # Activate Motor.
-  MotorOneForward(MotorRelayOnePositiveGPIO)
-  # Activate Motor.
-  MotorTwoForward(MotorRelayTwoPositiveGPIO)
+# Write a motor state to the GPIO lines using the Linux GPIO character device.
+# Every line requested by the backend is written with a single call to the kernel.
+def WriteGPIOChipLines(OutputBackend, SetMask, ClearMask):
+  # Only one thread can update the line values at a time because every line is written at once.
+  with OutputBackend['Lock']:
+    # Calculate the new value of every line.
+    Level = (OutputBackend['ChipLevel'] | SetMask) & ~ClearMask
+    OutputBackend['ChipLevel'] = Level
+    # Look up the line values for this level.
+    Values = OutputBackend['Batches'].get(Level)
+    if Values is None:
+      # Collect the line values for a level that has not been written before.
+      Values = bytearray(64)
+      for Line, Pin in enumerate(OutputBackend['Pins']):
+        Values[Line] = (Level >> Pin) & 1
+      Values = OutputBackend['Batches'][Level] = bytes(Values)
+    # Write every line at once.
+    if OutputBackend['StandIn'] == True:
+      OutputBackend['OS'].pwrite(OutputBackend['Handle'], Values, 0)
+    else:
+      OutputBackend['IOCtl'](OutputBackend['Handle'], OutputBackend['SetLineValues'], Values)
+#--------------------
+
+#--------------------
+# Record a motor state without writing to any GPIO pins.
+# The level of every pin is kept in the backend so the motor states can be inspected when testing without hardware.
+def WriteMockPins(OutputBackend, SetMask, ClearMask):
+  OutputBackend['MockLevel'] = (OutputBackend['MockLevel'] | SetMask) & ~ClearMask
+#--------------------
+
+#--------------------
+# Request the GPIO lines from the Linux GPIO character device as a single handle.
+# Set GPIOChipDevice to the GPIO character device. A regular file can stand in for the device when testing without hardware.
+# A fatal error is raised if the GPIO lines cannot be requested.
+def InitializeGPIOChip(LastMessage, GPIOChipDevice, OutputPins, Threading, ShadowRegister):
+  try:
+    import os as OS, fcntl as FCntl, struct as Struct
+    # A stand-in file records the line values at the start of the file instead of handling ioctl requests.
+    StandIn = not GPIOChipDevice.startswith('/dev/')
+    if StandIn == True:
+      Handle = OS.open(GPIOChipDevice, OS.O_RDWR | OS.O_CREAT)
+    else:
+      # Build a gpiohandle_request that requests every line as an output that starts low.
+      Request = bytearray(364)
+      Struct.pack_into('64I', Request, 0, *(tuple(OutputPins) + (0,) * (64 - len(OutputPins))))
+      Struct.pack_into('I', Request, 256, 1 << 1)
+      Request[324:356] = b'Robot_Motion'.ljust(32, b'\0')
+      Struct.pack_into('I', Request, 356, len(OutputPins))
+      # Submit the request with GPIO_GET_LINEHANDLE_IOCTL & collect the handle that the kernel returns.
+      ChipDescriptor = OS.open(GPIOChipDevice, OS.O_RDWR)
+      try:
+        FCntl.ioctl(ChipDescriptor, 0xC16CB403, Request)
+      finally:
+        OS.close(ChipDescriptor)
+      Handle = Struct.unpack_from('i', Request, 360)[0]
+    # GPIOHANDLE_SET_LINE_VALUES_IOCTL writes the values of every line in the handle.
+    OutputBackend = {'Name': 'GPIOChip', 'Write': WriteGPIOChipLines, 'Pins': tuple(OutputPins), 'Batches': {}, 'Handle': Handle, 'StandIn': StandIn, 'OS': OS, \
+      'IOCtl': FCntl.ioctl, 'SetLineValues': 0xC040B409, 'ChipLevel': 0, 'Lock': Threading.Lock(), **ShadowRegister}
+  # Handle the exception that is raised if the GPIO lines cannot be requested.
+  except (OSError, ValueError) as ChipError:
+    LastMessage, OutputBackend = PrintError(11, 'Could not Initialize GPIOChip Backend. \nCaptured Exception, '+str(ChipError)+'.', True), None
+  return LastMessage, OutputBackend
+#--------------------
+
+#--------------------
+# Initialize the backend used to write motor states to the motor GPIO pins.
+# Set GPIOBackend to RPi to write pins using the RPi library, Register to write pins using the memory mapped GPIO registers, GPIOChip to write pins using the Linux GPIO character device
+# or Mock to record pins in memory without any GPIO hardware.
+# Set GPIORegisterDevice to the device that maps the GPIO registers. A regular file can stand in for the device when testing without hardware.
+# Set OutputPins to the speaker & motor GPIO pins.
+# The RPi backend is used if the Register backend cannot be initialized.
+def InitializeOutputBackend(LastMessage, GPIOBackend, GPIORegisterDevice, GPIOChipDevice, OutputPins, GPIO, GPIOMode, Threading, Debug):
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Initializing GPIO Output Backend...')
+  # Initialize the RPi backend which is used unless the Register backend is requested & available.
+  OutputBackend = {'Name': 'RPi', 'Write': WriteGPIOPins, 'Pins': tuple(OutputPins), 'Batches': {}}
+  # Initialize the shadow register to no known pin values & the write counters to zero.
+  ShadowRegister = {'ShadowLevel': 0, 'ShadowKnown': 0, 'PinWrites': 0, 'BackendWrites': 0, 'SuppressedWrites': 0}
+  OutputBackend.update(ShadowRegister)
+  if GPIOBackend == 'Register':
+    # The GPIO registers are numbered by BCM pin number & the first register bank holds pins 0 through 31.
+    if GPIOMode != 'BCM' or max(OutputPins) > 31:
+      LastMessage = PrintError(10, 'Could not Initialize GPIO Register Backend. \nThe Register backend requires BCM pin numbering & GPIO pins below 32.', False)
+    else:
+      try:
+        import os as OS, mmap as MMap
+        # Create the stand-in file if a regular file was specified that does not exist yet.
+        StandIn = not GPIORegisterDevice.startswith('/dev/')
+        if StandIn == True and (not OS.path.exists(GPIORegisterDevice) or OS.path.getsize(GPIORegisterDevice) < MMap.PAGESIZE):
+          with open(GPIORegisterDevice, 'ab') as StandInFile:
+            StandInFile.truncate(MMap.PAGESIZE)
+        # Map the GPIO register block into memory.
+        Descriptor = OS.open(GPIORegisterDevice, OS.O_RDWR | OS.O_SYNC)
+        try:
+          Memory = MMap.mmap(Descriptor, MMap.PAGESIZE, MMap.MAP_SHARED, MMap.PROT_READ | MMap.PROT_WRITE)
+        finally:
+          OS.close(Descriptor)
+        # The set, clear & level registers for pins 0 through 31 are at byte offsets 0x1C, 0x28 & 0x34.
+        OutputBackend = {'Name': 'Register', 'Write': WriteGPIORegisters, 'Pins': tuple(OutputPins), 'Memory': Memory, 'Registers': memoryview(Memory).cast('I'), \
+          'SetRegister': 0x1C // 4, 'ClearRegister': 0x28 // 4, 'LevelRegister': 0x34 // 4, 'StandIn': StandIn, **ShadowRegister}
+      # Handle the exception that is raised if the GPIO register device cannot be mapped.
+      except (OSError, ValueError) as RegisterError:
+        LastMessage = PrintError(10, 'Could not Initialize GPIO Register Backend. \nCaptured Exception, '+str(RegisterError)+'.', False)
+  if GPIOBackend == 'GPIOChip':
+    # The line offsets of the GPIO character device match BCM pin numbers.
+    if GPIOMode != 'BCM':
+      LastMessage = PrintError(11, 'Could not Initialize GPIOChip Backend. \nThe GPIOChip backend requires BCM pin numbering.', True)
+    LastMessage, OutputBackend = InitializeGPIOChip(LastMessage, GPIOChipDevice, OutputPins, Threading, ShadowRegister)
+  if GPIOBackend == 'Mock':
+    OutputBackend = {'Name': 'Mock', 'Write': WriteMockPins, 'Pins': tuple(OutputPins), 'MockLevel': 0, **ShadowRegister}
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'GPIO Output Backend '+OutputBackend['Name']+' Initialized Successfully.')
+  return LastMessage, OutputBackend
+#--------------------
+
+#--------------------
+# Release the resources held by the GPIO output backend.
+def CloseOutputBackend(OutputBackend):
+  # Unmap the GPIO registers if the Register backend is in use.
+  if OutputBackend['Name'] == 'Register':
+    OutputBackend['Registers'].release()
+    OutputBackend['Memory'].close()
+  # Release the GPIO lines if the GPIOChip backend is in use.
+  if OutputBackend['Name'] == 'GPIOChip':
+    OutputBackend['OS'].close(OutputBackend['Handle'])
+  return OutputBackend
+#--------------------
+
+#--------------------
+# Write a complete motor state to the motor GPIO pins.
+# Set MotorState to a tuple of (SetMask, ClearMask) as returned by MotorStateToMask().
+# The last value written to each pin is kept in a shadow register so pins that already hold the requested value are not written again.
+# Only the PWM thread should call this function while it is running.
+def OutputMotorState(MotorState):
+  SetMask, ClearMask = MotorState
+  # Remove pins that already hold the requested value when the shadow register is enabled by configuration.
+  if EnableShadowRegister == True:
+    SetMask, ClearMask = SetMask & ~(OutputBackend['ShadowLevel'] & OutputBackend['ShadowKnown']), ClearMask & ~(~OutputBackend['ShadowLevel'] & OutputBackend['ShadowKnown'])
+    # Count the pin writes that were suppressed.
+    if SetMask | ClearMask != MotorState[0] | MotorState[1]:
+      OutputBackend['SuppressedWrites'] = OutputBackend['SuppressedWrites'] + bin((MotorState[0] | MotorState[1]) & ~(SetMask | ClearMask)).count('1')
+    # Skip the backend entirely if every pin already holds the requested value.
+    if SetMask | ClearMask == 0:
+      return OutputBackend
+  # Write the motor state with the backend selected by configuration.
+  OutputBackend['Write'](OutputBackend, SetMask, ClearMask)
+  # Record the value written to each pin in the shadow register.
+  OutputBackend['ShadowLevel'], OutputBackend['ShadowKnown'] = (OutputBackend['ShadowLevel'] | SetMask) & ~ClearMask, OutputBackend['ShadowKnown'] | SetMask | ClearMask
+  # Count the pin writes & backend writes that were performed.
+  OutputBackend['PinWrites'], OutputBackend['BackendWrites'] = OutputBackend['PinWrites'] + bin(SetMask | ClearMask).count('1'), OutputBackend['BackendWrites'] + 1
+  return OutputBackend
+#--------------------
+
+#--------------------
+# Write a value to the speaker GPIO pin.
+# The speaker is written by the GPIO output backend so it can share a single handle with the motor pins.
+def OutputSpeakerState(SpeakerGPIO, Value):
+  # Write the speaker pin without changing the shadow register of the motor pins.
+  SetMask, ClearMask = MotorStateToMask(((SpeakerGPIO, Value),))
+  OutputBackend['Write'](OutputBackend, SetMask, ClearMask)
+#--------------------
+
+#--------------------
+# Print the number of GPIO writes performed & suppressed by the GPIO output backend.
+def PrintOutputStatistics(OutputBackend):
+  # Calculate the percentage of pin writes that were suppressed by the shadow register.
+  RequestedWrites = OutputBackend['PinWrites'] + OutputBackend['SuppressedWrites']
+  SuppressedPercent = round(OutputBackend['SuppressedWrites'] * 100 / max(RequestedWrites, 1), 1)
+  ReportText = 'GPIO Output Statistics For The '+OutputBackend['Name']+' Backend. \nPin Writes: '+str(OutputBackend['PinWrites'])+' In '+str(OutputBackend['BackendWrites'])+\
+    ' Backend Writes. \nSuppressed Pin Writes: '+str(OutputBackend['SuppressedWrites'])+' ('+str(SuppressedPercent)+'%).'
+  PrintText(ReportText)
+  return ReportText
+#--------------------
+
+#--------------------
+# Initialize the bitmap of pressed keys.
+# Each key in InputKeys is assigned one bit. Keys with the same name share a bit.
+# When EnableKeyboardEvents is set to True the bitmap is maintained by key down & key up events from the keyboard library.
+# If keyboard events are disabled or cannot be hooked the bitmap is built by polling each key once per input cycle instead.
+# When KeyboardInputBackend is set to Evdev the bitmap is maintained by InitializeEvdevInput() instead of the keyboard library.
+# When KeyboardInputBackend is set to Terminal the bitmap is built from the keys typed on the terminal by ReadTerminalKeys().
+# Returns the bit assigned to each key name & the key state used by ReadKeyState().
+def InitializeKeyState(LastMessage, InputKeys, EnableKeyboardEvents, KeyboardInputBackend, KeyboardInputDevice, TerminalReleaseTimeout, KB, Threading, Time, Debug):
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Initializing Keyboard State...')
+  # Assign a bit to each key name.
+  KeyMasks = {}
+  for Key in InputKeys:
+    if Key not in KeyMasks:
+      KeyMasks[Key] = 1 << len(KeyMasks)
+  KeyState = {'Backend': KeyboardInputBackend, 'Pressed': 0, 'ScanCodes': {}, 'Hooked': False}
+  # Read key events directly from the input event device.
+  if KeyboardInputBackend == 'Evdev':
+    LastMessage = InitializeEvdevInput(LastMessage, KeyboardInputDevice, KeyMasks, KeyState, Threading)
+  # Read keys typed on the terminal.
+  elif KeyboardInputBackend == 'Terminal':
+    LastMessage = InitializeTerminalInput(LastMessage, KeyMasks, KeyState, TerminalReleaseTimeout, Time)
+  elif EnableKeyboardEvents == True:
+    try:
+      # Map the scan codes of each key to the bit of that key.
+      for Key, Mask in KeyMasks.items():
+        for ScanCode in KB.key_to_scan_codes(Key):
+          KeyState['ScanCodes'][ScanCode] = KeyState['ScanCodes'].get(ScanCode, 0) | Mask
+      # Subscribe to key down & key up events.
+      KB.hook(HandleKeyEvent)
+      KeyState['Hooked'] = True
+    # Handle the exception that is raised if the keyboard events cannot be hooked.
+    except (ImportError, OSError, ValueError) as KeyboardError:
+      LastMessage = PrintError(12, 'Could not Hook Keyboard Events. \nCaptured Exception, '+str(KeyboardError)+'.', False)
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Keyboard State Initialized Successfully. \nKeyboard Input Backend is '+str(KeyboardInputBackend)+'. \nKeyboard Events are '+\
+      ('Enabled' if KeyState['Hooked'] == True else 'Disabled')+'.')
+  return LastMessage, KeyMasks, KeyState
+#--------------------
+
+#--------------------
+# Update the bitmap of pressed keys from a keyboard event.
+# Called by the keyboard library from its own thread for every key down & key up event.
+def HandleKeyEvent(Event):
+  # Look up the bit of the key. Keys that are not used are ignored.
+  Mask = KeyState['ScanCodes'].get(Event.scan_code, 0)
+  if Mask != 0:
+    if Event.event_type == 'down':
+      KeyState['Pressed'] = KeyState['Pressed'] | Mask
+    else:
+      KeyState['Pressed'] = KeyState['Pressed'] & ~Mask
 #--------------------
 
 #--------------------
-# All Motors Reverse Command.
-# Command all motor channels to rotate backward.
-def AllMotorsReverse(MotorRelayOneNegativeGPIO, MotorRelayTwoNegativeGPIO):
-  # Activate Motor.
-  MotorOneReverse(MotorRelayOneNegativeGPIO)
-  # Activate Motor.
-  MotorTwoReverse(MotorRelayTwoNegativeGPIO)
+# Read the bitmap of pressed keys in one shot.
+# If keyboard events are not hooked every key is polled once.
+def ReadKeyState(KeyState, KeyMasks, KB):
+  # Return the bitmap built from the keys typed on the terminal.
+  if KeyState['Backend'] == 'Terminal':
+    return ReadTerminalKeys(KeyState)
+  # Return the bitmap maintained by the keyboard events.
+  if KeyState['Hooked'] == True:
+    return KeyState['Pressed']
+  # Build the bitmap by polling each key.
+  PressedKeys = 0
+  for Key, Mask in KeyMasks.items():
+    if KB.is_pressed(Key):
+      PressedKeys = PressedKeys | Mask
+  return PressedKeys
+#--------------------
+
+#--------------------
+# Read key events from a Linux input event device in a background thread running an asyncio event loop.
+# Access to the device only requires membership of the input group so the keyboard library & root privileges are not required.
+# Set KeyboardInputDevice to the input event device. A pipe can stand in for the device. A regular file is replayed as a recording at the pace of its event timestamps.
+# A fatal error is raised if the device cannot be opened or if a key has no key code.
+def InitializeEvdevInput(LastMessage, KeyboardInputDevice, KeyMasks, KeyState, Threading):
+  # Linux key codes of the key names that can be used by configuration.
+  EvdevKeyCodes = {'esc': 1, '1': 2, '2': 3, '3': 4, '4': 5, '5': 6, '6': 7, '7': 8, '8': 9, '9': 10, '0': 11, '-': 12, 'minus': 12, '=': 13, 'equal': 13, 'backspace': 14, \
+    'tab': 15, 'q': 16, 'w': 17, 'e': 18, 'r': 19, 't': 20, 'y': 21, 'u': 22, 'i': 23, 'o': 24, 'p': 25, '[': 26, ']': 27, 'enter': 28, 'ctrl': 29, 'a': 30, 's': 31, 'd': 32, \
+    'f': 33, 'g': 34, 'h': 35, 'j': 36, 'k': 37, 'l': 38, ';': 39, "'": 40, '`': 41, 'shift': 42, '\\': 43, 'z': 44, 'x': 45, 'c': 46, 'v': 47, 'b': 48, 'n': 49, 'm': 50, \
+    ',': 51, 'comma': 51, '.': 52, 'period': 52, '/': 53, 'slash': 53, 'alt': 56, 'space': 57, 'up': 103, 'left': 105, 'right': 106, 'down': 108}
+  try:
+    # Map the key code of each key to the bit of that key.
+    for Key, Mask in KeyMasks.items():
+      if Key.lower() not in EvdevKeyCodes:
+        raise ValueError('No key code for the '+str(Key)+' key')
+      KeyState['ScanCodes'][EvdevKeyCodes[Key.lower()]] = KeyState['ScanCodes'].get(EvdevKeyCodes[Key.lower()], 0) | Mask
+    OpenEvdevDevice(KeyboardInputDevice, KeyState, 'Robot_Motion_Input', Threading)
+  # Handle the exception that is raised if the device cannot be opened.
+  except (ImportError, OSError, ValueError) as EvdevError:
+    LastMessage = PrintError(13, 'Could not Open Keyboard Input Device. \nCaptured Exception, '+str(EvdevError)+'.', True)
+  return LastMessage
+#--------------------
+
+#--------------------
+# Open a Linux input event device without blocking & start reading its events in a background thread.
+# Set InputDevice to the input event device, a pipe or a regular file. A regular file is replayed as a recording at the pace of its event timestamps.
+# Set InputState to the input state that receives the pressed keys or axis positions & set ThreadName to the name of the background thread.
+# The event loop & the reader task are stored in the input state so CloseKeyState can stop them. An OSError is raised if the device cannot be opened.
+def OpenEvdevDevice(InputDevice, InputState, ThreadName, Threading):
+  import os as OS, stat as Stat, struct as Struct, asyncio as AsyncIO
+  Descriptor = OS.open(InputDevice, OS.O_RDONLY | OS.O_NONBLOCK)
+  # Regular files cannot be watched by the event loop so they are replayed instead.
+  Replay = Stat.S_ISREG(OS.fstat(Descriptor).st_mode)
+  # Create the event loop & the reader task before the thread starts so they can be stopped from the main thread.
+  Loop = AsyncIO.new_event_loop()
+  InputState['Hooked'], InputState['Descriptor'], InputState['Replay'], InputState['Loop'], InputState['OS'] = True, Descriptor, Replay, Loop, OS
+  InputState['Task'] = Loop.create_task(ReadEvdevEvents(InputState, Descriptor, Replay, Struct.Struct('llHHi'), Loop, OS, AsyncIO))
+  InputState['Thread'] = Threading.Thread(target=EvdevThreadLoop, args=(InputState, Loop, AsyncIO), name=ThreadName, daemon=True)
+  InputState['Thread'].start()
+#--------------------
+
+#--------------------
+# Run the event loop of the input event device reader. This runs on the background input thread started by OpenEvdevDevice, never on the main loop thread.
+# The loop runs until the reader task completes because a read returned no data at the end of the device or recording, or until CloseKeyState cancels the task.
+# The event loop is closed when the thread ends, after which the thread exits on its own.
+# Set KeyState to the input state holding the reader task.
+def EvdevThreadLoop(KeyState, Loop, AsyncIO):
+  AsyncIO.set_event_loop(Loop)
+  try:
+    Loop.run_until_complete(KeyState['Task'])
+  except AsyncIO.CancelledError:
+    pass
+  finally:
+    Loop.close()
+#--------------------
+
+#--------------------
+# Read & decode input_event structs from the input event device & update the pressed keys & axis positions of the input state.
+# Set Replay to True to replay a regular file at the pace of its event timestamps instead of waiting for the device to become readable.
+# Every key is released & every axis is centered when reading stops.
+async def ReadEvdevEvents(KeyState, Descriptor, Replay, EventFormat, Loop, OS, AsyncIO):
+  Pending, Ready, FirstEvent, FirstTime, Axes = b'', AsyncIO.Event(), None, Loop.time(), KeyState.get('Axes', {})
+  # Wake the reader when the device has events to read.
+  if Replay == False:
+    Loop.add_reader(Descriptor, Ready.set)
+  try:
+    while True:
+      if Replay == False:
+        await Ready.wait()
+        Ready.clear()
+      try:
+        Data = OS.read(Descriptor, EventFormat.size * 64)
+      except BlockingIOError:
+        continue
+      # Stop reading when the device is removed or the recording ends.
+      if len(Data) == 0:
+        break
+      # Decode the complete input_event structs & keep any partial struct for the next read.
+      Pending = Pending + Data
+      Complete = len(Pending) - len(Pending) % EventFormat.size
+      for Seconds, Microseconds, Type, Code, Value in EventFormat.iter_unpack(Pending[:Complete]):
+        # Replay recorded events at the pace of their timestamps.
+        if Replay == True:
+          EventTime = Seconds + Microseconds / 1000000
+          if FirstEvent is None:
+            FirstEvent = EventTime
+          await AsyncIO.sleep(max(0, FirstTime + EventTime - FirstEvent - Loop.time()))
+        # Look up the bit of EV_KEY events. Keys that are not used are ignored. Auto repeat events keep the key pressed.
+        Mask = KeyState['ScanCodes'].get(Code, 0) if Type == 1 else 0
+        if Mask != 0:
+          if Value != 0:
+            KeyState['Pressed'] = KeyState['Pressed'] | Mask
+          else:
+            KeyState['Pressed'] = KeyState['Pressed'] & ~Mask
+        # Record the position of EV_ABS events for the axes that are used.
+        elif Type == 3 and Code in Axes:
+          Axes[Code] = Value
+      Pending = Pending[Complete:]
+  finally:
+    if Replay == False:
+      Loop.remove_reader(Descriptor)
+    # Release every key & center every axis so the motors stop when no more events can be read.
+    KeyState['Pressed'] = 0
+    for Code in Axes:
+      Axes[Code] = KeyState['AxisCenters'][Code]
+#--------------------
+
+#--------------------
+# Stop listening for keyboard events.
+def CloseKeyState(KeyState, KB):
+  if KeyState['Hooked'] == True:
+    # Cancel the input event device reader & close the device.
+    if KeyState['Backend'] == 'Evdev':
+      try:
+        KeyState['Loop'].call_soon_threadsafe(KeyState['Task'].cancel)
+      # The event loop is already closed when the device closed first.
+      except RuntimeError:
+        pass
+      KeyState['Thread'].join(1)
+      KeyState['OS'].close(KeyState['Descriptor'])
+    else:
+      KB.unhook(HandleKeyEvent)
+    KeyState['Hooked'] = False
+  # Restore the terminal settings.
+  if KeyState['Backend'] == 'Terminal':
+    KeyState['RestoreTerminal']()
+#--------------------
+
+#--------------------
+# Read keys typed on the terminal that runs Robot Motion, which also works over SSH where the keyboard library cannot see the keyboard.
+# The terminal is switched to a mode that delivers each key as soon as it is typed without echoing it. Reads never wait for input.
+# A terminal only reports when a key is typed so a key is considered held while the terminal keeps auto repeating it.
+# Set TerminalReleaseTimeout to the number of seconds after the last repeat at which a key is considered released.
+# A fatal error is raised if standard input is not a terminal or if a key cannot be typed on a terminal.
+def InitializeTerminalInput(LastMessage, KeyMasks, KeyState, TerminalReleaseTimeout, Time):
+  # Byte sequences sent by the terminal for the key names that are not a single character.
+  TerminalKeySequences = {'esc': b'\x1b', 'minus': b'-', 'equal': b'=', 'comma': b',', 'period': b'.', 'slash': b'/', 'space': b' ', 'enter': b'\r', 'tab': b'\t', \
+    'backspace': b'\x7f', 'up': b'\x1b[A', 'down': b'\x1b[B', 'right': b'\x1b[C', 'left': b'\x1b[D'}
+  import os as OS, sys as Sys, termios as Termios, atexit as AtExit
+  try:
+    # Map the byte sequence of each key to the bit of that key.
+    for Key, Mask in KeyMasks.items():
+      Sequence = TerminalKeySequences.get(Key.lower(), Key.lower().encode())
+      if len(Sequence) != 1 and not Sequence.startswith(b'\x1b['):
+        raise ValueError('No terminal sequence for the '+str(Key)+' key')
+      KeyState['ScanCodes'][Sequence] = KeyState['ScanCodes'].get(Sequence, 0) | Mask
+    Descriptor = Sys.stdin.fileno()
+    Settings = Termios.tcgetattr(Descriptor)
+    # Restore the terminal settings when Robot Motion closes, including when it closes because of a fatal error.
+    KeyState['RestoreTerminal'] = lambda: Termios.tcsetattr(Descriptor, Termios.TCSADRAIN, Settings)
+    AtExit.register(KeyState['RestoreTerminal'])
+    # Disable line buffering & echo. Output processing & Ctrl+C are kept so messages & interrupts behave normally.
+    # A minimum of zero bytes with no timeout makes reads return immediately when no key was typed.
+    RawSettings = Termios.tcgetattr(Descriptor)
+    RawSettings[3] = RawSettings[3] & ~(Termios.ICANON | Termios.ECHO)
+    RawSettings[6][Termios.VMIN], RawSettings[6][Termios.VTIME] = 0, 0
+    Termios.tcsetattr(Descriptor, Termios.TCSADRAIN, RawSettings)
+    KeyState['Descriptor'], KeyState['OS'], KeyState['Clock'], KeyState['ReleaseTimeout'], KeyState['LastTyped'] = Descriptor, OS, Time.monotonic, TerminalReleaseTimeout, {}
+    # Wait up to 0.1 seconds for the rest of an escape sequence that was split across reads, which happens over SSH, before an escape byte is taken as the Esc key.
+    KeyState['Carry'], KeyState['CarryTime'], KeyState['EscapeTimeout'] = b'', 0.0, 0.1
+  # Handle the exception that is raised if standard input is not a terminal.
+  except (OSError, ValueError, Termios.error) as TerminalError:
+    LastMessage = PrintError(14, 'Could not Initialize Terminal Input. \nCaptured Exception, '+str(TerminalError)+'.', True)
+  return LastMessage
+#--------------------
+
+#--------------------
+# Read every byte typed on the terminal since the last input cycle & return the bitmap of the keys that are held.
+# This never blocks. The terminal was set to return immediately with the bytes already typed, so no byte is returned when no key was typed.
+# An escape byte followed by [ or O & one more byte is an arrow key & is mapped to the escape, [ & that byte, which matches both cursor key modes. An escape byte that does not start a sequence is the Esc key.
+# An escape sequence cut off at the end of a read is carried over to the next read. It is only decoded as the Esc key if the rest of it does not arrive within 0.1 seconds.
+# Other bytes are mapped as lower case characters so a key is matched with or without Shift.
+# Each key is held until TerminalReleaseTimeout passes without the key being typed again.
+def ReadTerminalKeys(KeyState):
+  Now, LastTyped, ScanCodes = KeyState['Clock'](), KeyState['LastTyped'], KeyState['ScanCodes']
+  Carried = KeyState['Carry']
+  Data = Carried + KeyState['OS'].read(KeyState['Descriptor'], 1024)
+  KeyState['Carry'], Index = b'', 0
+  while Index < len(Data):
+    # Carry an escape sequence that was cut off at the end of the read over to the next read. The escape timeout starts when the sequence is first carried.
+    if Data[Index:] in (b'\x1b', b'\x1b[', b'\x1bO'):
+      if Index != 0 or Carried == b'':
+        KeyState['CarryTime'] = Now
+      if Now - KeyState['CarryTime'] < KeyState['EscapeTimeout']:
+        KeyState['Carry'] = Data[Index:]
+        break
+    # Decode arrow keys from their escape sequence. An escape byte that does not start a sequence is the Esc key.
+    if Data[Index:Index + 2] in (b'\x1b[', b'\x1bO') and Index + 2 < len(Data):
+      Sequence, Index = b'\x1b[' + Data[Index + 2:Index + 3], Index + 3
+    else:
+      Sequence, Index = Data[Index:Index + 1].lower(), Index + 1
+    # Record when each key was last typed. Keys that are not used are ignored.
+    Mask = ScanCodes.get(Sequence, 0)
+    if Mask != 0:
+      LastTyped[Mask] = Now
+  # Consider each key held until the release timeout passes without a repeat.
+  Pressed = 0
+  for Mask, TypedTime in LastTyped.items():
+    if Now - TypedTime < KeyState['ReleaseTimeout']:
+      Pressed = Pressed | Mask
+  KeyState['Pressed'] = Pressed
+  return Pressed
+#--------------------
+
+#--------------------
+# Determine if a key is pressed in the bitmap read at the start of the current input cycle.
+def IsKeyPressed(Key):
+  return PressedKeys & KeyMasks.get(Key, 0) != 0
 #--------------------
 
 #--------------------
 # Keyboard Sensitivity Change Request.
 # Detect when a sensitivity update is required.
-def DetectKeyboardSensitivityChange(LastMessage, MinimumSensitivity, MaximumSensitivity, SensitivityCounter, DetectSensitivityInterval, DetectSensitivitySkipInterval, CurrentSensitivity, DefaultSensitivity, \
-  SensitivityChangeAmount, KB, IncreaseSensitivityKey, DecreaseSensitivityKey, ExecutionDuration, DwellDuration, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, Debug):
-  # Initialize variables for sanity checks, request flags, & movement flags.
-  Pressed, RequestReceived, CommandSent, CommandsIssued, OpText = False, False, False, 0, False
-  # Detect if a sensitivity check should be performed during the current cycle.
-  if SensitivityCounter == 0:
-    SensitivityCounter = DetectSensitivityInterval
+# A held key repeats the change once per SensitivityRepeatDelay seconds. Set Now to the current monotonic time in nanoseconds.
+def DetectKeyboardSensitivityChange(LastMessage, Controller, Now, MinimumSensitivity, MaximumSensitivity, SensitivityRepeatDelay, SensitivityChangeAmount, \
+  IncreaseSensitivityKey, DecreaseSensitivityKey, DwellDuration, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, Debug):
+  # Detect if the sensitivity keys are accepted yet.
+  if Now >= Controller.SensitivityReadyTime:
+    # Initialize variables for sanity checks, request flags, & movement flags.
+    Pressed, RequestReceived, CommandSent, CommandsIssued, OpText, CurrentSensitivity = False, False, False, 0, False, Controller.CurrentSensitivity
+    # Calculate the time that the sensitivity keys are accepted again if a change is performed.
+    SensitivityReadyTime, RepeatTime = Controller.SensitivityReadyTime, Now + int(SensitivityRepeatDelay * 1000000000)
     # Detect when the increase sensitivity key is pressed.
-    if KB.is_pressed(IncreaseSensitivityKey):
+    if IsKeyPressed(IncreaseSensitivityKey):
       # Reinitialize variables for request & movement flags if a request is detected.
-      # If the sensitivity counter is 0 then we reset it to the sensitivity interval set by configuration.
-      SensitivityCounter, Pressed, RequestReceived, CommandSent, CommandsIssued, OpText = DetectSensitivitySkipInterval, False, 'Increase Sensitivity', 'Update Sensitivity', 0, 'Increase Sensitivity to Level '
+      # Ignore the sensitivity keys for the repeat delay set by configuration.
+      SensitivityReadyTime, Pressed, RequestReceived, CommandSent, CommandsIssued, OpText = RepeatTime, False, 'Increase Sensitivity', 'Update Sensitivity', 0, 'Increase Sensitivity to Level '
       # Determine what the requested sensitivity is.
       RequestedSensitivity = CurrentSensitivity + SensitivityChangeAmount
       # Do not increase the sensitivity above the maximum set by configuration.
@@ -463,14 +1035,14 @@ def DetectKeyboardSensitivityChange(LastMessage, MinimumSensitivity, MaximumSens
         # Increment the current sensitivity by the sensitivity change amount set by configuration.
         CurrentSensitivity = RequestedSensitivity
         # Increment the command counter & specify the request type.
-        SensitivityCounter, Pressed, CommandsIssued, RequestReceived = DetectSensitivitySkipInterval, True, CommandsIssued + 1, OpText+str(CurrentSensitivity)
+        SensitivityReadyTime, Pressed, CommandsIssued, RequestReceived = RepeatTime, True, CommandsIssued + 1, OpText
       else:
-        SensitivityCounter, Pressed, RequestReceived, CommandSent, CommandsIssued, OpText = DetectSensitivitySkipInterval, False, 'Increase Sensitivity', 'Cannot Increase Sensitivity Any Higher', 0, 'Increase Sensitivity to Level '
+        SensitivityReadyTime, Pressed, RequestReceived, CommandSent, CommandsIssued, OpText = RepeatTime, False, 'Increase Sensitivity', 'Cannot Increase Sensitivity Any Higher', 0, 'Increase Sensitivity to Level '
     # Detect when the decrease sensitivity key is pressed.
-    if KB.is_pressed(DecreaseSensitivityKey) and Pressed == False:
+    if IsKeyPressed(DecreaseSensitivityKey) and Pressed == False:
       # Reinitialize variables for request & movement flags if a request is detected.
-      # If the sensitivity counter is 0 then we reset it to the sensitivity interval set by configuration.
-      SensitivityCounter, Pressed, RequestReceived, CommandSent, CommandsIssued, OpText = DetectSensitivitySkipInterval, False, 'Decrease Sensitivity', 'Update Sensitivity', 0, 'Decrease Sensitivity to Level '
+      # Ignore the sensitivity keys for the repeat delay set by configuration.
+      SensitivityReadyTime, Pressed, RequestReceived, CommandSent, CommandsIssued, OpText = RepeatTime, False, 'Decrease Sensitivity', 'Update Sensitivity', 0, 'Decrease Sensitivity to Level '
       # Determine what the requested sensitivity is.
       RequestedSensitivity = CurrentSensitivity - SensitivityChangeAmount
       # Do not decrease the sensitivity below zero or below the minimum set by configuration.
@@ -478,9 +1050,11 @@ def DetectKeyboardSensitivityChange(LastMessage, MinimumSensitivity, MaximumSens
         # Decrement the current sensitivity by the sensitivity change amount set by configuration.
         CurrentSensitivity = RequestedSensitivity
         # Increment the command counter & specify the request type.
-        SensitivityCounter, Pressed, CommandsIssued, RequestReceived = DetectSensitivitySkipInterval, True, CommandsIssued + 1, OpText+str(CurrentSensitivity)
+        SensitivityReadyTime, Pressed, CommandsIssued, RequestReceived = RepeatTime, True, CommandsIssued + 1, OpText
       else:
-        SensitivityCounter, Pressed, RequestReceived, CommandSent, CommandsIssued, OpText = DetectSensitivitySkipInterval, False, 'Increase Sensitivity', 'Cannot Decrease Sensitivity Any Lower', 0, 'Increase Sensitivity to Level '
+        SensitivityReadyTime, Pressed, RequestReceived, CommandSent, CommandsIssued, OpText = RepeatTime, False, 'Increase Sensitivity', 'Cannot Decrease Sensitivity Any Lower', 0, 'Increase Sensitivity to Level '
+    # Update the controller state.
+    Controller.CurrentSensitivity, Controller.SensitivityReadyTime = CurrentSensitivity, SensitivityReadyTime
     # Detect if a request was received.
     if Pressed == True:
       # Determine if the speaker is enabled by configuration.
@@ -489,498 +1063,729 @@ def DetectKeyboardSensitivityChange(LastMessage, MinimumSensitivity, MaximumSens
         Beep(SpeakerGPIO, BeepDuration, NumberOfBuzzes, Time)
       # Output when a speed change command is detected if Debug is set by configuration.
       if Debug == True:
+        # Add the requested sensitivity level to the request label only when it is printed.
+        if RequestReceived == OpText:
+          RequestReceived = OpText+str(CurrentSensitivity)
         LastMessage = PrintMessage(LastMessage, 'Request Received: '+str(RequestReceived)+'. \nNumber Of Commands Issued: '+str(CommandsIssued)+\
-          '. \nCommands Issued: '+str(CommandSent)+'. \nThe Execution Duration is '+str(ExecutionDuration)+\
+          '. \nCommands Issued: '+str(CommandSent)+'. \nThe Execution Duration is '+str(Controller.ExecutionDuration)+\
           '. \nThe Dwell Duration is '+str(DwellDuration)+'.')
-  # If no sensitivity check was performed, decrement the sensitivity counter by 1.
-  else:
-    SensitivityCounter = SensitivityCounter - 1
-  return CurrentSensitivity, SensitivityCounter
+  return LastMessage
 #--------------------
 
 #--------------------
 # Keyboard Speed Change Request.
 # Detect when a speed update is required.
-def DetectKeyboardSpeedChange(LastMessage, SpeedCounter, DetectSpeedInterval, DetectSpeedSkipInterval, ExecutionDuration, DwellDuration, Sensitivity, CurrentSpeed, KB, IncreaseSpeedKey, DecreaseSpeedKey, \
-  SpeedOneKey, SpeedTwoKey, SpeedThreeKey, SpeedFourKey, SpeedFiveKey, SpeedSixKey, SpeedSevenKey, SpeedEightKey, SpeedNineKey, SpeedTenKey, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, Debug):
-  # Initialize variables for sanity checks, request flags, & movement flags.
-  Pressed, RequestReceived, CommandSent, CommandsIssued, OpText = False, False, False,  0, 'Update Speed to Level '
-  # Detect if a speed check should be performed during the current cycle.
-  if SpeedCounter == 0:
-    SpeedCounter = DetectSpeedInterval
+# A held key repeats the change once per SpeedRepeatDelay seconds. Set Now to the current monotonic time in nanoseconds.
+def DetectKeyboardSpeedChange(LastMessage, Controller, Now, SpeedRepeatDelay, DwellDuration, IncreaseSpeedKey, DecreaseSpeedKey, SpeedOneKey, SpeedTwoKey, \
+  SpeedThreeKey, SpeedFourKey, SpeedFiveKey, SpeedSixKey, SpeedSevenKey, SpeedEightKey, SpeedNineKey, SpeedTenKey, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, Debug):
+  # Detect if the speed keys are accepted yet.
+  if Now >= Controller.SpeedReadyTime:
+    # Initialize variables for sanity checks, request flags, & movement flags.
+    Pressed, RequestReceived, CommandSent, CommandsIssued, OpText, CurrentSpeed = False, False, False,  0, 'Update Speed to Level ', Controller.CurrentSpeed
+    # Calculate the time that the speed keys are accepted again if a change is performed.
+    SpeedReadyTime, RepeatTime = Controller.SpeedReadyTime, Now + int(SpeedRepeatDelay * 1000000000)
     # Detect when the increase speed key is pressed.
-    if KB.is_pressed(IncreaseSpeedKey):
+    if IsKeyPressed(IncreaseSpeedKey):
       # Reinitialize variables for request & movement flags if a request is detected.
-      # If the speed counter is 0 then we reset it to the speed interval set by configuration.
-      SpeedCounter, Pressed, RequestReceived, CommandSent, CommandsIssued, OpText = DetectSpeedSkipInterval, False, 'Increase Speed', 'Update Speed', 0, 'Increase Speed to Level '
+      # Ignore the speed keys for the repeat delay set by configuration.
+      SpeedReadyTime, Pressed, RequestReceived, CommandSent, CommandsIssued, OpText = RepeatTime, False, 'Increase Speed', 'Update Speed', 0, 'Increase Speed to Level '
       # Define the maximum speed that is possible.
       if CurrentSpeed == 0:
-        Pressed, CommandSent, RequestReceived, RequestedSpeed, SpeedCounter = True, 'Cannot Increase Speed Any Higher', OpText+str(CurrentSpeed), CurrentSpeed, DetectSpeedSkipInterval
+        Pressed, CommandSent, RequestReceived, RequestedSpeed, SpeedReadyTime = True, 'Cannot Increase Speed Any Higher', OpText, CurrentSpeed, RepeatTime
       if CurrentSpeed == 9:
         CurrentSpeed = 0
-        Pressed, CommandsIssued, RequestReceived, RequestedSpeed, SpeedCounter = True, CommandsIssued + 1, OpText+str(CurrentSpeed), CurrentSpeed, DetectSpeedSkipInterval
+        Pressed, CommandsIssued, RequestReceived, RequestedSpeed, SpeedReadyTime = True, CommandsIssued + 1, OpText, CurrentSpeed, RepeatTime
       if CurrentSpeed != 0:
         # Increment the current speed by 1.
         CurrentSpeed = CurrentSpeed + 1
         # Increment the command counter & specify the request type.
-        Pressed, CommandsIssued, RequestReceived, RequestedSpeed, SpeedCounter = True, CommandsIssued + 1, OpText+str(CurrentSpeed), CurrentSpeed, DetectSpeedSkipInterval
+        Pressed, CommandsIssued, RequestReceived, RequestedSpeed, SpeedReadyTime = True, CommandsIssued + 1, OpText, CurrentSpeed, RepeatTime
     # Detect when the decrease speed key is pressed.
-    if KB.is_pressed(DecreaseSpeedKey):
+    if IsKeyPressed(DecreaseSpeedKey):
       # Reinitialize variables for request & movement flags if a request is detected.
-      # If the speed counter is 0 then we reset it to the speed interval set by configuration.
-      SpeedCounter, Pressed, RequestReceived, CommandSent, CommandsIssued, OpText = DetectSpeedSkipInterval, False, 'Decrease Speed', 'Update Speed', 0, 'Decrease Speed to Level '
+      # Ignore the speed keys for the repeat delay set by configuration.
+      SpeedReadyTime, Pressed, RequestReceived, CommandSent, CommandsIssued, OpText = RepeatTime, False, 'Decrease Speed', 'Update Speed', 0, 'Decrease Speed to Level '
       # Do not decrement the speed value if it is already set to the lowest speed possible.
       if CurrentSpeed == 0:
         CurrentSpeed = 10
       if CurrentSpeed == 1:
-        Pressed, CommandSent, RequestReceived, RequestedSpeed, SpeedCounter = True, 'Cannot Decrease Speed Any Lower', OpText+str(CurrentSpeed), CurrentSpeed, DetectSpeedSkipInterval
+        Pressed, CommandSent, RequestReceived, RequestedSpeed, SpeedReadyTime = True, 'Cannot Decrease Speed Any Lower', OpText, CurrentSpeed, RepeatTime
       else:
         # Decrement the current speed by 1.
         CurrentSpeed = CurrentSpeed - 1
         # Increment the command counter & specify the request type.
-        Pressed, CommandsIssued, RequestReceived, RequestedSpeed, SpeedCounter = True, CommandsIssued + 1, OpText+str(CurrentSpeed), CurrentSpeed, DetectSpeedSkipInterval
+        Pressed, CommandsIssued, RequestReceived, RequestedSpeed, SpeedReadyTime = True, CommandsIssued + 1, OpText, CurrentSpeed, RepeatTime
     # Detect when a number key is pressed & set the speed level to that number.
-    if KB.is_pressed(SpeedOneKey) and Pressed == False:
+    if IsKeyPressed(SpeedOneKey) and Pressed == False:
       # Increment the command counter & specify the request type.
-      SpeedCounter, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = DetectSpeedSkipInterval, True, CommandsIssued + 1, 'Update Speed', OpText+str(1), 1
-    if KB.is_pressed(SpeedTwoKey) and Pressed == False:
+      SpeedReadyTime, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = RepeatTime, True, CommandsIssued + 1, 'Update Speed', OpText, 1
+    if IsKeyPressed(SpeedTwoKey) and Pressed == False:
       # Increment the command counter & specify the request type.
-      SpeedCounter, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = DetectSpeedSkipInterval, True, CommandsIssued + 1, 'Update Speed', OpText+str(2), 2
-    if KB.is_pressed(SpeedThreeKey) and Pressed == False:
+      SpeedReadyTime, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = RepeatTime, True, CommandsIssued + 1, 'Update Speed', OpText, 2
+    if IsKeyPressed(SpeedThreeKey) and Pressed == False:
       # Increment the command counter & specify the request type.
-      SpeedCounter, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = DetectSpeedSkipInterval, True, CommandsIssued + 1, 'Update Speed', OpText+str(3), 3
-    if KB.is_pressed(SpeedFourKey) and Pressed == False:
+      SpeedReadyTime, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = RepeatTime, True, CommandsIssued + 1, 'Update Speed', OpText, 3
+    if IsKeyPressed(SpeedFourKey) and Pressed == False:
       # Increment the command counter & specify the request type.
-      SpeedCounter, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = DetectSpeedSkipInterval, True, CommandsIssued + 1, 'Update Speed', OpText+str(4), 4
-    if KB.is_pressed(SpeedFiveKey) and Pressed == False:
+      SpeedReadyTime, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = RepeatTime, True, CommandsIssued + 1, 'Update Speed', OpText, 4
+    if IsKeyPressed(SpeedFiveKey) and Pressed == False:
       # Increment the command counter & specify the request type.
-      SpeedCounter, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = DetectSpeedSkipInterval, True, CommandsIssued + 1, 'Update Speed', OpText+str(5), 5
-    if KB.is_pressed(SpeedSixKey) and Pressed == False:
+      SpeedReadyTime, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = RepeatTime, True, CommandsIssued + 1, 'Update Speed', OpText, 5
+    if IsKeyPressed(SpeedSixKey) and Pressed == False:
       # Increment the command counter & specify the request type.
-      SpeedCounter, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = DetectSpeedSkipInterval, True, CommandsIssued + 1, 'Update Speed', OpText+str(6), 6
-    if KB.is_pressed(SpeedSevenKey) and Pressed == False:
+      SpeedReadyTime, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = RepeatTime, True, CommandsIssued + 1, 'Update Speed', OpText, 6
+    if IsKeyPressed(SpeedSevenKey) and Pressed == False:
       # Increment the command counter & specify the request type.
-      SpeedCounter, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = DetectSpeedSkipInterval, True, CommandsIssued + 1, 'Update Speed', OpText+str(7), 7
-    if KB.is_pressed(SpeedEightKey) and Pressed == False:
+      SpeedReadyTime, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = RepeatTime, True, CommandsIssued + 1, 'Update Speed', OpText, 7
+    if IsKeyPressed(SpeedEightKey) and Pressed == False:
       # Increment the command counter & specify the request type.
-      SpeedCounter, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = DetectSpeedSkipInterval, True, CommandsIssued + 1, 'Update Speed', OpText+str(8), 8
-    if KB.is_pressed(SpeedNineKey) and Pressed == False:
+      SpeedReadyTime, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = RepeatTime, True, CommandsIssued + 1, 'Update Speed', OpText, 8
+    if IsKeyPressed(SpeedNineKey) and Pressed == False:
       # Increment the command counter & specify the request type.
-      SpeedCounter, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = DetectSpeedSkipInterval, True, CommandsIssued + 1, 'Update Speed', OpText+str(9), 9
-    if KB.is_pressed(SpeedTenKey) and Pressed == False:
+      SpeedReadyTime, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = RepeatTime, True, CommandsIssued + 1, 'Update Speed', OpText, 9
+    if IsKeyPressed(SpeedTenKey) and Pressed == False:
       # Increment the command counter & specify the request type.
-      SpeedCounter, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = DetectSpeedSkipInterval, True, CommandsIssued + 1, 'Update Speed', OpText+str(0), 0
+      SpeedReadyTime, Pressed, CommandsIssued, RequestReceived, CommandSent, RequestedSpeed = RepeatTime, True, CommandsIssued + 1, 'Update Speed', OpText, 0
+    # Update the controller state.
+    Controller.CurrentSpeed, Controller.SpeedReadyTime = CurrentSpeed, SpeedReadyTime
     # Detect if a request was received.
     if Pressed == True:
       # Determine if the requested speed is within boundaries.
       if RequestedSpeed >= 0 and RequestedSpeed <= 9:
         # Update the speed & timing related variables to achieve the specified speed.
-        ExecutionDuration, CurrentSpeed = UpdateSpeed(RequestedSpeed, ExecutionDuration, DefaultDwellDuration, Sensitivity)
+        UpdateSpeed(Controller, RequestedSpeed)
         # Determine if the speaker is enabled by configuration.
         if EnableSpeakerBeep == True:
           # Output a beep from the speaker.
           Beep(SpeakerGPIO, BeepDuration, NumberOfBuzzes, Time)
         # Output when a speed change command is detected if Debug is set by configuration.
         if Debug == True:
+          # Add the requested speed level to the request labels only when they are printed.
+          if RequestReceived == OpText:
+            RequestReceived = OpText+str(RequestedSpeed)
+          if CommandSent == OpText:
+            CommandSent = OpText+str(RequestedSpeed)
           LastMessage = PrintMessage(LastMessage, 'Request Received: '+str(RequestReceived)+'. \nNumber Of Commands Issued: '+str(CommandsIssued)+\
-            '. \nCommands Issued: '+str(CommandSent)+'. \nThe Execution Duration is '+str(ExecutionDuration)+\
+            '. \nCommands Issued: '+str(CommandSent)+'. \nThe Execution Duration is '+str(Controller.ExecutionDuration)+\
             '. \nThe Dwell Duration is '+str(DwellDuration)+'.')
-  # If no speed check was performed, decrement the speed counter by 1.
-  else:
-    SpeedCounter = SpeedCounter - 1
-  return LastMessage, ExecutionDuration, CurrentSpeed, SpeedCounter
-#--------------------
-
-#--------------------
-# Stop Request.
-# Detect a request to stop all motors.
-def DetectStopRequest(LastMessage, DebugStops, CurrentSpeed, OriginalSpeed, KB, Boosted, ExecutionDuration, DefaultDwellDuration, DefaultSensitivity, MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, \
-  MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO, Debug):
-  # Initialize variables for sanity checks, request flags, & movement flags.
-  CheckOne, CheckTwo, RequestReceived, CommandSent, RightMoving, LeftMoving, CommandsIssued  = False, False, False, False, 0, 0, 0
-  # Detect when a primary movement key is pressed.
-  if not KB.is_pressed(ForwardKey) and not KB.is_pressed(BackwardKey) and not KB.is_pressed(TurnLeftKey) and not KB.is_pressed(TurnRightKey):
-    CheckOne = True
-  # Detect when a primary movement key is pressed.
-  if not KB.is_pressed(LeftLimpRightKey) and not KB.is_pressed(LeftLimpLeftKey) and not KB.is_pressed(RightLimpLeftKey) and not KB.is_pressed(RightLimpRightKey):
-    CheckTwo = True
-  # Determine if either set of primary movement keys were detected.
-  if CheckOne == True and CheckTwo == True:
-    # Initialize variables for sanity checks, request flags, & movement flags.
-    CheckOne, CheckTwo, RequestReceived, CommandSent = False, False, 'Stop', 'All Motors Stop'
-    # Remove boost from completed turn operations.
-    Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = RemoveBoost(Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity)
-    # Deactivate all motors.
-    AllMotorsStop(MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO)
-    # Increment the command counter.
-    CommandsIssued = CommandsIssued + 1
-    # Set the movement flags to stopping.
-    RightMoving, LeftMoving = 'Stopping', 'Stopping'
-    # Output when a movement command is detected if Debug is set by configuration.
-    if CommandsIssued > 0:
-      if Debug == True:
-        if DebugStops == True:
-          LastMessage = PrintMessage(LastMessage, 'Request Received: '+str(RequestReceived)+'. \nNumber Of Commands Issued: '+str(CommandsIssued)+\
-            '. \nCommands Issued: '+str(CommandSent)+'. \nEffective Boost: Right, None. Left, None. \nRight Channel Status: '+str(RightMoving)+'. \nLeft Channel Status: '+str(LeftMoving)+'.')
-  return LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed
+  return LastMessage
 #--------------------
 
 #--------------------
-# Forward Request.
-# Detect a request to rotate all motors forward.
-def DetectForwardRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, Boosted, ExecutionDuration, DefaultDwellDuration, DefaultSensitivity, MotorRelayOnePositiveGPIO, MotorRelayTwoPositiveGPIO, ForwardKey, \
-  BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug):
-  # Initialize variables for sanity checks, request flags, & movement flags.
-  RightMoving, LeftMoving, RequestReceived, CommandSent, RightTotalBoost, LeftTotalBoost, CommandsIssued = False, False, False, False, 0, 0, 0
-  # Detect when a primary movement key is pressed.
-  if KB.is_pressed(ForwardKey):
-    # Detect when conflicting movement keys are pressed & ignore input for this channel.
-    if not KB.is_pressed(BackwardKey) and not KB.is_pressed(TurnRightKey) and not KB.is_pressed(RightLimpRightKey):
-      # Reinitialize variables for request & movement flags if a request is detected.
-      RequestReceived, CommandSent, RightMoving, LeftMoving = 'Forward', 'Motor One Forward', CurrentSpeed, CurrentSpeed
-      # Remove boost from completed turn operations.
-      Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = RemoveBoost(Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity)
-      # Activate motor.
-      MotorOneForward(MotorRelayOnePositiveGPIO)
-      # Increment the command counter.
-      CommandsIssued = CommandsIssued + 1
-    # Detect when conflicting movement keys are pressed & ignore input for this channel.
-    if not KB.is_pressed(BackwardKey) and not KB.is_pressed(TurnLeftKey) and not KB.is_pressed(LeftLimpLeftKey):
-      # Reinitialize variables for request & movement flags if a request is detected.
-      RequestReceived, CommandSent, RightMoving, LeftMoving = 'Forward', str(CommandSent)+', Motor Two Forward', CurrentSpeed, CurrentSpeed
-      # Remove boost from completed turn operations.
-      Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = RemoveBoost(Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity)
-      # Activate motor.
-      MotorTwoForward(MotorRelayTwoPositiveGPIO)
-      # Increment the command counter.
-      CommandsIssued = CommandsIssued + 1
-    # Output when a movement command is detected if Debug is set by configuration.
-    if CommandsIssued > 0:
-      if Debug == True:
-        LastMessage = PrintMessage(LastMessage, 'Request Received: '+str(RequestReceived)+'. \nNumber Of Commands Issued: '+str(CommandsIssued)+\
-          '. \nCommands Issued: '+str(CommandSent)+'. \nEffective Boost: Right, None. Left, None. \nRight Channel Status: '+str(RightMoving)+'. \nLeft Channel Status: '+str(LeftMoving)+'.')
-  return LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed
+# Compile the motion keys into a decision table indexed by the bitmap of pressed motion keys.
+# Each motion rule lists the key that triggers it, the motor pin each channel activates with the keys that block that channel & the boost that the rule applies.
+# Every combination of motion keys is resolved against the rules once at startup so a motion request is a single table lookup per input cycle.
+# Each entry of the table is a tuple of actions. Each action contains the request name, the commands issued, the number of commands, a dictionary of motor pin values & the boost to apply.
+# A boost of None removes any boost. Otherwise the boost is a tuple of the channel that sets the boosted speed, the right channel boost & the left channel boost.
+def CompileMotionTable(LastMessage, KeyMasks, MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO, RightBoostAmount, RightReductionAmount, \
+  RightLimpBoostAmount, RightLimpReductionAmount, LeftBoostAmount, LeftReductionAmount, LeftLimpBoostAmount, LeftLimpReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, \
+  RightLimpRightKey, RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug):
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Compiling Motion Table...')
+  # Define the motion rules in the order they are applied.
+  TurnBoost, LimpBoost = (RightBoostAmount - RightReductionAmount, LeftBoostAmount - LeftReductionAmount), (RightLimpBoostAmount - RightLimpReductionAmount, LeftLimpBoostAmount - LeftLimpReductionAmount)
+  MotionRules = (
+    # Rotate all motors forward. Each channel is blocked separately.
+    ('Forward', ForwardKey, ((MotorRelayOnePositiveGPIO, 'Motor One Forward', (BackwardKey, TurnRightKey, RightLimpRightKey)), \
+      (MotorRelayTwoPositiveGPIO, 'Motor Two Forward', (BackwardKey, TurnLeftKey, LeftLimpLeftKey))), None),
+    # Rotate all motors backward. Each channel is blocked separately.
+    ('Backward', BackwardKey, ((MotorRelayOneNegativeGPIO, 'Motor One Reverse', (ForwardKey, TurnLeftKey, RightLimpLeftKey, LeftLimpLeftKey)), \
+      (MotorRelayTwoNegativeGPIO, 'Motor Two Reverse', (ForwardKey, TurnRightKey, RightLimpRightKey, LeftLimpRightKey))), None),
+    # Rotate all motors right.
+    ('Turn Right', TurnRightKey, ((MotorRelayOneNegativeGPIO, 'Motor One Reverse', (ForwardKey, BackwardKey, TurnLeftKey, LeftLimpLeftKey, RightLimpLeftKey)), \
+      (MotorRelayTwoPositiveGPIO, 'Motor Two Forward', (ForwardKey, BackwardKey, TurnLeftKey, LeftLimpLeftKey, RightLimpLeftKey))), ('Right',) + TurnBoost),
+    # Rotate all motors left.
+    ('Turn Left', TurnLeftKey, ((MotorRelayOnePositiveGPIO, 'Motor One Forward', (ForwardKey, BackwardKey, TurnRightKey, RightLimpRightKey, LeftLimpRightKey)), \
+      (MotorRelayTwoNegativeGPIO, 'Motor Two Reverse', (ForwardKey, BackwardKey, TurnRightKey, RightLimpRightKey, LeftLimpRightKey))), ('Left',) + TurnBoost),
+    # Rotate right motors right.
+    ('Turn Right With Right Motors', RightLimpRightKey, ((MotorRelayOneNegativeGPIO, 'Motor One Reverse', (ForwardKey, TurnLeftKey, RightLimpLeftKey, LeftLimpLeftKey)),), ('Right',) + LimpBoost),
+    # Rotate right motors left.
+    ('Turn Left With Right Motors', RightLimpLeftKey, ((MotorRelayOnePositiveGPIO, 'Motor One Forward', (BackwardKey, TurnRightKey, RightLimpRightKey, LeftLimpRightKey)),), ('Left',) + LimpBoost),
+    # Rotate left motors right. The left motor limp requests keep the relays they have always activated, the negative relay for this request.
+    ('Turn Right With Left Motors', LeftLimpRightKey, ((MotorRelayTwoNegativeGPIO, 'Motor Two Forward', (BackwardKey, TurnLeftKey, LeftLimpLeftKey, RightLimpLeftKey)),), ('Right',) + LimpBoost),
+    # Rotate left motors left. This request activates the positive relay.
+    ('Turn Left With Left Motors', LeftLimpLeftKey, ((MotorRelayTwoPositiveGPIO, 'Motor Two Reverse', (ForwardKey, TurnRightKey, LeftLimpRightKey, RightLimpRightKey)),), ('Left',) + LimpBoost))
+  # Combine the bits of every motion key. Motion keys are assigned the lowest bits of the bitmap so the table stays small.
+  MotionMask = 0
+  for Request, Key, Channels, Boost in MotionRules:
+    MotionMask = MotionMask | KeyMasks[Key]
+  # Resolve every combination of motion keys.
+  MotionTable = [()] * (MotionMask + 1)
+  for Index in range(MotionMask + 1):
+    # Skip combinations that contain keys other than motion keys.
+    if Index & ~MotionMask:
+      continue
+    Actions = []
+    # Stop all motors when no motion keys are pressed.
+    if Index == 0:
+      Actions.append(('Stop', 'All Motors Stop', 1, {Pin: GPIO.LOW for Pin in (MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO)}, None))
+    for Request, Key, Channels, Boost in MotionRules:
+      # Determine if this rule is triggered.
+      if Index & KeyMasks[Key]:
+        # Collect the channels that are not blocked by conflicting keys.
+        Commands = [(Pin, Command) for Pin, Command, BlockingKeys in Channels if not any(Index & KeyMasks[BlockingKey] for BlockingKey in BlockingKeys)]
+        if len(Commands) > 0:
+          Actions.append((Request, ', '.join(Command for Pin, Command in Commands), len(Commands), {Pin: GPIO.HIGH for Pin, Command in Commands}, Boost))
+    MotionTable[Index] = tuple(Actions)
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Motion Table Compiled Successfully. \n'+str(len(MotionTable))+' Key Combinations Resolved.')
+  return LastMessage, MotionTable, MotionMask
 #--------------------
 
 #--------------------
-# Reverse Request.
-# Detect a request to rotate all motors backward.
-def DetectReverseRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, Boosted, ExecutionDuration, DefaultDwellDuration, DefaultSensitivity, MotorRelayOneNegativeGPIO, MotorRelayTwoNegativeGPIO, ForwardKey, \
-  BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug):
-  # Initialize variables for sanity checks, request flags, & movement flags.
-  RightMoving, LeftMoving, RequestReceived, CommandSent, RightTotalBoost, LeftTotalBoost, CommandsIssued = False, False, False, False, 0, 0, 0
-  # Detect when a primary movement key is pressed.
-  if KB.is_pressed(BackwardKey):
-    # Detect when conflicting movement keys are pressed & ignore input for this channel.
-    if not KB.is_pressed(ForwardKey) and not KB.is_pressed(TurnLeftKey) and not KB.is_pressed(RightLimpLeftKey) and not KB.is_pressed(LeftLimpLeftKey):
-      # Reinitialize variables for request & movement flags if a request is detected.
-      RequestReceived, CommandSent, RightMoving, LeftMoving = 'Backward', 'Motor One Reverse', CurrentSpeed, CurrentSpeed
-      # Remove boost from completed turn operations.
-      Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = RemoveBoost(Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity)
-      # Activate motor.
-      MotorOneReverse(MotorRelayOneNegativeGPIO)
-      # Increment the command counter.
-      CommandsIssued = CommandsIssued + 1
-    # Detect when conflicting movement keys are pressed & ignore input for this channel.
-    if not KB.is_pressed(ForwardKey) and not KB.is_pressed(TurnRightKey) and not KB.is_pressed(RightLimpRightKey) and not KB.is_pressed(LeftLimpRightKey):
-      # Reinitialize variables for request & movement flags if a request is detected.
-      RequestReceived, CommandSent, RightMoving, LeftMoving = 'Backward', str(CommandSent)+', Motor Two Reverse', CurrentSpeed, CurrentSpeed
+# Detect which motion is being requested & stage the corresponding motor command.
+# The actions for the pressed motion keys are looked up in the motion table compiled by CompileMotionTable().
+# The actions are walked by index & the pin values are staged with a single dictionary update so a held key or idle keyboard allocates nothing.
+def DetectKeyboardMotion(LastMessage, Controller, DebugStops, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, MotionTable, MotionMask, Debug):
+  # Initialize variables for request flags & look up the actions for the pressed motion keys.
+  Pressed, Actions, Action = False, MotionTable[PressedKeys & MotionMask], 0
+  # Perform each action for the pressed motion keys.
+  while Action < len(Actions):
+    RequestReceived, CommandSent, CommandsIssued, PinValues, Boost = Actions[Action]
+    Action = Action + 1
+    if Boost is None:
       # Remove boost from completed turn operations.
-      Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = RemoveBoost(Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity)
-      # Activate motor.
-      MotorTwoReverse(MotorRelayTwoNegativeGPIO)
-      # Increment the command counter.
-      CommandsIssued = CommandsIssued + 1
-    # Output when a movement command is detected if Debug is set by configuration.
-    if CommandsIssued > 0:
-      if Debug == True:
-        LastMessage = PrintMessage(LastMessage, 'Request Received: '+str(RequestReceived)+'. \nNumber Of Commands Issued: '+str(CommandsIssued)+\
-          '. \nCommands Issued: '+str(CommandSent)+'. \nEffective Boost: Right, None. Left, None. \nRight Channel Status: '+str(RightMoving)+'. \nLeft Channel Status: '+str(LeftMoving)+'.')
-  return LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed
-#--------------------
-
-#--------------------
-# Turn Right Request.
-# Detect a request to rotate all motors right.
-def DetectRightRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, ExecutionDuration, DefaultDwellDuration, DefaultSensitivity, Boosted, MotorRelayTwoPositiveGPIO, MotorRelayOneNegativeGPIO, \
-  RightBoostAmount, RightReductionAmount, LeftBoostAmount, LeftReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, RightLimpLeftKey, LeftLimpRightKey, \
-  LeftLimpLeftKey, Debug):
-  # Initialize variables for sanity checks, request flags, & movement flags.
-  RightMoving, LeftMoving, RequestReceived, CommandSent, RightTotalBoost, LeftTotalBoost, CommandsIssued = False, False, False, False, 0, 0, 0
-  # Detect when a primary movement key is pressed.
-  if KB.is_pressed(TurnRightKey):
-    # Detect when conflicting movement keys are pressed & ignore input for this channel.
-    if not KB.is_pressed(ForwardKey) and not KB.is_pressed(BackwardKey) and not KB.is_pressed(TurnLeftKey) and not KB.is_pressed(LeftLimpLeftKey) and not KB.is_pressed(RightLimpLeftKey):
-      # Reinitialize variables for request & movement flags if a request is detected.
-      RequestReceived, CommandSent, RightTotalBoost, LeftTotalBoost = 'Turn Right', 'Motor One Reverse. Motor Two Forward', RightBoostAmount - RightReductionAmount, LeftBoostAmount - LeftReductionAmount
-      # Set boosted speed values.
-      RightMoving, LeftMoving = CalculateBoost(Boosted, CurrentSpeed, RightTotalBoost, LeftTotalBoost)
-      # Apply boost & reduction.
-      Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = AddBoost(RightMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity)
-      # Activate motor.
-      MotorOneReverse(MotorRelayOneNegativeGPIO)
-      # Increment the command counter.
-      CommandsIssued = CommandsIssued + 1
-      # Activate motor.
-      MotorTwoForward(MotorRelayTwoPositiveGPIO)
-      # Increment the command counter.
-      CommandsIssued = CommandsIssued + 1
-      # Output when a movement command is detected if Debug is set by configuration.
-      if CommandsIssued > 0:
-        if Debug == True:
-          LastMessage = PrintMessage(LastMessage, 'Request Received: '+str(RequestReceived)+'. \nNumber Of Commands Issued: '+str(CommandsIssued)+\
-            '. \nCommands Issued: '+str(CommandSent)+'. \nEffective Boost: Right, '+str(RightTotalBoost)+'. Left, '+str(LeftTotalBoost)+'. \nRight Channel Status: '+str(RightMoving)+\
-            '. \nLeft Channel Status: '+str(LeftMoving)+'.')
-  return LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed
-#--------------------
-
-#--------------------
-# Turn Left Request.
-# Detect a request to rotate all motors left.
-def DetectLeftRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, ExecutionDuration, DefaultDwellDuration, DefaultSensitivity, Boosted, MotorRelayOnePositiveGPIO, MotorRelayTwoNegativeGPIO, RightBoostAmount, \
-  RightReductionAmount, LeftBoostAmount, LeftReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey,  Debug):
-  # Initialize variables for sanity checks, request flags, & movement flags.
-  RightMoving, LeftMoving, RequestReceived, CommandSent, RightTotalBoost, LeftTotalBoost, CommandsIssued = False, False, False, False, 0, 0, 0
-  # Detect when a primary movement key is pressed.
-  if KB.is_pressed(TurnLeftKey):
-    # Detect when conflicting movement keys are pressed & ignore input for this channel.
-    if not KB.is_pressed(ForwardKey) and not KB.is_pressed(BackwardKey) and not KB.is_pressed(TurnRightKey) and not KB.is_pressed(RightLimpRightKey) and not KB.is_pressed(LeftLimpRightKey):
-      # Reinitialize variables for request & movement flags if a request is detected.
-      RequestReceived, CommandSent, RightTotalBoost, LeftTotalBoost = 'Turn Left', 'Motor One Forward. Motor Two Reverse', RightBoostAmount - RightReductionAmount, LeftBoostAmount - LeftReductionAmount
-      # Set boosted speed values.
-      RightMoving, LeftMoving = CalculateBoost(Boosted, CurrentSpeed, RightTotalBoost, LeftTotalBoost)
-      # Apply boost & reduction.
-      Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = AddBoost(LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity)
-      # Activate motor.
-      MotorOneForward(MotorRelayOnePositiveGPIO)
-      # Increment the command counter.
-      CommandsIssued = CommandsIssued + 1
-      # Activate motor.
-      MotorTwoReverse(MotorRelayTwoNegativeGPIO)
-      # Increment the command counter.
-      CommandsIssued = CommandsIssued + 1
-      # Output when a movement command is detected if Debug is set by configuration.
-      if CommandsIssued > 0:
-        if Debug == True:
-          LastMessage = PrintMessage(LastMessage, 'Request Received: '+str(RequestReceived)+'. \nNumber Of Commands Issued: '+str(CommandsIssued)+\
-            '. \nCommands Issued: '+str(CommandSent)+'. \nEffective Boost: Right, '+str(RightTotalBoost)+'. Left, '+str(LeftTotalBoost)+'. \nRight Channel Status: '+str(RightMoving)+\
-            '. \nLeft Channel Status: '+str(LeftMoving)+'.')
-  return LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed
-#--------------------
-
-#--------------------
-# Right Motors Limp Right Request.
-# Detect a request to rotate right motors right.
-def DetectRightLimpRightRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, ExecutionDuration, DefaultDwellDuration, DefaultSensitivity, Boosted, MotorRelayOneNegativeGPIO, RightLimpBoostAmount, \
-  RightLimpReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug):
-  # Initialize variables for sanity checks, request flags, & movement flags.
-  RightMoving, LeftMoving, RequestReceived, CommandSent, RightTotalBoost, LeftTotalBoost, CommandsIssued = False, False, False, False, 0, 0, 0
-  # Detect when a primary movement key is pressed.
-  if KB.is_pressed(RightLimpRightKey):
-    # Detect when conflicting movement keys are pressed & ignore input for this channel.
-    if not KB.is_pressed(ForwardKey) and not KB.is_pressed(TurnLeftKey) and not KB.is_pressed(RightLimpLeftKey)  and not KB.is_pressed(LeftLimpLeftKey):
-      # Reinitialize variables for request & movement flags if a request is detected.
-      RequestReceived, CommandSent, RightTotalBoost, LeftTotalBoost = 'Turn Right With Right Motors', 'Motor One Reverse', RightLimpBoostAmount - RightLimpReductionAmount, LeftLimpBoostAmount - LeftLimpReductionAmount
-      # Set boosted speed values.
-      RightMoving, LeftMoving = CalculateBoost(Boosted, CurrentSpeed, RightTotalBoost, LeftTotalBoost)
-      # Apply boost & reduction.
-      Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = AddBoost(RightMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity)
-      # Activate motor.
-      MotorOneReverse(MotorRelayOneNegativeGPIO)
-      # Increment the command counter.
-      CommandsIssued = CommandsIssued + 1
-      # Output when a movement command is detected if Debug is set by configuration.
-      if CommandsIssued > 0:
-        if Debug == True:
-          LastMessage = PrintMessage(LastMessage, 'Request Received: '+str(RequestReceived)+'. \nNumber Of Commands Issued: '+str(CommandsIssued)+\
-            '. \nCommands Issued: '+str(CommandSent)+'. \nEffective Boost: Right, '+str(RightTotalBoost)+'. Left, '+str(LeftTotalBoost)+'. \nRight Channel Status: '+str(RightMoving)+\
-            '. \nLeft Channel Status: '+str(LeftMoving)+'.')
-  return LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed
-#--------------------
-
-#--------------------
-# Right Motors Limp Left Request.
-# Detect a request to rotate right motors left.
-def DetectRightLimpLeftRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, ExecutionDuration, DefaultDwellDuration, DefaultSensitivity, Boosted, MotorRelayOnePositiveGPIO, RightLimpBoostAmount, \
-  RightLimpReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug):
-  # Initialize variables for sanity checks, request flags, & movement flags.
-  RightMoving, LeftMoving, RequestReceived, CommandSent, RightTotalBoost, LeftTotalBoost, CommandsIssued = False, False, False, False, 0, 0, 0
-  # Detect when a primary movement key is pressed.
-  if KB.is_pressed(RightLimpLeftKey):
-    # Detect when conflicting movement keys are pressed & ignore input for this channel.
-    if not KB.is_pressed(BackwardKey) and not KB.is_pressed(TurnRightKey) and not KB.is_pressed(RightLimpRightKey) and not KB.is_pressed(LeftLimpRightKey):
-      # Reinitialize variables for request & movement flags if a request is detected.
-      RequestReceived, CommandSent, RightTotalBoost, LeftTotalBoost = 'Turn Left With Right Motors', 'Motor One Forward', RightLimpBoostAmount - RightLimpReductionAmount, LeftLimpBoostAmount - LeftLimpReductionAmount
-      # Set boosted speed values.
-      RightMoving, LeftMoving = CalculateBoost(Boosted, CurrentSpeed, RightTotalBoost, LeftTotalBoost)
-      # Apply boost & reduction.
-      Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = AddBoost(LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity)
-      # Activate motor.
-      MotorOneForward(MotorRelayOnePositiveGPIO)
-      # Increment the command counter.
-      CommandsIssued = CommandsIssued + 1
-      # Output when a movement command is detected if Debug is set by configuration.
-      if CommandsIssued > 0:
-        if Debug == True:
-          LastMessage = PrintMessage(LastMessage, 'Request Received: '+str(RequestReceived)+'. \nNumber Of Commands Issued: '+str(CommandsIssued)+\
-            '. \nCommands Issued: '+str(CommandSent)+'. \nEffective Boost: Right, '+str(RightTotalBoost)+'. Left, '+str(LeftTotalBoost)+'. \nRight Channel Status: '+str(RightMoving)+\
-            '. \nLeft Channel Status: '+str(LeftMoving)+'.')
-  return LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed
-#--------------------
-
-#--------------------
-# Left Motors Limp Right Request.
-# Detect a request to rotate left motors right.
-def DetectLeftLimpRightRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, ExecutionDuration, DefaultDwellDuration, DefaultSensitivity, Boosted, MotorRelayTwoPositiveGPIO, LeftLimpBoostAmount, \
-  LeftLimpReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug):
-  # Initialize variables for sanity checks, request flags, & movement flags.
-  RightMoving, LeftMoving, RequestReceived, CommandSent, RightTotalBoost, LeftTotalBoost, CommandsIssued = False, False, False, False, 0, 0, 0
-  # Detect when a primary movement key is pressed.
-  if KB.is_pressed(LeftLimpRightKey):
-    # Detect when conflicting movement keys are pressed & ignore input for this channel.
-    if not KB.is_pressed(BackwardKey) and not KB.is_pressed(TurnLeftKey) and not KB.is_pressed(LeftLimpLeftKey) and not KB.is_pressed(RightLimpLeftKey):
-      # Reinitialize variables for request & movement flags if a request is detected.
-      RequestReceived, CommandSent, RightTotalBoost, LeftTotalBoost = 'Turn Right With Left Motors', 'Motor Two Forward', RightLimpBoostAmount - RightLimpReductionAmount, LeftLimpBoostAmount - LeftLimpReductionAmount
-      # Set boosted speed values.
-      RightMoving, LeftMoving = CalculateBoost(Boosted, CurrentSpeed, RightTotalBoost, LeftTotalBoost)
-      # Apply boost & reduction.
-      Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = AddBoost(RightMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity)
-      # Activate motor.
-      MotorTwoForward(MotorRelayTwoPositiveGPIO)
-      # Increment the command counter.
-      CommandsIssued = CommandsIssued + 1
-      # Output when a movement command is detected if Debug is set by configuration.
-      if CommandsIssued > 0:
-        if Debug == True:
-          LastMessage = PrintMessage(LastMessage, 'Request Received: '+str(RequestReceived)+'. \nNumber Of Commands Issued: '+str(CommandsIssued)+\
-            '. \nCommands Issued: '+str(CommandSent)+'. \nEffective Boost: Right, '+str(RightTotalBoost)+'. Left, '+str(LeftTotalBoost)+'. \nRight Channel Status: '+str(RightMoving)+\
-            '. \nLeft Channel Status: '+str(LeftMoving)+'.')
-  return LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed
-#--------------------
-
-#--------------------
-# Left Motors Limp Left Request.
-# Detect a request to rotate left motors left.
-def DetectLeftLimpLeftRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, ExecutionDuration, DefaultDwellDuration, DefaultSensitivity, Boosted, MotorRelayTwoNegativeGPIO, LeftBoostAmount, \
-  LeftReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug):
-  # Initialize variables for sanity checks, request flags, & movement flags.
-  RightMoving, LeftMoving, RequestReceived, CommandSent, RightTotalBoost, LeftTotalBoost, CommandsIssued = False, False, False, False, 0, 0, 0
-  # Detect when a primary movement key is pressed.
-  if KB.is_pressed(LeftLimpLeftKey):
-    # Detect when conflicting movement keys are pressed & ignore input for this channel.
-    if not KB.is_pressed(ForwardKey) and not KB.is_pressed(TurnRightKey) and not KB.is_pressed(LeftLimpRightKey) and not KB.is_pressed(RightLimpRightKey):
-      # Reinitialize variables for request & movement flags if a request is detected.
-      RequestReceived, CommandSent, RightTotalBoost, LeftTotalBoost = 'Turn Left With Left Motors', 'Motor One Reverse', RightLimpBoostAmount - RightLimpReductionAmount, LeftLimpBoostAmount - LeftLimpReductionAmount
+      RemoveBoost(Controller)
+      RightMoving, LeftMoving, RightTotalBoost, LeftTotalBoost = Controller.CurrentSpeed, Controller.CurrentSpeed, 'None', 'None'
+    else:
+      BoostChannel, RightTotalBoost, LeftTotalBoost = Boost
       # Set boosted speed values.
-      RightMoving, LeftMoving = CalculateBoost(Boosted, CurrentSpeed, RightTotalBoost, LeftTotalBoost)
+      RightMoving, LeftMoving = CalculateBoost(Controller, RightTotalBoost, LeftTotalBoost)
       # Apply boost & reduction.
-      Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = AddBoost(LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity)
-      # Activate motor.
-      MotorTwoReverse(MotorRelayTwoNegativeGPIO)
-      # Increment the command counter.
-      CommandsIssued = CommandsIssued + 1
-      # Output when a movement command is detected if Debug is set by configuration.
-      if CommandsIssued > 0:
-        if Debug == True:
-          LastMessage = PrintMessage(LastMessage, 'Request Received: '+str(RequestReceived)+'. \nNumber Of Commands Issued: '+str(CommandsIssued)+\
-            '. \nCommands Issued: '+str(CommandSent)+'. \nEffective Boost: Right, '+str(RightTotalBoost)+'. Left, '+str(LeftTotalBoost)+'. \nRight Channel Status: '+str(RightMoving)+\
-            '. \nLeft Channel Status: '+str(LeftMoving)+'.')
-  return LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed
-#--------------------
-
-#--------------------
-# Detect which motion is being requested & activate the corresponding motor command.
-def DetectKeyboardMotion(LastMessage, DebugStops, CurrentSpeed, OriginalSpeed, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, \
-  MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO, RightBoostAmount, RightReductionAmount, RightLimpBoostAmount, RightLimpReductionAmount, LeftBoostAmount, \
-  LeftReductionAmount, LeftLimpBoostAmount, LeftLimpReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, RightLimpLeftKey, \
-  LeftLimpRightKey, LeftLimpLeftKey, Boosted, ExecutionDuration, Time, KB, Debug):
-  # Initialize variables for request & movement flags.
-  RequestReceived, RightMoving, LeftMoving, Pressed = False, False, False, False
-  # Detect motion requests from supplied user input.
-  # These functions trigger GPIO output activity.
-  # Detect a Stop Request.
-  LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = DetectStopRequest(LastMessage, DebugStops, CurrentSpeed, OriginalSpeed, \
-    KB, Boosted, ExecutionDuration, DefaultDwellDuration, DefaultSensitivity, MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO, Debug)
-  if RequestReceived != False and DebugStops == True:
-    Pressed = True
-  # Detect a Forward Request.
-  LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = DetectForwardRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, Boosted, \
-    ExecutionDuration, DefaultDwellDuration, DefaultSensitivity, MotorRelayOnePositiveGPIO, MotorRelayTwoPositiveGPIO, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, \
-    RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug)
-  if RequestReceived != False:
-    Pressed = True
-  # Detect a Reverse Request.
-  LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = DetectReverseRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, Boosted, \
-    ExecutionDuration, DefaultDwellDuration, DefaultSensitivity, MotorRelayOneNegativeGPIO, MotorRelayTwoNegativeGPIO, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, \
-    RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug)
-  if RequestReceived != False:
-    Pressed = True
-  # Detect a Right Turn Request.
-  LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = DetectRightRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, ExecutionDuration, \
-    DefaultDwellDuration, DefaultSensitivity, Boosted, MotorRelayTwoPositiveGPIO, MotorRelayOneNegativeGPIO, RightBoostAmount, RightReductionAmount, LeftBoostAmount, LeftReductionAmount, ForwardKey, \
-    BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug)
-  if RequestReceived != False:
-    Pressed = True
-  # Detect a Left Turn Request.
-  LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = DetectLeftRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, ExecutionDuration, \
-    DefaultDwellDuration, DefaultSensitivity, Boosted, MotorRelayOnePositiveGPIO, MotorRelayTwoNegativeGPIO, RightBoostAmount, RightReductionAmount, LeftBoostAmount, LeftReductionAmount, ForwardKey, \
-    BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug)
-  if RequestReceived != False:
-    Pressed = True
-  # Detect a Right Motor Limp Right Request.
-  LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = DetectRightLimpRightRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, ExecutionDuration, \
-    DefaultDwellDuration, DefaultSensitivity, Boosted, MotorRelayOneNegativeGPIO, RightLimpBoostAmount, RightLimpReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, \
-    RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug)
-  if RequestReceived != False:
-    Pressed = True
-  # Detect a Right Motor Limp Left Request.
-  LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = DetectRightLimpLeftRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, ExecutionDuration, \
-    DefaultDwellDuration, DefaultSensitivity, Boosted, MotorRelayOnePositiveGPIO, RightLimpBoostAmount, RightLimpReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, \
-    RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug)
-  if RequestReceived != False:
-    Pressed = True
-  # Detect a Left Motor Limp Right Request.
-  LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = DetectLeftLimpRightRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, ExecutionDuration, \
-    DefaultDwellDuration, DefaultSensitivity, Boosted, MotorRelayTwoNegativeGPIO, LeftLimpBoostAmount, LeftLimpReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, \
-    RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug)
-  if RequestReceived != False:
-    Pressed = True
-  # Detect a Left Motor Limp Left Request.
-  LastMessage, RequestReceived, RightMoving, LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = DetectLeftLimpLeftRequest(LastMessage, CurrentSpeed, OriginalSpeed, KB, ExecutionDuration, \
-    DefaultDwellDuration, DefaultSensitivity, Boosted, MotorRelayTwoPositiveGPIO, LeftLimpBoostAmount, LeftLimpReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, \
-    RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug)
-  if RequestReceived != False:
-    Pressed = True
+      if BoostChannel == 'Right':
+        AddBoost(Controller, RightMoving)
+      else:
+        AddBoost(Controller, LeftMoving)
+    # Stage the motor pin values of this action.
+    PendingMotorState.update(PinValues)
+    if RequestReceived == 'Stop':
+      # Set the movement flags to stopping.
+      RightMoving, LeftMoving = 'Stopping', 'Stopping'
+      if DebugStops == True:
+        Pressed = True
+    else:
+      Pressed = True
+      # Stage the speed level for each motor channel.
+      WriteChannelSpeeds(RightMoving, LeftMoving)
+    # Output when a movement command is detected if Debug is set by configuration.
+    if Debug == True and (RequestReceived != 'Stop' or DebugStops == True):
+      LastMessage = PrintMessage(LastMessage, 'Request Received: '+str(RequestReceived)+'. \nNumber Of Commands Issued: '+str(CommandsIssued)+\
+        '. \nCommands Issued: '+str(CommandSent)+'. \nEffective Boost: Right, '+str(RightTotalBoost)+'. Left, '+str(LeftTotalBoost)+'. \nRight Channel Status: '+str(RightMoving)+\
+        '. \nLeft Channel Status: '+str(LeftMoving)+'.')
   # Determine if a request was received.
   if Pressed == True:
     # Determine if the speaker is enabled by configuration.
     if EnableSpeakerBeep == True:
       # Output a beep from the speaker.
       Beep(SpeakerGPIO, BeepDuration, NumberOfBuzzes, Time)
-  return LastMessage, ExecutionDuration, CurrentSpeed, OriginalSpeed, Boosted
-#--------------------
-
-#--------------------
-# Listen for requests from the user & call the appropriate procedure to accomplish it.
-def ListenForKeyboardRequests(LastMessage, DebugStops, MinimumSensitivity, MaximumSensitivity, SensitivityCounter, SpeedCounter, ExecutionDuration, DwellDuration, DefaultSensitivity, CurrentSpeed, OriginalSpeed, BeepDuration, \
-  NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO, RightBoostAmount, RightReductionAmount, \
-  RightLimpBoostAmount, RightLimpReductionAmount, LeftBoostAmount, LeftReductionAmount, LeftLimpBoostAmount, LeftLimpReductionAmount, ForwardKey, BackwardKey, \
-  TurnRightKey, TurnLeftKey, RightLimpRighKey, RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, IncreaseSpeedKey, DecreaseSpeedKey, SpeedOneKey, SpeedTwoKey, \
-  SpeedThreeKey, SpeedFourKey, SpeedFiveKey, SpeedSixKey, SpeedSevenKey, SpeedEightKey, SpeedNineKey, SpeedTenKey, CurrentSensitivity, Boosted, Time, KB, Debug):
-  # Start timing execution of the current loop now.
-  StartTime = Time.time()
-  # Detect any speed change requests.
-  CurrentSensitivity, SensitivityCounter = DetectKeyboardSensitivityChange(LastMessage, MinimumSensitivity, MaximumSensitivity, SensitivityCounter, DetectSensitivityInterval, DetectSensitivitySkipInterval, \
-    CurrentSensitivity, DefaultSensitivity, SensitivityChangeAmount, KB, IncreaseSensitivityKey, DecreaseSensitivityKey, ExecutionDuration, DwellDuration, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, Debug)
-  LastMessage, ExecutionDuration, CurrentSpeed, SpeedCounter = DetectKeyboardSpeedChange(LastMessage, SpeedCounter, DetectSpeedInterval, DetectSpeedSkipInterval, ExecutionDuration, DwellDuration, CurrentSensitivity, CurrentSpeed, KB, \
-    IncreaseSpeedKey, DecreaseSpeedKey, SpeedOneKey, SpeedTwoKey, SpeedThreeKey, SpeedFourKey, SpeedFiveKey, SpeedSixKey, SpeedSevenKey, SpeedEightKey, SpeedNineKey, \
-    SpeedTenKey, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, Debug)
+  return LastMessage
+#--------------------
+
+#--------------------
+# Read joystick axes from a Linux input event device with the same asyncio reader as the Evdev keyboard input backend.
+# Set JoystickInputDevice to the input event device. A pipe can stand in for the device. A regular file is replayed as a recording at the pace of its event timestamps.
+# Set JoystickThrottleAxis & JoystickSteeringAxis to the absolute axis codes of the sticks used for throttle & steering.
+# The range of each axis is read from the device. JoystickAxisMinimum & JoystickAxisMaximum are used when the range cannot be read, such as for recordings.
+# A fatal error is raised if the device cannot be opened.
+def InitializeJoystickInput(LastMessage, JoystickInputDevice, JoystickThrottleAxis, JoystickSteeringAxis, JoystickAxisMinimum, JoystickAxisMaximum, Threading, Debug):
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Initializing Joystick Input...')
+  JoystickState = {'Backend': 'Evdev', 'Pressed': 0, 'ScanCodes': {}, 'Hooked': False, 'Axes': {}, 'AxisCenters': {}, 'AxisScales': {}, 'LastAxes': None, 'Throttles': (0.0, 0.0)}
+  try:
+    import fcntl as FCntl, struct as Struct
+    # Start each axis centered within the configured range.
+    for Axis in (JoystickThrottleAxis, JoystickSteeringAxis):
+      JoystickState['AxisCenters'][Axis] = (JoystickAxisMinimum + JoystickAxisMaximum) / 2
+      JoystickState['AxisScales'][Axis] = 2 / (JoystickAxisMaximum - JoystickAxisMinimum)
+      JoystickState['Axes'][Axis] = JoystickState['AxisCenters'][Axis]
+    OpenEvdevDevice(JoystickInputDevice, JoystickState, 'Robot_Motion_Joystick', Threading)
+    # Read the position & range of each axis from the device with EVIOCGABS.
+    if JoystickState['Replay'] == False:
+      for Axis in (JoystickThrottleAxis, JoystickSteeringAxis):
+        try:
+          Value, Minimum, Maximum = Struct.unpack_from('3i', FCntl.ioctl(JoystickState['Descriptor'], 0x80184540 + Axis, bytes(24)))
+        # Keep the configured range for a pipe.
+        except OSError:
+          continue
+        if Maximum > Minimum:
+          JoystickState['AxisCenters'][Axis], JoystickState['AxisScales'][Axis], JoystickState['Axes'][Axis] = (Minimum + Maximum) / 2, 2 / (Maximum - Minimum), Value
+  # Handle the exception that is raised if the device cannot be opened.
+  except (ImportError, OSError, ValueError, ZeroDivisionError) as JoystickError:
+    LastMessage = PrintError(15, 'Could not Open Joystick Input Device. \nCaptured Exception, '+str(JoystickError)+'.', True)
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Joystick Input Initialized Successfully. \nThrottle Axis Range: '+str(JoystickState['AxisCenters'][JoystickThrottleAxis])+' +/- '+\
+      str(1 / JoystickState['AxisScales'][JoystickThrottleAxis])+'. \nSteering Axis Range: '+str(JoystickState['AxisCenters'][JoystickSteeringAxis])+' +/- '+\
+      str(1 / JoystickState['AxisScales'][JoystickSteeringAxis])+'.')
+  return LastMessage, JoystickState
+#--------------------
+
+#--------------------
+# Convert a raw joystick axis position to a shaped position from -1 to 1.
+# Set Center & Scale to the center of the axis & the scale that maps its range to -1 to 1.
+# Set JoystickDeadzone to the fraction of the axis travel from 0 to 1 around the center that is ignored. Positions within the deadzone return 0.
+# Set JoystickExpo to the fraction of cubic response from 0 to 1. 0 gives a linear response & 1 gives the finest control near the center.
+def ShapeJoystickAxis(Value, Center, Scale, JoystickDeadzone, JoystickExpo):
+  # Convert the axis position to the range -1 to 1 & ignore positions within the deadzone.
+  Position = (Value - Center) * Scale
+  Magnitude = abs(Position)
+  if Magnitude <= JoystickDeadzone:
+    return 0.0
+  # Rescale the remaining travel to start at zero at the edge of the deadzone.
+  Magnitude = min(1.0, (Magnitude - JoystickDeadzone) / (1 - JoystickDeadzone))
+  # Blend a linear response with a cubic response for finer control near the center.
+  Magnitude = (1 - JoystickExpo) * Magnitude + JoystickExpo * Magnitude * Magnitude * Magnitude
+  return Magnitude if Position > 0 else -Magnitude
+#--------------------
+
+#--------------------
+# Convert the joystick axes to a continuous throttle position for each motor channel & stage the corresponding motor command.
+# The throttle axis drives both channels & the steering axis is mixed in with opposite signs so pushing the steering axis right slows or reverses the right channel.
+# The axes are only shaped again when they move so an idle joystick costs one comparison per input cycle.
+# Channels with a throttle position of zero are left to the keyboard. The throttle positions are scaled by the current speed.
+def DetectJoystickMotion(LastMessage, JoystickState, JoystickThrottleAxis, JoystickSteeringAxis, JoystickDeadzone, JoystickExpo, JoystickInvertThrottle, MotorChannels, CurrentSpeed, Debug):
+  Axes = JoystickState['Axes']
+  RawAxes = (Axes[JoystickThrottleAxis], Axes[JoystickSteeringAxis])
+  # Shape the axes & mix the channels when the joystick has moved.
+  if RawAxes != JoystickState['LastAxes']:
+    Throttle = ShapeJoystickAxis(RawAxes[0], JoystickState['AxisCenters'][JoystickThrottleAxis], JoystickState['AxisScales'][JoystickThrottleAxis], JoystickDeadzone, JoystickExpo)
+    Steering = ShapeJoystickAxis(RawAxes[1], JoystickState['AxisCenters'][JoystickSteeringAxis], JoystickState['AxisScales'][JoystickSteeringAxis], JoystickDeadzone, JoystickExpo)
+    # Most joysticks report forward as a negative position.
+    if JoystickInvertThrottle == True and Throttle != 0:
+      Throttle = -Throttle
+    JoystickState['LastAxes'], JoystickState['Throttles'] = RawAxes, (max(-1.0, min(1.0, Throttle - Steering)), max(-1.0, min(1.0, Throttle + Steering)))
+    # Output the throttle position of each channel if Debug is set by configuration.
+    if Debug == True:
+      LastMessage = PrintMessage(LastMessage, 'Joystick Moved. \nRight Channel Throttle: '+str(round(JoystickState['Throttles'][0], 3))+'. \nLeft Channel Throttle: '+\
+        str(round(JoystickState['Throttles'][1], 3))+'.')
+  # Stage the direction & throttle position of each channel that the joystick is driving.
+  WriteSignedThrottles(MotorChannels, JoystickState['Throttles'], SpeedToThrottle(CurrentSpeed))
+  return LastMessage
+#--------------------
+
+#--------------------
+# Open a non-blocking UDP socket that receives fixed size command datagrams from remote operators.
+# Each datagram is 12 bytes in network byte order. The format is described by UDPCommandFormat in DetectUDPCommands().
+# Set UDPInputAddress & UDPInputPort to the address & port to listen on.
+# A fatal error is raised if the socket cannot be opened.
+def InitializeUDPInput(LastMessage, UDPInputAddress, UDPInputPort, Debug):
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Initializing UDP Input...')
+  UDPState = None
+  try:
+    import socket as Socket, struct as Struct
+    UDPSocket = Socket.socket(Socket.AF_INET, Socket.SOCK_DGRAM)
+    UDPSocket.setsockopt(Socket.SOL_SOCKET, Socket.SO_REUSEADDR, 1)
+    UDPSocket.bind((UDPInputAddress, UDPInputPort))
+    UDPSocket.setblocking(False)
+    # Magic, version, flags, sequence number, right channel throttle & left channel throttle.
+    UDPCommandFormat = Struct.Struct('!2sBBIhh')
+    # Receive into a reusable buffer that is one byte larger than a command so oversized datagrams can be detected.
+    Buffer = bytearray(UDPCommandFormat.size + 1)
+    UDPState = {'Name': 'UDP', 'Socket': UDPSocket, 'Format': UDPCommandFormat, 'Buffer': Buffer, 'View': memoryview(Buffer), 'Sequence': None, 'Throttles': (0.0, 0.0), 'Flags': 0, \
+      'LastCommand': 0.0, 'Active': False, 'Received': 0, 'Dropped': 0}
+  # Handle the exception that is raised if the socket cannot be opened.
+  except OSError as UDPError:
+    LastMessage = PrintError(16, 'Could not Open UDP Input Socket. \nCaptured Exception, '+str(UDPError)+'.', True)
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'UDP Input Initialized Successfully. \nListening On: '+str(UDPInputAddress)+':'+str(UDPInputPort)+'.')
+  return LastMessage, UDPState
+#--------------------
+
+#--------------------
+# Close the UDP socket opened by InitializeUDPInput. Datagrams that are still waiting are discarded.
+# Set Debug to True to output the number of commands received & dropped.
+def CloseUDPInput(LastMessage, UDPState, Debug):
+  UDPState['Socket'].close()
+  # Output the number of commands received & dropped if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'UDP Commands Received: '+str(UDPState['Received'])+'. \nUDP Commands Dropped: '+str(UDPState['Dropped'])+'.')
+  return LastMessage
+#--------------------
+
+#--------------------
+# Drain every datagram waiting on the UDP socket & stage the most recent command.
+# A command datagram contains the magic bytes RM, the protocol version 1, the flags, a 32 bit sequence number & a throttle position from -32767 to 32767 for the right & left channels.
+# Datagrams with a sequence number that is not newer than the last accepted command are dropped as duplicates or out of order. Sequence numbers wrap around.
+# Set flag 1 to stop all motors regardless of other input. Set flag 2 to reset the sequence number, such as when the sender restarts.
+# The command is held until UDPCommandTimeout seconds pass without a new command, after which the remote throttle positions return to zero.
+def DetectUDPCommands(LastMessage, UDPState, MotorChannels, UDPCommandTimeout, Time, Debug):
+  UDPSocket, UDPCommandFormat, Buffer, View, Now = UDPState['Socket'], UDPState['Format'], UDPState['Buffer'], UDPState['View'], Time.monotonic()
+  while True:
+    try:
+      Size = UDPSocket.recv_into(Buffer)
+    # Stop when no more datagrams are waiting.
+    except (BlockingIOError, InterruptedError):
+      break
+    # Drop datagrams that are not commands.
+    if Size != UDPCommandFormat.size or Buffer[0:2] != b'RM' or Buffer[2] != 1:
+      UDPState['Dropped'] = UDPState['Dropped'] + 1
+      continue
+    Magic, Version, Flags, Sequence, RightThrottle, LeftThrottle = UDPCommandFormat.unpack_from(View)
+    # Drop stale & out of order commands using serial number arithmetic.
+    if UDPState['Sequence'] is not None and Flags & 2 == 0 and not 0 < (Sequence - UDPState['Sequence']) % 4294967296 < 2147483648:
+      UDPState['Dropped'] = UDPState['Dropped'] + 1
+      continue
+    UDPState['Sequence'], UDPState['Flags'], UDPState['LastCommand'], UDPState['Received'] = Sequence, Flags, Now, UDPState['Received'] + 1
+    UDPState['Throttles'] = (max(-1.0, min(1.0, RightThrottle / 32767)), max(-1.0, min(1.0, LeftThrottle / 32767)))
+    # Output the first command after a timeout if Debug is set by configuration.
+    if Debug == True and UDPState['Active'] == False:
+      LastMessage = PrintMessage(LastMessage, 'UDP Command Received. \nSequence Number: '+str(Sequence)+'.')
+    UDPState['Active'] = True
+  # Stage the most recent command.
+  LastMessage = StageRemoteCommand(LastMessage, UDPState, MotorChannels, UDPCommandTimeout, Now, Debug)
+  return LastMessage
+#--------------------
+
+#--------------------
+# Stage the most recent command received from a remote input such as UDP or the control page.
+# The remote command is released when no command arrives before the timeout, after which the remote throttle positions return to zero.
+# Set RemoteState to the state of the remote input & CommandTimeout to the number of seconds a command is held. Set Now to the current monotonic time in seconds.
+# Commands with the stop flag set stop all motors regardless of other input.
+def StageRemoteCommand(LastMessage, RemoteState, MotorChannels, CommandTimeout, Now, Debug):
+  if RemoteState['Active'] == True and Now - RemoteState['LastCommand'] > CommandTimeout:
+    RemoteState['Active'], RemoteState['Throttles'], RemoteState['Flags'] = False, (0.0, 0.0), 0
+    if Debug == True:
+      LastMessage = PrintMessage(LastMessage, str(RemoteState['Name'])+' Command Timed Out.')
+  if RemoteState['Active'] == True:
+    # Stop all motors when the stop flag is set.
+    if RemoteState['Flags'] & 1 != 0:
+      for Channel in range(len(MotorChannels)):
+        for Pin in MotorChannels[Channel]:
+          WriteMotorPin(Pin, GPIO.LOW)
+    # Stage the direction & throttle position of each channel that the remote operator is driving.
+    else:
+      WriteSignedThrottles(MotorChannels, RemoteState['Throttles'], 1.0)
+  return LastMessage
+#--------------------
+
+#--------------------
+# Create a shared memory mailbox that co-located processes such as vision & planning can write commands to.
+# The mailbox is a 64 byte segment named by SharedMemoryName. The command record is protected by a sequence lock so it can be read without locks, system calls or serialization.
+# The record holds a 32 bit sequence number at offset 0, 32 bit flags at offset 4 & a 64 bit floating point throttle position from -1 to 1 for the right & left channels at offsets 8 & 16, all in native byte order.
+# A writer increments the sequence number to an odd value, writes the command & increments the sequence number to the next even value. Only one process may write at a time.
+# A sequence number of 0 means no command was written since the mailbox was cleared, so writers skip 0 when the sequence number wraps around.
+# The writer must run on the same computer as Robot Motion. Python provides no memory barriers, so the sequence lock relies on the stores of the writer becoming visible in order.
+# Commands are validated before they are applied so a record read out of order can never drive the motors outside of the throttle range.
+# Robot_Motion_Mailbox.py can be imported by other processes to write commands.
+# A fatal error is raised if the mailbox cannot be created.
+def InitializeMailbox(LastMessage, SharedMemoryName, Debug):
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Initializing Shared Memory Mailbox...')
+  MailboxState = None
+  try:
+    from multiprocessing import shared_memory as SharedMemory
+    try:
+      Segment = SharedMemory.SharedMemory(name=SharedMemoryName, create=True, size=64)
+    # Reuse a mailbox that was left behind by a previous run.
+    except FileExistsError:
+      Segment = SharedMemory.SharedMemory(name=SharedMemoryName)
+    if Segment.size < 64:
+      raise ValueError('The existing shared memory segment is too small')
+    # Clear the command record & map the sequence number, flags & throttle positions directly.
+    Segment.buf[:64] = bytes(64)
+    MailboxState = {'Name': 'Shared Memory', 'Segment': Segment, 'Words': Segment.buf[0:8].cast('I'), 'Values': Segment.buf[8:24].cast('d'), 'Sequence': -1, \
+      'Throttles': (0.0, 0.0), 'Flags': 0, 'LastCommand': 0.0, 'Active': False, 'Received': 0, 'Torn': 0, 'Rejected': 0}
+  # Handle the exception that is raised if the mailbox cannot be created.
+  except (ImportError, OSError, ValueError) as MailboxError:
+    LastMessage = PrintError(18, 'Could not Create Shared Memory Mailbox. \nCaptured Exception, '+str(MailboxError)+'.', True)
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Shared Memory Mailbox Initialized Successfully. \nMailbox Name: '+str(SharedMemoryName)+'.')
+  return LastMessage, MailboxState
+#--------------------
+
+#--------------------
+# Close the shared memory mailbox created by InitializeMailbox & remove the segment.
+# Unlike CloseMailbox in Robot_Motion_Mailbox.py, which only closes the writer's mapping, this unlinks the segment because Robot Motion created it. Writers that are still open keep their mapping until they close.
+# Set Debug to True to output the number of commands received, retried & rejected.
+def CloseMailbox(LastMessage, MailboxState, Debug):
+  # Release the mapped views before the segment is closed & removed.
+  MailboxState['Words'].release()
+  MailboxState['Values'].release()
+  MailboxState['Segment'].close()
+  MailboxState['Segment'].unlink()
+  # Output the number of commands received, retried & rejected if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Shared Memory Commands Received: '+str(MailboxState['Received'])+'. \nShared Memory Commands Retried: '+str(MailboxState['Torn'])+\
+      '. \nShared Memory Commands Rejected: '+str(MailboxState['Rejected'])+'.')
+  return LastMessage
+#--------------------
+
+#--------------------
+# Read the command record from the shared memory mailbox & stage the most recent command.
+# A command is new when the sequence number is even, not 0 & differs from the last accepted sequence number, which is -1 until a command is accepted.
+# A command that was overwritten while it was read is read again on the next input cycle.
+# Set flag 1 to stop all motors regardless of other input.
+# Commands with unknown flags or with a throttle position that is not a number from -1 to 1 are rejected, unless they stop all motors.
+# The command is held until SharedMemoryCommandTimeout seconds pass without a new command, after which the throttle positions return to zero.
+def DetectMailboxCommands(LastMessage, MailboxState, MotorChannels, SharedMemoryCommandTimeout, Time, Debug):
+  Words, Values, Now = MailboxState['Words'], MailboxState['Values'], Time.monotonic()
+  Sequence = Words[0]
+  if Sequence != MailboxState['Sequence'] and Sequence & 1 == 0 and Sequence != 0:
+    Flags, RightThrottle, LeftThrottle = Words[1], Values[0], Values[1]
+    # Discard the command if a writer started another write while it was read.
+    if Words[0] != Sequence:
+      MailboxState['Torn'] = MailboxState['Torn'] + 1
+    # Reject the command if it holds unknown flags or throttle positions outside of the throttle range. Not a number fails both comparisons.
+    elif Flags & ~1 != 0 or (Flags & 1 == 0 and not (-1.0 <= RightThrottle <= 1.0 and -1.0 <= LeftThrottle <= 1.0)):
+      MailboxState['Sequence'], MailboxState['Rejected'] = Sequence, MailboxState['Rejected'] + 1
+    else:
+      MailboxState['Sequence'], MailboxState['Flags'], MailboxState['LastCommand'], MailboxState['Received'] = Sequence, Flags, Now, MailboxState['Received'] + 1
+      MailboxState['Throttles'] = (RightThrottle, LeftThrottle) if Flags & 1 == 0 else (0.0, 0.0)
+      # Output the first command after a timeout if Debug is set by configuration.
+      if Debug == True and MailboxState['Active'] == False:
+        LastMessage = PrintMessage(LastMessage, 'Shared Memory Command Received. \nSequence Number: '+str(Sequence)+'.')
+      MailboxState['Active'] = True
+  # Stage the most recent command.
+  LastMessage = StageRemoteCommand(LastMessage, MailboxState, MotorChannels, SharedMemoryCommandTimeout, Now, Debug)
+  return LastMessage
+#--------------------
+
+#--------------------
+# Build the control page served by the web server.
+# The page shows an on screen joystick & a stop button. The joystick position is sent 20 times per second while it is held & a centered position is sent when it is released.
+def BuildWebControlPage(ApplicationName):
+  return ('<!DOCTYPE html><html><head><meta charset="utf-8"><meta name="viewport" content="width=device-width,initial-scale=1,user-scalable=no"><title>'+ApplicationName+'</title>'
+    '<style>body{margin:0;background:#222;color:#eee;font-family:sans-serif;text-align:center;touch-action:none;user-select:none}'
+    '#Pad{width:80vmin;height:80vmin;margin:4vmin auto;border-radius:50%;background:#444;position:relative}'
+    '#Knob{width:20%;height:20%;border-radius:50%;background:#0a0;position:absolute;left:40%;top:40%}'
+    'button{font-size:1.5em;width:60vmin;padding:2vmin;background:#a00;color:#fff;border:0}</style></head>'
+    '<body><p id="Status">Connecting...</p><div id="Pad"><div id="Knob"></div></div><button id="Stop">STOP</button><script>'
+    'var Status=document.getElementById("Status"),Pad=document.getElementById("Pad"),Knob=document.getElementById("Knob"),Socket,X=0,Y=0,Held=false;'
+    'function Connect(){Socket=new WebSocket((location.protocol=="https:"?"wss://":"ws://")+location.host+"/ws");'
+    'Socket.onopen=function(){Status.textContent="Connected"};Socket.onclose=function(){Status.textContent="Disconnected";setTimeout(Connect,1000)}}'
+    'function Send(Text){if(Socket.readyState==1){Socket.send(Text)}}'
+    'function Place(){Knob.style.left=(40+X*40)+"%";Knob.style.top=(40+Y*40)+"%"}'
+    'function Move(E){var R=Pad.getBoundingClientRect();X=Math.max(-1,Math.min(1,(E.clientX-R.left)/R.width*2-1));Y=Math.max(-1,Math.min(1,(E.clientY-R.top)/R.height*2-1));Place()}'
+    'function Release(){Held=false;X=0;Y=0;Place();Send("0 0")}'
+    'Pad.onpointerdown=function(E){Held=true;Pad.setPointerCapture(E.pointerId);Move(E)};Pad.onpointermove=function(E){if(Held){Move(E)}};'
+    'Pad.onpointerup=Pad.onpointercancel=Release;document.getElementById("Stop").onclick=function(){Held=false;X=0;Y=0;Place();Send("stop")};'
+    'setInterval(function(){if(Held){Send(X.toFixed(3)+" "+Y.toFixed(3))}},50);Connect();'
+    '</script></body></html>')
+#--------------------
+
+#--------------------
+# Serve a control page & a WebSocket endpoint that lets operators drive from a browser on a phone or laptop.
+# The server runs on an asyncio event loop in a background thread. The page streams the position of an on screen joystick which is shaped with JoystickDeadzone & JoystickExpo.
+# Set WebInputAddress & WebInputPort to the address & port to serve on.
+# Set WebSocketRateLimit to the number of commands per second accepted from each connection & WebSocketBurst to the number of commands accepted at once.
+# Commands that arrive faster are coalesced so only the most recent one is applied when the connection is allowed another command.
+# A fatal error is raised if the server cannot be started.
+def InitializeWebInput(LastMessage, WebInputAddress, WebInputPort, WebSocketRateLimit, WebSocketBurst, JoystickDeadzone, JoystickExpo, Threading, Debug):
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Initializing Web Input...')
+  WebState = {'Name': 'Web', 'Command': ((0.0, 0.0), 0, 0), 'CommandCount': 0, 'Throttles': (0.0, 0.0), 'Flags': 0, 'LastCommand': 0.0, 'Active': False, 'Owner': None, 'StagedCount': 0, \
+    'RateLimit': WebSocketRateLimit, 'Burst': WebSocketBurst, 'Deadzone': JoystickDeadzone, 'Expo': JoystickExpo, 'Connections': 0, 'Received': 0, 'Coalesced': 0}
+  try:
+    import asyncio as AsyncIO
+    WebState['Page'] = BuildWebControlPage(ApplicationName).encode()
+    # Start the server before the thread starts so a port that is in use is reported here.
+    Loop = AsyncIO.new_event_loop()
+    WebState['Loop'], WebState['AsyncIO'] = Loop, AsyncIO
+    WebState['Server'] = Loop.run_until_complete(AsyncIO.start_server(lambda Reader, Writer: HandleWebConnection(Reader, Writer, WebState), WebInputAddress, WebInputPort))
+    WebState['Thread'] = Threading.Thread(target=Loop.run_forever, name='Robot_Motion_Web', daemon=True)
+    WebState['Thread'].start()
+  # Handle the exception that is raised if the server cannot be started.
+  except (ImportError, OSError) as WebError:
+    LastMessage = PrintError(17, 'Could not Start Web Server. \nCaptured Exception, '+str(WebError)+'.', True)
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Web Input Initialized Successfully. \nControl Page: http://'+str(WebInputAddress)+':'+str(WebInputPort)+'/')
+  return LastMessage, WebState
+#--------------------
+
+#--------------------
+# Stop the event loop of the web server & wait up to one second for the server thread to finish before the server is closed.
+# Set Debug to True to output the number of commands received & coalesced.
+def CloseWebInput(LastMessage, WebState, Debug):
+  WebState['Loop'].call_soon_threadsafe(WebState['Loop'].stop)
+  WebState['Thread'].join(1)
+  WebState['Server'].close()
+  # Output the number of commands received & coalesced if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Web Commands Received: '+str(WebState['Received'])+'. \nWeb Commands Coalesced: '+str(WebState['Coalesced'])+'.')
+  return LastMessage
+#--------------------
+
+#--------------------
+# Handle a connection to the web server on the server thread.
+# The control page is served for / & requests for /ws are upgraded to a WebSocket connection. Other paths are answered with 404.
+# WebSocket requests sent by a page from another origin are refused with 403 so other pages open in a browser on the network cannot drive the robot.
+# Connections that send malformed requests or no request within 10 seconds are closed.
+async def HandleWebConnection(Reader, Writer, WebState):
+  import hashlib as HashLib, base64 as Base64
+  AsyncIO = WebState['AsyncIO']
+  try:
+    # Read the request line & headers. Connections that do not send a request promptly are closed.
+    Request = await AsyncIO.wait_for(Reader.readuntil(b'\r\n\r\n'), 10)
+    Lines = Request.decode('latin-1').split('\r\n')
+    Path = Lines[0].split(' ')[1] if len(Lines[0].split(' ')) > 2 else ''
+    Headers = {Line.split(':', 1)[0].strip().lower(): Line.split(':', 1)[1].strip() for Line in Lines[1:] if ':' in Line}
+    # Refuse WebSocket requests from pages served by another origin. Browsers always send the origin of the page, other clients may leave it out.
+    if Path == '/ws' and 'origin' in Headers and Headers['origin'].split('://', 1)[-1].lower() != Headers.get('host', '').lower():
+      Writer.write(b'HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+    # Upgrade requests for the WebSocket endpoint.
+    elif Path == '/ws' and Headers.get('upgrade', '').lower() == 'websocket' and 'sec-websocket-key' in Headers:
+      Accept = Base64.b64encode(HashLib.sha1((Headers['sec-websocket-key'] + '258EAFA5-E914-47DA-95CA-C5AB0DC85B11').encode()).digest()).decode()
+      Writer.write(('HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\nSec-WebSocket-Accept: '+Accept+'\r\n\r\n').encode())
+      await ServeWebSocket(Reader, Writer, WebState)
+    # Serve the control page.
+    elif Path == '/':
+      Page = WebState['Page']
+      Writer.write(('HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\nContent-Length: '+str(len(Page))+'\r\nCache-Control: no-store\r\nConnection: close\r\n\r\n').encode() + Page)
+    else:
+      Writer.write(b'HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+    await Writer.drain()
+  # Close connections that send malformed requests or disconnect.
+  except (AsyncIO.TimeoutError, AsyncIO.IncompleteReadError, AsyncIO.LimitOverrunError, ConnectionError, UnicodeDecodeError, ValueError, IndexError):
+    pass
+  finally:
+    Writer.close()
+#--------------------
+
+#--------------------
+# Read frames from a WebSocket connection on the server thread until the connection closes.
+# Each connection has a bucket of WebSocketBurst commands that refills at WebSocketRateLimit commands per second. Commands that arrive when the bucket is empty are coalesced.
+# Fragmented, binary, unmasked, reserved & oversized control frames are not supported & close the connection with the protocol error status 1002.
+# The motors are stopped when the connection that was driving closes.
+async def ServeWebSocket(Reader, Writer, WebState):
+  import struct as Struct
+  AsyncIO, Loop = WebState['AsyncIO'], WebState['Loop']
+  # Each connection starts with a full bucket of commands.
+  Connection = {'Tokens': float(WebState['Burst']), 'Refilled': Loop.time(), 'Pending': None, 'Flush': None, 'Skipped': 0}
+  WebState['Connections'] = WebState['Connections'] + 1
+  try:
+    while True:
+      # Read the frame header, the extended length & the mask of the next frame.
+      Header = await Reader.readexactly(2)
+      Opcode, Length = Header[0] & 0x0F, Header[1] & 0x7F
+      # Close connections that send frames the server does not support with a protocol error.
+      if Header[0] & 0xF0 != 0x80 or Header[1] & 0x80 == 0 or Opcode not in (1, 8, 9, 10) or (Opcode >= 8 and Length > 125):
+        Writer.write(b'\x88\x02\x03\xea')
+        break
+      if Length == 126:
+        Length = Struct.unpack('!H', await Reader.readexactly(2))[0]
+      elif Length == 127:
+        Length = Struct.unpack('!Q', await Reader.readexactly(8))[0]
+      # Close connections that send frames far larger than a command.
+      if Length > 1024:
+        break
+      Mask = await Reader.readexactly(4)
+      Payload = await Reader.readexactly(Length)
+      # Unmask the payload as one integer operation.
+      Payload = (int.from_bytes(Payload, 'big') ^ int.from_bytes((Mask * (Length // 4 + 1))[:Length], 'big')).to_bytes(Length, 'big')
+      # Close, ping & command frames.
+      if Opcode == 8:
+        Writer.write(b'\x88\x00')
+        break
+      elif Opcode == 9:
+        Writer.write(bytes((0x8A, Length)) + Payload)
+      elif Opcode == 1:
+        WebState['Received'] = WebState['Received'] + 1
+        # Refill the bucket for the time since the last command.
+        Now = Loop.time()
+        Connection['Tokens'], Connection['Refilled'] = min(float(WebState['Burst']), Connection['Tokens'] + (Now - Connection['Refilled']) * WebState['RateLimit']), Now
+        if Connection['Tokens'] >= 1 and Connection['Flush'] is None:
+          Connection['Tokens'] = Connection['Tokens'] - 1
+          ApplyWebCommand(WebState, Connection, Payload, Now)
+        else:
+          # Keep only the most recent command & apply it when the bucket has refilled.
+          if Connection['Pending'] is not None:
+            WebState['Coalesced'] = WebState['Coalesced'] + 1
+            Connection['Skipped'] = Connection['Skipped'] + 1
+          Connection['Pending'] = Payload
+          if Connection['Flush'] is None:
+            Connection['Flush'] = Loop.call_later((1 - Connection['Tokens']) / WebState['RateLimit'], FlushWebCommand, WebState, Connection)
+          # Slow down reading from connections that keep flooding so they cannot starve the other threads.
+          if Connection['Skipped'] >= WebState['Burst']:
+            Connection['Skipped'] = 0
+            await AsyncIO.sleep(1 / WebState['RateLimit'])
+  finally:
+    WebState['Connections'] = WebState['Connections'] - 1
+    if Connection['Flush'] is not None:
+      Connection['Flush'].cancel()
+    # Stop the motors if this connection was driving when it closed.
+    if WebState['Owner'] is Connection:
+      ApplyWebCommand(WebState, Connection, b'stop', Loop.time())
+#--------------------
+
+#--------------------
+# Apply the most recent coalesced command of a connection once its bucket has refilled.
+# This is scheduled on the event loop of the server thread by ServeWebSocket & uses up the command the bucket refilled with.
+def FlushWebCommand(WebState, Connection):
+  Now = WebState['Loop'].time()
+  Connection['Tokens'], Connection['Refilled'], Connection['Flush'], Connection['Skipped'] = max(0.0, Connection['Tokens'] + (Now - Connection['Refilled']) * WebState['RateLimit'] - 1), Now, None, 0
+  ApplyWebCommand(WebState, Connection, Connection['Pending'], Now)
+  Connection['Pending'] = None
+#--------------------
+
+#--------------------
+# Decode the joystick position sent by the control page & publish it to the main thread. Commands that cannot be decoded are ignored.
+# Set Payload to the X & Y position of the on screen joystick from -1 to 1 separated by a space, or to stop to stop all motors.
+# The connection that sent the command becomes the owner of the motors until another connection sends a command.
+def ApplyWebCommand(WebState, Connection, Payload, Now):
+  try:
+    if Payload == b'stop':
+      Throttles, Flags = (0.0, 0.0), 1
+    else:
+      X, Y = (float(Value) for Value in Payload.split())
+      # The page reports down as positive so the throttle is inverted.
+      Throttle = -ShapeJoystickAxis(Y, 0, 1, WebState['Deadzone'], WebState['Expo'])
+      Steering = ShapeJoystickAxis(X, 0, 1, WebState['Deadzone'], WebState['Expo'])
+      Throttles, Flags = (max(-1.0, min(1.0, Throttle - Steering)), max(-1.0, min(1.0, Throttle + Steering))), 0
+  except ValueError:
+    return
+  # Publish the command to the main thread as a single assignment.
+  WebState['Owner'], WebState['CommandCount'] = Connection, WebState['CommandCount'] + 1
+  WebState['Command'] = (Throttles, Flags, WebState['CommandCount'])
+#--------------------
+
+#--------------------
+# Stage the most recent command received from the control page.
+# The command is held until WebCommandTimeout seconds pass without a new command, after which the remote throttle positions return to zero.
+def DetectWebCommands(LastMessage, WebState, MotorChannels, WebCommandTimeout, Time, Debug):
+  Throttles, Flags, CommandCount = WebState['Command']
+  Now = Time.monotonic()
+  # Accept a command that has not been staged before.
+  if CommandCount != WebState['StagedCount']:
+    WebState['StagedCount'], WebState['Throttles'], WebState['Flags'], WebState['LastCommand'] = CommandCount, Throttles, Flags, Now
+    # Output the first command after a timeout if Debug is set by configuration.
+    if Debug == True and WebState['Active'] == False:
+      LastMessage = PrintMessage(LastMessage, 'Web Command Received. \nWeb Connections: '+str(WebState['Connections'])+'.')
+    WebState['Active'] = True
+  # Stage the most recent command.
+  LastMessage = StageRemoteCommand(LastMessage, WebState, MotorChannels, WebCommandTimeout, Now, Debug)
+  return LastMessage
+#--------------------
+
+#--------------------
+# Listen for motion requests from the user & call the appropriate procedure to accomplish it.
+def ListenForKeyboardRequests(LastMessage, Controller, DebugStops, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, MotionTable, MotionMask, Debug):
   # Detect any motion requests.
-  LastMessage, ExecutionDuration, CurrentSpeed, OriginalSpeed, Boosted = DetectKeyboardMotion(LastMessage, DebugStops, CurrentSpeed, OriginalSpeed, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, \
-    MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO, RightBoostAmount, RightReductionAmount, RightLimpBoostAmount, RightLimpReductionAmount, LeftBoostAmount, \
-    LeftReductionAmount, LeftLimpBoostAmount, LeftLimpReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRighKey, RightLimpLeftKey, \
-    LeftLimpRightKey, LeftLimpLeftKey, Boosted, ExecutionDuration, Time, KB, Debug)
-  return LastMessage, StartTime, ExecutionDuration, CurrentSpeed, OriginalSpeed, CurrentSensitivity, SensitivityCounter, SpeedCounter, Boosted
+  LastMessage = DetectKeyboardMotion(LastMessage, Controller, DebugStops, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, MotionTable, MotionMask, Debug)
+  return LastMessage
+#--------------------
+
+#--------------------
+# Listen for speed & sensitivity requests from the user & call the appropriate procedure to accomplish it.
+# Set Now to the current monotonic time in nanoseconds.
+# The sensitivity range, sensitivity change amount & repeat delays are passed in so the values reloaded from the configuration file are used.
+def ListenForKeyboardSettings(LastMessage, Controller, Now, MinimumSensitivity, MaximumSensitivity, SensitivityRepeatDelay, SensitivityChangeAmount, SpeedRepeatDelay, DwellDuration, \
+  BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, Debug):
+  # Detect any sensitivity & speed change requests.
+  LastMessage = DetectKeyboardSensitivityChange(LastMessage, Controller, Now, MinimumSensitivity, MaximumSensitivity, SensitivityRepeatDelay, SensitivityChangeAmount, \
+    IncreaseSensitivityKey, DecreaseSensitivityKey, DwellDuration, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, Debug)
+  LastMessage = DetectKeyboardSpeedChange(LastMessage, Controller, Now, SpeedRepeatDelay, DwellDuration, IncreaseSpeedKey, DecreaseSpeedKey, SpeedOneKey, SpeedTwoKey, \
+    SpeedThreeKey, SpeedFourKey, SpeedFiveKey, SpeedSixKey, SpeedSevenKey, SpeedEightKey, SpeedNineKey, SpeedTenKey, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, Debug)
+  return LastMessage
 #--------------------
 
 #--------------------
@@ -1008,84 +1813,1149 @@ def TrackLoops(LastMessage, EnableLoopTracking, LoopCounter, LoopTracker, LoopAn
   return LastMessage, LoopCounter, LoopTracker, BreakLoop
 #--------------------
 
+#--------------------
+# Measure the precision of the operating system sleep function.
+# The results are used to decide how long before each deadline the PWM thread stops sleeping & starts spin-waiting.
+# Set TimerCalibrationSamples to the number of sleeps to measure.
+# Set SpinWaitMargin to a negative number to use the calibrated margin, 0 to never spin-wait, or a number of seconds to spin-wait before each deadline.
+def CalibrateTimer(LastMessage, TimerCalibrationSamples, SpinWaitMargin, Time, Debug):
+  # Initialize lists to hold the measured durations.
+  Granularities, Overshoots, SampleCount = [], [], max(TimerCalibrationSamples, 1)
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Calibrating Timer...')
+  # Measure the shortest possible sleep & the overshoot of a short sleep.
+  while len(Overshoots) < SampleCount:
+    StartTime = Time.monotonic_ns()
+    Time.sleep(0.000001)
+    MiddleTime = Time.monotonic_ns()
+    Time.sleep(0.0002)
+    FinishTime = Time.monotonic_ns()
+    Granularities.append(MiddleTime - StartTime)
+    Overshoots.append(FinishTime - MiddleTime - 200000)
+  # Sort the measurements so percentiles can be read from them.
+  Granularities.sort()
+  Overshoots.sort()
+  # Consolidate the measurements.
+  TimerCalibration = {'ClockResolution': int(Time.get_clock_info('monotonic').resolution * 1000000000), 'SleepGranularity': Granularities[SampleCount // 2], \
+    'SleepOvershoot': Overshoots[SampleCount // 2], 'SleepOvershootP99': Overshoots[int((SampleCount - 1) * 0.99)], 'SleepOvershootMax': Overshoots[-1]}
+  # Determine the spin-wait margin to use.
+  if SpinWaitMargin < 0:
+    # Spin-wait long enough to absorb 99% of sleep overshoots.
+    SpinMargin = max(TimerCalibration['SleepOvershootP99'], 0)
+  else:
+    SpinMargin = int(SpinWaitMargin * 1000000000)
+  TimerCalibration['SpinMargin'] = SpinMargin
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Timer Calibrated Successfully. \nClock Resolution: '+str(TimerCalibration['ClockResolution'])+' ns. \nSleep Granularity: '+\
+      str(TimerCalibration['SleepGranularity'])+' ns. \nSleep Overshoot: '+str(TimerCalibration['SleepOvershoot'])+' ns typical, '+str(TimerCalibration['SleepOvershootP99'])+\
+      ' ns p99, '+str(TimerCalibration['SleepOvershootMax'])+' ns max. \nSpin-Wait Margin: '+str(SpinMargin)+' ns.')
+  return LastMessage, TimerCalibration, SpinMargin
+#--------------------
+
+#--------------------
+# Pause execution until an absolute deadline is reached.
+# Sleep until SpinMargin nanoseconds before the deadline & then spin-wait for the balance.
+# Set Deadline to a monotonic timestamp in nanoseconds.
+# Set SpinMargin to 0 to sleep for the entire duration & never spin-wait.
+def PauseUntil(Deadline, SpinMargin, Time):
+  # Calculate the amount of time remaining until the spin-wait must start.
+  SleepDuration = Deadline - SpinMargin - Time.monotonic_ns()
+  # Only sleep if the spin-wait has not already started.
+  if SleepDuration > 0:
+    Time.sleep(SleepDuration / 1000000000)
+  # Spin-wait for the balance of the duration.
+  if SpinMargin > 0:
+    while Time.monotonic_ns() < Deadline:
+      pass
+#--------------------
+
 #--------------------
 # Calculate the amount of sleep required to achieve the desired level of speed.
-def PauseExecution(LastMessage, StartTime, ExecutionDuration, DefaultDwellDuration, Time, CurrentSpeed):
-  # Stop timing execution of the current loop now.
-  FinishTime = Time.time()
-  # Calculate the amount of time that the current iteration of the loop has been running for.
-  ElapsedTime = StartTime - FinishTime
-  # Determine if the execution duration has elapsed already.
-  if ElapsedTime <= ExecutionDuration:
-    # Set an amount of time to pause execution to achieve the execution duration.
-    SleepDuration = ExecutionDuration - ElapsedTime
-    # Pause execution to wait for the execution duration to elapse.
-    Time.sleep(SleepDuration)
-  # If the execution duration has already elapsed don't pause execution at all.
+# Each motor channel has its own execution duration. Once per cycle the end of each execution duration is sorted into a timeline of edges.
+# The edges are executed in order so every channel gets its own duty cycle without any additional sleeping.
+# Every edge of every cycle is planned against an absolute deadline so timing errors cannot accumulate from one cycle to the next.
+# The start of each cycle is calculated from the CycleEpoch & CycleNumber so the long-run frequency matches DwellDuration.
+# Small overruns are absorbed by the following cycle. If a whole cycle is missed the schedule skips ahead to the next cycle boundary & waits for it to start.
+# This function is called by the PWM thread & must not print to the console.
+# Set CycleEpoch to the monotonic time in nanoseconds that the first cycle started at.
+# Set CycleNumber to the number of the cycle currently being executed.
+# Set ChannelTargets to the target state of each motor channel, as published by PublishPWMTarget().
+# Set SpinMargin to the number of nanoseconds to spin-wait before each deadline.
+# Set TimingStatistics to the timing statistics to record cycle start errors, execution duration errors & overruns in.
+# Set MessageQueue to the queue that is drained by the logging thread.
+# Set GCState to the state returned by InitializeGCControl(). Garbage is collected before waiting for the next cycle when EnableGCControl is set.
+def PauseExecution(LastMessage, CycleEpoch, CycleNumber, ChannelTargets, DwellDuration, SpinMargin, Time, TimingStatistics, MessageQueue, GCState):
+  # Record the time that the current cycle actually started.
+  CycleStartTime = Time.monotonic_ns()
+  # Convert the clock cycle to nanoseconds.
+  CycleDuration = DwellDuration * 1000000000
+  # Calculate the absolute deadline for the start of the current cycle.
+  CycleStart = CycleEpoch + int(CycleNumber * CycleDuration)
+  # Calculate the absolute deadline for the start of the next cycle.
+  CycleNumber = CycleNumber + 1
+  NextCycleStart = CycleEpoch + int(CycleNumber * CycleDuration)
+  # Build the timeline of edges for every channel that is active at partial speed.
+  Edges = []
+  for OnState, StopState, ExecutionTime, Pulsed in ChannelTargets:
+    # Calculate the absolute deadline for the end of the execution duration of this channel.
+    ExecutionDeadline = CycleStart + ExecutionTime
+    # Only channels with an execution duration that ends before the next cycle starts need to be deactivated.
+    if Pulsed == True and ExecutionDeadline < NextCycleStart:
+      Edges.append((ExecutionDeadline, StopState))
+  # Sort the edges so they are executed in order.
+  Edges.sort()
+  # Execute each edge in order.
+  Edge = 0
+  while Edge < len(Edges):
+    # Combine every channel that ends at the same deadline so they are deactivated with a single write.
+    ExecutionDeadline, ClearMask = Edges[Edge][0], 0
+    while Edge < len(Edges) and Edges[Edge][0] == ExecutionDeadline:
+      ClearMask, Edge = ClearMask | Edges[Edge][1][1], Edge + 1
+    # Pause execution to wait for the execution duration of these channels to elapse.
+    PauseUntil(ExecutionDeadline, SpinMargin, Time)
+    # If partial speed is specified then the motors of these channels must be disabled for the dwell duration.
+    OutputMotorState((0, ClearMask))
+    # Record how far the actual execution duration was from the requested execution duration.
+    if EnableTimingStatistics == True:
+      RecordHistogram(TimingStatistics['OnTimeError'], abs((Time.monotonic_ns() - CycleStartTime) - (ExecutionDeadline - CycleStart)))
+  # Record how late the current cycle started.
+  if EnableTimingStatistics == True:
+    RecordHistogram(TimingStatistics['PeriodError'], CycleStartTime - CycleStart)
+  # Determine if execution has overrun the current cycle.
+  CurrentTime = Time.monotonic_ns()
+  if CurrentTime > NextCycleStart:
+    TimingStatistics['Overruns'] = TimingStatistics['Overruns'] + 1
+  # Determine if execution has fallen behind by at least one entire cycle.
+  if CurrentTime >= NextCycleStart + CycleDuration:
+    # Skip the missed cycles & resume at the next cycle boundary.
+    SkippedCycles = int((CurrentTime - CycleEpoch) // CycleDuration) + 1 - CycleNumber
+    CycleNumber, TimingStatistics['SkippedCycles'] = CycleNumber + SkippedCycles, TimingStatistics['SkippedCycles'] + SkippedCycles
+    # Queue an error for the logging thread when a lag in execution is detected only if Debug is set by configuration.
+    if Debug == True:
+      LastMessage = QueueMessage(MessageQueue, 'Error 5: Execution Falling Behind. \nSkipped '+str(SkippedCycles)+' Cycles. \n'+str(TimingStatistics['Overruns'])+\
+        ' Overruns & '+str(TimingStatistics['SkippedCycles'])+' Skipped Cycles Since Startup.')
+    # Pause execution to wait for the cycle boundary that execution resumes at.
+    # The pulsed channels were already deactivated, so they stay off until that cycle starts & its execution deadlines are not stretched.
+    PauseUntil(CycleEpoch + int(CycleNumber * CycleDuration), SpinMargin, Time)
   else:
-    SleepDuration = 0
-  # Calculate current dwell duration based on how much of it the execution duration has already consumed.
-  DwellDuration = DefaultDwellDuration - SleepDuration
-  # Determine if full speed is specified.
-  if CurrentSpeed != 0:
-    # If partial speed is specified then the motors must be disabled for the dwell duration.
-    AllMotorsStop(MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO)
-  # Determine if the dwell duration is a positive number before we try to pause execution for that amount of time.
-  if DwellDuration < 0:
-    # Determine if partial speed is specified.
-    if CurrentSpeed != 0:
-      # Output an error when a lag in execution is detected only if Debug is set by configuration.
-      if Debug == True:
-        LastMessage = PrintError(5, 'Execution Falling Behind.', False)
+    # Collect garbage in the dwell window when the collector is controlled by configuration.
+    if GCState['Enabled'] == True:
+      CollectGarbage(GCState, NextCycleStart, SpinMargin, Time)
+    # Pause execution to wait for the next cycle to start.
+    PauseUntil(NextCycleStart, SpinMargin, Time)
+  # Count the cycle that was just completed.
+  TimingStatistics['Cycles'] = TimingStatistics['Cycles'] + 1
+  return LastMessage, CycleNumber
+#--------------------
+
+#--------------------
+# Create a fixed-size histogram of timing measurements.
+# Set BucketCount to the number of buckets. The last bucket collects every measurement that is too large for the others.
+# Set Resolution to the width of each bucket in nanoseconds.
+def CreateHistogram(BucketCount, Resolution):
+  return {'Buckets': [0] * max(BucketCount, 2), 'Resolution': max(Resolution, 1), 'Count': 0, 'Max': 0}
+#--------------------
+
+#--------------------
+# Record a timing measurement in a histogram.
+# Set Value to the measurement in nanoseconds. Negative measurements are recorded in the first bucket.
+def RecordHistogram(Histogram, Value):
+  # Determine which bucket the measurement belongs in.
+  Buckets, Bucket = Histogram['Buckets'], Value // Histogram['Resolution']
+  if Bucket < 0:
+    Bucket = 0
+  elif Bucket >= len(Buckets):
+    Bucket = len(Buckets) - 1
+  # Count the measurement.
+  Buckets[Bucket] = Buckets[Bucket] + 1
+  Histogram['Count'] = Histogram['Count'] + 1
+  # Track the largest measurement exactly.
+  if Value > Histogram['Max']:
+    Histogram['Max'] = Value
+#--------------------
+
+#--------------------
+# Read a percentile from a histogram.
+# Set Percentile to a number between 0 & 100.
+# Returns the upper edge of the bucket containing the percentile, in nanoseconds.
+def HistogramPercentile(Histogram, Percentile):
+  # Calculate how many measurements fall at or below the percentile.
+  Buckets, Target, Total = Histogram['Buckets'], Histogram['Count'] * Percentile / 100, 0
+  # Walk the buckets until the percentile is reached.
+  for Bucket in range(len(Buckets)):
+    Total = Total + Buckets[Bucket]
+    if Total >= Target and Total > 0:
+      # Measurements in the last bucket can be any size so report the largest one instead.
+      if Bucket == len(Buckets) - 1:
+        return Histogram['Max']
+      return min((Bucket + 1) * Histogram['Resolution'], Histogram['Max'])
+  return 0
+#--------------------
+
+#--------------------
+# Initialize the timing statistics collected by the PWM thread.
+# Set TimingHistogramSize to the number of buckets in each histogram.
+# Set TimingHistogramResolution to the width of each bucket in seconds.
+def InitializeTimingStatistics(TimingHistogramSize, TimingHistogramResolution):
+  Resolution = int(TimingHistogramResolution * 1000000000)
+  return {'PeriodError': CreateHistogram(TimingHistogramSize, Resolution), 'OnTimeError': CreateHistogram(TimingHistogramSize, Resolution), 'GCPause': CreateHistogram(TimingHistogramSize, Resolution), \
+    'Cycles': 0, 'Overruns': 0, 'SkippedCycles': 0, 'GCCollections': 0, 'GCOutsideWindow': 0}
+#--------------------
+
+#--------------------
+# Print a report of the timing statistics collected by the PWM thread.
+# Compare the reported errors with DwellDuration to determine if the Raspberry Pi can achieve the configured frequency.
+def PrintTimingStatistics(TimingStatistics, DwellDuration):
+  # Build a line of the report for each histogram.
+  ReportText = 'Timing Statistics After '+str(TimingStatistics['Cycles'])+' Cycles At '+str(round(1 / DwellDuration, 2))+' Hz.'
+  for Name, Label in (('PeriodError', 'Cycle Start Error'), ('OnTimeError', 'Execution Duration Error'), ('GCPause', 'Garbage Collection Pause')):
+    Histogram = TimingStatistics[Name]
+    ReportText = ReportText+' \n'+Label+': p50 '+str(HistogramPercentile(Histogram, 50) // 1000)+' us, p99 '+str(HistogramPercentile(Histogram, 99) // 1000)+\
+      ' us, max '+str(Histogram['Max'] // 1000)+' us, '+str(Histogram['Count'])+' samples.'
+  ReportText = ReportText+' \nOverruns: '+str(TimingStatistics['Overruns'])+'. \nSkipped Cycles: '+str(TimingStatistics['SkippedCycles'])+'. \nGarbage Collections Outside The Dwell Window: '+\
+    str(TimingStatistics['GCOutsideWindow'])+'.'
+  PrintText(ReportText)
+  return ReportText
+#--------------------
+
+#--------------------
+# Look up the target motor state & execution duration of a motor channel from the pending motor state.
+# The motor state is looked up from the channel states built by InitializeThreads() so no bitmasks are built.
+# A channel with no execution duration stays stopped.
+def LookupChannelTarget(PendingMotorState, PendingChannelThrottles, MotorChannels, ChannelStates, DutyTable, Channel):
+  # Look up the execution duration for the throttle position requested for this channel.
+  ExecutionTime, Pins = ThrottleToExecutionTime(DutyTable, PendingChannelThrottles[Channel]), MotorChannels[Channel]
+  if ExecutionTime > 0:
+    return ChannelStates[Channel][(PendingMotorState[Pins[0]] == GPIO.HIGH) * 2 + (PendingMotorState[Pins[1]] == GPIO.HIGH)], ExecutionTime
+  return ChannelStates[Channel][0], ExecutionTime
+#--------------------
+
+#--------------------
+# Publish the pending motor state to the PWM thread.
+# The target state contains the motor state, stop state, execution duration in nanoseconds & a pulsed flag for each motor channel.
+# Motor states are published as bitmasks so the PWM thread can write all motor pins at once.
+# Channels that are inactive or running at full throttle are not pulsed.
+# The target state is replaced with a single assignment so the PWM thread never reads a partially updated state.
+# The target state is only replaced when it has changed so a held key or idle keyboard allocates nothing.
+def PublishPWMTarget(PWMTarget, PendingMotorState, PendingChannelThrottles, MotorChannels, ChannelStates, CurrentSpeed, DutyTable):
+  # Determine if the clock cycle has changed since the target state was last published.
+  DwellDuration, ChannelTargets = PWMTarget[0]
+  Changed, Channel = DwellDuration != DutyTable['DwellDuration'], 0
+  # Determine if the target state of any channel has changed.
+  while Channel < len(MotorChannels) and Changed == False:
+    OnState, ExecutionTime = LookupChannelTarget(PendingMotorState, PendingChannelThrottles, MotorChannels, ChannelStates, DutyTable, Channel)
+    Changed, Channel = ChannelTargets[Channel][0] != OnState or ChannelTargets[Channel][2] != ExecutionTime, Channel + 1
+  if Changed == True:
+    # Initialize a list to hold the target state of each channel & look up the length of the clock cycle.
+    ChannelTargets, CycleDuration = [], DutyTable['ExecutionTimes'][-1]
+    for Channel in range(len(MotorChannels)):
+      OnState, ExecutionTime = LookupChannelTarget(PendingMotorState, PendingChannelThrottles, MotorChannels, ChannelStates, DutyTable, Channel)
+      # Determine if this channel must be deactivated part way through the cycle.
+      ChannelTargets.append((OnState, ChannelStates[Channel][0], ExecutionTime, ExecutionTime < CycleDuration and OnState[0] != 0))
+    # Replace the target state read by the PWM thread along with the clock cycle that the duty table was built for.
+    PWMTarget[0] = (DutyTable['DwellDuration'], tuple(ChannelTargets))
+  # Reset the pending motor state & throttle position of each channel so the next cycle starts with all motors stopped at the current speed.
+  Channel = 0
+  while Channel < len(MotorChannels):
+    PendingMotorState[MotorChannels[Channel][0]], PendingMotorState[MotorChannels[Channel][1]], PendingChannelThrottles[Channel] = GPIO.LOW, GPIO.LOW, SpeedToThrottle(CurrentSpeed)
+    Channel = Channel + 1
+  return PWMTarget
+#--------------------
+
+#--------------------
+# Queue a message to be printed to the console by the logging thread.
+# Messages are dropped if the logging thread falls too far behind.
+def QueueMessage(MessageQueue, MessageText):
+  try:
+    MessageQueue.put_nowait(MessageText)
+  # Handle the exception that is raised if the message queue is full.
+  except Queue.Full:
+    pass
+  return MessageText
+#--------------------
+
+#--------------------
+# The logging thread.
+# Print messages queued by other threads until a message of None is received.
+def LogThreadLoop(MessageQueue):
+  # Wait for messages & print them to the console as they arrive.
+  MessageText = MessageQueue.get()
+  while MessageText is not None:
+    PrintText(MessageText)
+    MessageText = MessageQueue.get()
+#--------------------
+
+#--------------------
+# Prepare the process for real-time operation of the PWM thread.
+# Lock all current & future memory to avoid page faults, select the CPU core for the PWM thread & move the other threads off of that core.
+# Set RealTimeCPU to the CPU core for the PWM thread or -1 to use the first isolated core, or the last core if no cores are isolated.
+# Returns a dictionary containing the selected core & a report of whether each setting took effect.
+def InitializeRealTime(LastMessage, RealTimeCPU, Debug):
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Initializing Real-Time Mode...')
+  import os as OS
+  RealTimeState = {'CPU': None, 'Report': {}}
+  # Lock all current & future memory with mlockall(MCL_CURRENT | MCL_FUTURE).
+  try:
+    import ctypes as CTypes
+    LibC = CTypes.CDLL(None, use_errno=True)
+    if LibC.mlockall(3) == 0:
+      RealTimeState['Report']['Memory Lock'] = 'Enabled'
+    else:
+      RealTimeState['Report']['Memory Lock'] = 'Failed, '+OS.strerror(CTypes.get_errno())
+  # Handle the exception that is raised if mlockall is not available.
+  except (ModuleNotFoundError, OSError, AttributeError) as RealTimeError:
+    RealTimeState['Report']['Memory Lock'] = 'Failed, '+str(RealTimeError)
+  # Select the CPU core for the PWM thread.
+  try:
+    AvailableCPUs = OS.sched_getaffinity(0)
+    CPU = RealTimeCPU
+    if CPU < 0:
+      # Use the first isolated core if there is one.
+      try:
+        with open('/sys/devices/system/cpu/isolated') as IsolatedFile:
+          IsolatedCPUs = [int(Core.split('-')[0]) for Core in IsolatedFile.read().strip().split(',') if Core != '']
+      except (OSError, ValueError):
+        IsolatedCPUs = []
+      IsolatedCPUs = [Core for Core in IsolatedCPUs if Core in AvailableCPUs]
+      CPU = IsolatedCPUs[0] if IsolatedCPUs else max(AvailableCPUs)
+    if CPU not in AvailableCPUs:
+      RealTimeState['Report']['CPU Pinning'] = 'Failed, CPU '+str(CPU)+' is not available'
+    else:
+      RealTimeState['CPU'] = CPU
+      # Move the main & logging threads off of the core used by the PWM thread when there is another core to use.
+      if len(AvailableCPUs) > 1:
+        OS.sched_setaffinity(0, AvailableCPUs - {CPU})
+        RealTimeState['Report']['Other Threads'] = 'Moved to CPU '+', '.join(str(Core) for Core in sorted(OS.sched_getaffinity(0)))
+      else:
+        RealTimeState['Report']['Other Threads'] = 'Not moved, only one CPU is available'
+  # Handle the exception that is raised if CPU affinity is not supported.
+  except (OSError, AttributeError) as RealTimeError:
+    RealTimeState['Report']['CPU Pinning'] = 'Failed, '+str(RealTimeError)
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Real-Time Mode Initialized Successfully.')
+  return LastMessage, RealTimeState
+#--------------------
+
+#--------------------
+# Apply the real-time settings to the thread that calls this function.
+# Pin the thread to the CPU core selected by InitializeRealTime() & set the SCHED_FIFO scheduling policy.
+# Each setting is read back to confirm it took effect & the report is queued for the logging thread.
+def EnterRealTime(RealTimeState, RealTimePriority, MessageQueue):
+  import os as OS
+  Report = RealTimeState['Report']
+  # Pin the thread to the selected CPU core.
+  if RealTimeState['CPU'] is not None:
+    try:
+      OS.sched_setaffinity(0, {RealTimeState['CPU']})
+      if OS.sched_getaffinity(0) == {RealTimeState['CPU']}:
+        Report['CPU Pinning'] = 'Enabled on CPU '+str(RealTimeState['CPU'])
+      else:
+        Report['CPU Pinning'] = 'Failed, the thread is running on CPU '+', '.join(str(Core) for Core in sorted(OS.sched_getaffinity(0)))
+    # Handle the exception that is raised if the CPU affinity cannot be set.
+    except (OSError, AttributeError) as RealTimeError:
+      Report['CPU Pinning'] = 'Failed, '+str(RealTimeError)
+  # Set the real-time scheduling policy.
+  try:
+    OS.sched_setscheduler(0, OS.SCHED_FIFO, OS.sched_param(RealTimePriority))
+    if OS.sched_getscheduler(0) == OS.SCHED_FIFO:
+      Report['Scheduler'] = 'Enabled SCHED_FIFO at priority '+str(OS.sched_getparam(0).sched_priority)
+    else:
+      Report['Scheduler'] = 'Failed, the scheduling policy did not change'
+  # Handle the exception that is raised if the scheduling policy cannot be set.
+  except (OSError, AttributeError) as RealTimeError:
+    Report['Scheduler'] = 'Failed, '+str(RealTimeError)
+  # Queue the report for the logging thread.
+  QueueMessage(MessageQueue, 'Real-Time Mode Report. \n'+' \n'.join(Setting+': '+Result+'.' for Setting, Result in Report.items()))
+  return Report
+#--------------------
+
+#--------------------
+# Prepare the garbage collector & record the duration of every collection in the timing statistics.
+# When EnableGCControl is set the objects created at startup are frozen out of the collector & automatic collection is disabled.
+# Garbage is then only collected by CollectGarbage() in the dwell window of the PWM thread.
+# Returns a dictionary containing the collector & the state of the current dwell window.
+def InitializeGCControl(LastMessage, EnableGCControl, GCMinimumWindow, TimingStatistics, Time, Debug):
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Initializing Garbage Collection Control...')
+  import gc as GC
+  GCState = {'GC': GC, 'Enabled': EnableGCControl, 'MinimumWindow': int(GCMinimumWindow * 1000000000), 'Thresholds': GC.get_threshold(), 'MaxPause': [0, 0, 0], \
+    'WindowEnd': 0, 'StartTime': 0}
+  if EnableGCControl == True:
+    # Collect the garbage created at startup & move every surviving object into the permanent generation so it is never scanned again.
+    GC.collect()
+    GC.freeze()
+    # Stop the interpreter from collecting garbage in the middle of a cycle.
+    GC.disable()
+  # Record the duration of every later collection, including collections started by other threads or by the interpreter.
+  GC.callbacks.append(lambda Phase, Info: RecordGCPause(GCState, TimingStatistics, Phase, Info, Time))
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Garbage Collection Control Initialized Successfully. \nAutomatic Collection: '+('Disabled' if EnableGCControl == True else 'Enabled')+\
+      '. \nFrozen Objects: '+str(GC.get_freeze_count())+'.')
+  return LastMessage, GCState
+#--------------------
+
+#--------------------
+# Record the duration of a garbage collection.
+# This function is called by the garbage collector at the start & stop of every collection & must not print to the console.
+# Collections that do not finish inside the dwell window of the PWM thread are counted separately.
+def RecordGCPause(GCState, TimingStatistics, Phase, Info, Time):
+  if Phase == 'start':
+    GCState['StartTime'] = Time.monotonic_ns()
+  else:
+    StopTime = Time.monotonic_ns()
+    Pause, Generation = StopTime - GCState['StartTime'], Info['generation']
+    RecordHistogram(TimingStatistics['GCPause'], Pause)
+    TimingStatistics['GCCollections'] = TimingStatistics['GCCollections'] + 1
+    # Remember the longest collection of each generation so later collections are only started in windows that can hold them.
+    if Pause > GCState['MaxPause'][Generation]:
+      GCState['MaxPause'][Generation] = Pause
+    # Count the collection if it was not started in a dwell window or overran the start of the next cycle.
+    if GCState['WindowEnd'] == 0 or StopTime > GCState['WindowEnd']:
+      TimingStatistics['GCOutsideWindow'] = TimingStatistics['GCOutsideWindow'] + 1
+#--------------------
+
+#--------------------
+# Select the oldest generation of the garbage collector that is due to be collected.
+# Follows the rules of the automatic collector. A generation is due once its count exceeds its threshold.
+# Returns -1 if no generation is due.
+def SelectGCGeneration(Counts, Thresholds):
+  Generation = 2
+  while Generation >= 0:
+    if Thresholds[Generation] > 0 and Counts[Generation] > Thresholds[Generation]:
+      return Generation
+    Generation = Generation - 1
+  return -1
+#--------------------
+
+#--------------------
+# Collect garbage in the dwell window of the PWM thread.
+# Only collect if a generation is due & the time remaining before WindowEnd can hold the longest collection of that generation measured so far.
+# This function is called by the PWM thread after every channel has been deactivated & must not print to the console.
+# Set WindowEnd to the monotonic time in nanoseconds that the next cycle starts at.
+def CollectGarbage(GCState, WindowEnd, SpinMargin, Time):
+  GC = GCState['GC']
+  Generation = SelectGCGeneration(GC.get_count(), GCState['Thresholds'])
+  if Generation >= 0 and WindowEnd - SpinMargin - Time.monotonic_ns() >= max(GCState['MinimumWindow'], GCState['MaxPause'][Generation]):
+    GCState['WindowEnd'] = WindowEnd
+    GC.collect(Generation)
+    GCState['WindowEnd'] = 0
+#--------------------
+
+#--------------------
+# Decide which pulsed channels are active for an entire cycle using sigma-delta modulation.
+# Each channel accumulates its execution duration every cycle & is active for the whole cycle whenever the accumulated time reaches one clock cycle.
+# The average time that each channel is active matches its execution duration while the motors only switch at cycle boundaries.
+# Returns the combined motor state of every channel as a tuple of (SetMask, ClearMask).
+def ModulateSigmaDelta(ChannelTargets, Accumulators, CycleDuration):
+  SetMask, ClearMask = 0, 0
+  for Channel in range(len(ChannelTargets)):
+    OnState, StopState, ExecutionTime, Pulsed = ChannelTargets[Channel]
+    if Pulsed == True:
+      # Accumulate the execution duration of this channel.
+      Accumulators[Channel] = Accumulators[Channel] + ExecutionTime
+      # Activate the channel for this cycle if a whole clock cycle has been accumulated.
+      if Accumulators[Channel] >= CycleDuration:
+        Accumulators[Channel] = Accumulators[Channel] - CycleDuration
+      else:
+        OnState = StopState
+    else:
+      # Channels that are stopped or at full throttle start accumulating from zero when they are pulsed again.
+      Accumulators[Channel] = 0
+    SetMask, ClearMask = SetMask | OnState[0], ClearMask | OnState[1]
+  return SetMask, ClearMask
+#--------------------
+
+#--------------------
+# The PWM thread.
+# Generate the duty cycle for the motors from the most recently published target state until StopEvent is set.
+# This thread only reads the target state & never polls for input or prints to the console.
+def PWMThreadLoop(PWMTarget, StopEvent, MessageQueue, TimingStatistics, StoppedMotorState, SpinMargin, RealTimeState, GCState, Time):
+  # Apply the real-time settings to this thread when enabled by configuration.
+  if RealTimeState is not None:
+    EnterRealTime(RealTimeState, RealTimePriority, MessageQueue)
+  # Start the first cycle now.
+  LastMessage, CycleEpoch, CycleNumber, CycleDwellDuration = 'Init', Time.monotonic_ns(), 0, PWMTarget[0][0]
+  # Initialize the sigma-delta accumulator of each channel & convert the clock cycle to nanoseconds.
+  Accumulators, CycleDuration = [0] * len(PWMTarget[0][1]), int(CycleDwellDuration * 1000000000)
+  # Start the loop which defines the timings of the electronic speed control (ESC).
+  while not StopEvent.is_set():
+    # Read the target state & clock cycle once per cycle.
+    DwellDuration, ChannelTargets = PWMTarget[0]
+    # Restart the cycle count at the start of the current cycle if the clock cycle has changed.
+    if DwellDuration != CycleDwellDuration:
+      CycleEpoch, CycleNumber, CycleDwellDuration = CycleEpoch + int(CycleNumber * CycleDwellDuration * 1000000000), 0, DwellDuration
+      Accumulators, CycleDuration = [0] * len(ChannelTargets), int(DwellDuration * 1000000000)
+    if ModulationMode == 'SigmaDelta':
+      # Decide which channels are active for the whole cycle.
+      SetMask, ClearMask = ModulateSigmaDelta(ChannelTargets, Accumulators, CycleDuration)
+      # Activate the motors requested by the target state.
+      OutputMotorState((SetMask, ClearMask))
+      # Wait for the next cycle without deactivating any channels part way through the cycle.
+      LastMessage, CycleNumber = PauseExecution(LastMessage, CycleEpoch, CycleNumber, (), DwellDuration, SpinMargin, Time, TimingStatistics, MessageQueue, GCState)
+    else:
+      # Combine the motor state of every channel so all motors are activated with a single write.
+      SetMask, ClearMask = 0, 0
+      for OnState, StopState, ExecutionTime, Pulsed in ChannelTargets:
+        SetMask, ClearMask = SetMask | OnState[0], ClearMask | OnState[1]
+      # Activate the motors requested by the target state.
+      OutputMotorState((SetMask, ClearMask))
+      # Throttle each motor channel according to the target state & configuration settings.
+      LastMessage, CycleNumber = PauseExecution(LastMessage, CycleEpoch, CycleNumber, ChannelTargets, DwellDuration, SpinMargin, Time, TimingStatistics, MessageQueue, GCState)
+  # Deactivate all motors before the thread exits.
+  OutputMotorState(StoppedMotorState)
+#--------------------
+
+#--------------------
+# Initialize & start the PWM & logging threads.
+def InitializeThreads(LastMessage, MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO, CurrentSpeed, \
+  DwellDuration, SpinMargin, TimingStatistics, RealTimeState, GCState, MessageQueueSize, Threading, Queue, Time, Debug):
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Initializing PWM Thread...')
+  # Define the GPIO pins of each motor channel. Motor channel one is the right channel & motor channel two is the left channel.
+  MotorChannels = ((MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO), (MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO))
+  # Define every motor state of each channel, indexed by the value of the positive pin times two plus the value of the negative pin.
+  ChannelStates = tuple(tuple(MotorStateToMask(((Channel[0], GPIO.HIGH if State & 2 else GPIO.LOW), (Channel[1], GPIO.HIGH if State & 1 else GPIO.LOW))) for State in range(4)) \
+    for Channel in MotorChannels)
+  # Define the motor states that deactivate each channel & all motors.
+  StoppedChannelStates = tuple(States[0] for States in ChannelStates)
+  StoppedMotorState = MotorStateToMask((Pin, GPIO.LOW) for Channel in MotorChannels for Pin in Channel)
+  # Initialize the pending motor state, the pending channel throttle positions & the target state to all motors stopped.
+  PendingMotorState, PendingChannelThrottles = {Pin: GPIO.LOW for Channel in MotorChannels for Pin in Channel}, [SpeedToThrottle(CurrentSpeed)] * len(MotorChannels)
+  PWMTarget = [(DwellDuration, tuple((StoppedChannelState, StoppedChannelState, 0, False) for StoppedChannelState in StoppedChannelStates))]
+  # Initialize the message queue & the event used to stop the PWM thread.
+  MessageQueue, StopEvent = Queue.Queue(MessageQueueSize), Threading.Event()
+  # Start the logging thread.
+  LogThread = Threading.Thread(target=LogThreadLoop, args=(MessageQueue,), name='Robot_Motion_Log', daemon=True)
+  LogThread.start()
+  # Start the PWM thread.
+  PWMThread = Threading.Thread(target=PWMThreadLoop, args=(PWMTarget, StopEvent, MessageQueue, TimingStatistics, StoppedMotorState, SpinMargin, RealTimeState, GCState, Time), name='Robot_Motion_PWM', daemon=True)
+  PWMThread.start()
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'PWM Thread Initialized Successfully.')
+  return LastMessage, MotorChannels, ChannelStates, StoppedMotorState, PendingMotorState, PendingChannelThrottles, PWMTarget, MessageQueue, StopEvent, LogThread, PWMThread
+#--------------------
+
+#--------------------
+# Stop the PWM & logging threads.
+# The PWM thread deactivates all motors before it exits.
+def StopThreads(StopEvent, MessageQueue, PWMThread, LogThread):
+  # Signal the PWM thread to stop & wait for it to finish the current cycle.
+  StopEvent.set()
+  PWMThread.join()
+  # Signal the logging thread to stop after it prints any remaining messages.
+  MessageQueue.put(None)
+  LogThread.join()
+#--------------------
+
+#--------------------
+# Initialize the cooperative scheduler that runs the tasks of the main loop at their own rates.
+# Set TaskRates to a tuple of the name & rate in Hz of each task. A task with a rate of 0 runs on every iteration of the main loop.
+# The PWM thread keeps its own clock & is only listed so its rate is reported alongside the tasks.
+# Returns a dictionary containing the period & next run time of each task in nanoseconds.
+def InitializeScheduler(LastMessage, TaskRates, DwellDuration, Time, Debug):
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Initializing Scheduler...')
+  Now, Scheduler = Time.monotonic_ns(), {'Tasks': {}}
+  for Name, Rate in TaskRates:
+    Scheduler['Tasks'][Name] = {'Period': int(1000000000 / Rate) if Rate > 0 else 0, 'NextRun': Now}
+  # Keep the tasks in a tuple so the next run time can be found without building an iterator.
+  Scheduler['Order'] = tuple(Scheduler['Tasks'].values())
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Scheduler Initialized Successfully. \nPWM: '+str(round(1 / DwellDuration, 2))+' Hz.'+''.join(' \n'+Name+': '+\
+      (str(round(Rate, 2))+' Hz.' if Rate > 0 else 'Every Iteration.') for Name, Rate in TaskRates))
+  return LastMessage, Scheduler
+#--------------------
+
+#--------------------
+# Change the rate of a task in Hz. The next run time of the task is not changed.
+def SetTaskRate(Scheduler, Name, Rate):
+  Scheduler['Tasks'][Name]['Period'] = int(1000000000 / Rate) if Rate > 0 else 0
+#--------------------
+
+#--------------------
+# Determine if a task is due to run & schedule its next run.
+# Runs are scheduled against the previous run time so the long-run rate matches the declared rate.
+# If a task falls behind by a whole period the missed runs are skipped instead of being run back to back.
+# Set Now to the current monotonic time in nanoseconds.
+def TaskDue(Scheduler, Name, Now):
+  Task = Scheduler['Tasks'][Name]
+  if Now < Task['NextRun']:
+    return False
+  NextRun = Task['NextRun'] + Task['Period']
+  if NextRun <= Now:
+    NextRun = Now + Task['Period']
+  Task['NextRun'] = NextRun
+  return True
+#--------------------
+
+#--------------------
+# Pause the main loop until the next task is due.
+# Tasks that run on every iteration of the main loop do not shorten the pause.
+def PauseScheduler(Scheduler, Time):
+  # Find the earliest next run time of every task with a rate.
+  Tasks, Task, NextRun = Scheduler['Order'], 0, None
+  while Task < len(Tasks):
+    if Tasks[Task]['Period'] > 0 and (NextRun is None or Tasks[Task]['NextRun'] < NextRun):
+      NextRun = Tasks[Task]['NextRun']
+    Task = Task + 1
+  # Pause for the balance of the time until the next task is due if there is any left.
+  if NextRun is not None:
+    PauseDuration = NextRun - Time.monotonic_ns()
+    if PauseDuration > 0:
+      Time.sleep(PauseDuration / 1000000000)
+#--------------------
+
+#--------------------
+# Measure the cost of reading the pressed keys & writing every motor pin.
+# Returns the 90th percentile of the measured cost in nanoseconds.
+# Only call this function before the PWM thread is started.
+def MeasureLoopCost(LastMessage, AutoTuneSamples, KeyState, KeyMasks, OutputBackend, StoppedMotorState, Time, KB, Debug):
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Measuring Loop Cost...')
+  # Measure one input poll plus output at a time.
+  Costs = []
+  for Sample in range(max(AutoTuneSamples, 1)):
+    StartTime = Time.monotonic_ns()
+    ReadKeyState(KeyState, KeyMasks, KB)
+    # Write directly to the backend so the shadow register does not hide the cost of the write.
+    OutputBackend['Write'](OutputBackend, StoppedMotorState[0], StoppedMotorState[1])
+    Costs.append(Time.monotonic_ns() - StartTime)
+  # Use a high percentile so occasional interruptions do not dominate the result.
+  Costs.sort()
+  LoopCost = Costs[int(len(Costs) * 0.9)]
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Loop Cost Measured Successfully. \nThe Loop Cost is '+str(LoopCost // 1000)+' us. \nThe Longest Sample is '+str(Costs[-1] // 1000)+' us.')
+  return LastMessage, LoopCost
+#--------------------
+
+#--------------------
+# Select the shortest clock cycle that leaves enough headroom for the measured loop cost.
+# The clock cycle is always a whole number of Hz between AutoTuneMinimumFrequency & AutoTuneMaximumFrequency.
+# A longer clock cycle is selected immediately. A shorter clock cycle is only selected if it is at least 25% shorter than DwellDuration so the frequency does not oscillate.
+# Set DwellDuration to 0 to select a clock cycle without comparing it to the current one.
+def SelectDwellDuration(LoopCost, DwellDuration, AutoTuneHeadroom, AutoTuneMinimumFrequency, AutoTuneMaximumFrequency):
+  # Calculate the highest frequency that leaves enough headroom for the loop cost.
+  Frequency = int(1000000000 / max(LoopCost * AutoTuneHeadroom, 1))
+  # Keep the frequency within the boundaries set by configuration.
+  Frequency = min(max(Frequency, AutoTuneMinimumFrequency), AutoTuneMaximumFrequency)
+  TargetDwellDuration = 1 / Frequency
+  # Determine if the clock cycle must change.
+  if TargetDwellDuration > DwellDuration or TargetDwellDuration < DwellDuration / 1.25:
+    DwellDuration = TargetDwellDuration
+  return DwellDuration
+#--------------------
+
+#--------------------
+# Track the cost of the input loop & adjust the clock cycle every AutoTuneInterval seconds.
+# Overruns & skipped cycles in the PWM thread indicate that the system has slowed down & the clock cycle is lengthened.
+def TuneDwellDuration(LastMessage, AutoTuneState, StartTime, DwellDuration, TimingStatistics, AutoTuneHeadroom, AutoTuneMinimumFrequency, AutoTuneMaximumFrequency, AutoTuneInterval, Time, Debug):
+  # Record the cost of the current input cycle.
+  RecordHistogram(AutoTuneState['Histogram'], Time.monotonic_ns() - StartTime)
+  # Determine if it is time to adjust the clock cycle.
+  CurrentTime = Time.monotonic()
+  if CurrentTime - AutoTuneState['LastTune'] >= AutoTuneInterval:
+    # Use a high percentile of the input cycles since the last adjustment as the loop cost.
+    LoopCost = HistogramPercentile(AutoTuneState['Histogram'], 90)
+    # Calculate how many cycles the PWM thread has completed & missed since the last adjustment.
+    Cycles, Missed = TimingStatistics['Cycles'] - AutoTuneState['Cycles'], TimingStatistics['Overruns'] + TimingStatistics['SkippedCycles'] - AutoTuneState['Missed']
+    # Lengthen the clock cycle if more than 1% of cycles were missed.
+    if Missed * 100 > Cycles:
+      LoopCost = max(LoopCost, int(DwellDuration * 2000000000 / AutoTuneHeadroom))
+    NewDwellDuration = SelectDwellDuration(LoopCost, DwellDuration, AutoTuneHeadroom, AutoTuneMinimumFrequency, AutoTuneMaximumFrequency)
+    # Announce the new frequency if Debug is enabled by configuration.
+    if NewDwellDuration != DwellDuration and Debug == True:
+      LastMessage = PrintMessage(LastMessage, 'Auto Tune Changed The Frequency From '+str(round(1 / DwellDuration))+' Hz To '+str(round(1 / NewDwellDuration))+' Hz. \nThe Loop Cost is '+\
+        str(LoopCost // 1000)+' us & '+str(Missed)+' Of '+str(Cycles)+' Cycles Were Missed. \nThe Longest Input Cycle is '+str(AutoTuneState['Histogram']['Max'] // 1000)+' us.')
+    # Start tracking the next adjustment.
+    AutoTuneState['Histogram']['Buckets'][:] = [0] * len(AutoTuneState['Histogram']['Buckets'])
+    AutoTuneState['Histogram']['Count'], AutoTuneState['Histogram']['Max'] = 0, 0
+    AutoTuneState['LastTune'], AutoTuneState['Cycles'], AutoTuneState['Missed'] = CurrentTime, TimingStatistics['Cycles'], TimingStatistics['Overruns'] + TimingStatistics['SkippedCycles']
+    DwellDuration = NewDwellDuration
+  return LastMessage, DwellDuration
+#--------------------
+
+#--------------------
+# Locate the configuration file & the compiled snapshot of the configuration next to the application.
+# Set Arguments to the command line arguments. The first argument selects another configuration file, such as Robot_Motion_Config_High-Performance.py.
+# A configuration file that is not found in the current folder is looked for next to the application. Robot_Motion_Config.py is used when no argument is given.
+# The snapshot is kept in the __pycache__ folder alongside the compiled Python modules & is named after the configuration file.
+def LocateConfiguration(ApplicationFile, Arguments):
+  import os as OS
+  Directory = OS.path.dirname(OS.path.abspath(ApplicationFile))
+  # Use the default configuration file unless another one is given.
+  ConfigFile = OS.path.join(Directory, 'Robot_Motion_Config.py') if len(Arguments) == 0 else Arguments[0]
+  # Look for the configuration file next to the application if it is not in the current folder.
+  if not OS.path.exists(ConfigFile):
+    ConfigFile = OS.path.join(Directory, ConfigFile)
+  ConfigFile = OS.path.abspath(ConfigFile)
+  # Keep a separate snapshot for each configuration file.
+  return ConfigFile, OS.path.join(Directory, '__pycache__', OS.path.splitext(OS.path.basename(ConfigFile))[0]+'.snapshot')
+#--------------------
+
+#--------------------
+# Read a file & calculate a hash of its content.
+# The hash is used to detect changes, because the modification time & size of a file do not always change when its content does.
+# Returns the content of the file & its SHA-256 hash.
+def HashFile(FileName, HashLib):
+  with open(FileName, 'rb') as File:
+    Content = File.read()
+  return Content, HashLib.sha256(Content).digest()
+#--------------------
+
+#--------------------
+# Run the configuration file & collect the configuration variables it sets.
+# Set Source to the content of the configuration file, so the variables always match the content that was hashed.
+# Only names starting with an upper case letter that hold a bool, int, float or string are configuration variables.
+def CompileConfiguration(ConfigFile, Source):
+  Namespace = {}
+  # Run the configuration file from the content that was already read.
+  exec(compile(Source, ConfigFile, 'exec'), Namespace)
+  return {Name: Value for Name, Value in Namespace.items() if Name[:1].isupper() and type(Value) in (bool, int, float, str)}
+#--------------------
+
+#--------------------
+# Check the configuration variables against the constraints documented in the configuration file.
+# Returns a list of the problems that were found. The list is empty if the configuration is valid.
+def ValidateConfiguration(Settings):
+  Problems, Missing = [], [Name for Name in ('DefaultDwellDuration', 'DefaultExecutionDuration', 'DefaultSpeed', 'DefaultSensitivity', 'MinimumSensitivity', 'MaximumSensitivity', \
+    'SensitivityChangeAmount', 'RightBoostAmount', 'RightReductionAmount', 'LeftBoostAmount', 'LeftReductionAmount', 'RightLimpBoostAmount', 'RightLimpReductionAmount', \
+    'LeftLimpBoostAmount', 'LeftLimpReductionAmount', 'MotionInputRate', 'SpeedInputRate', 'TelemetryRate', 'LoopTrackingRate', 'ConfigWatchRate') if Name not in Settings]
+  # Stop checking if any variable used by the constraints is not set.
+  if len(Missing) > 0:
+    return [Name+' is not set.' for Name in Missing]
+  # The execution duration must fit inside the clock cycle.
+  if not 0 < Settings['DefaultDwellDuration']:
+    Problems.append('DefaultDwellDuration must be greater than 0.')
+  if not 0 <= Settings['DefaultExecutionDuration'] < Settings['DefaultDwellDuration']:
+    Problems.append('DefaultExecutionDuration must be shorter than DefaultDwellDuration.')
+  # The speed levels range from 0 to 9.
+  if not 0 <= Settings['DefaultSpeed'] <= 9:
+    Problems.append('DefaultSpeed must be between 0 & 9.')
+  # The sensitivity range must not be empty & must contain the default sensitivity.
+  if not 0 < Settings['MinimumSensitivity'] < Settings['MaximumSensitivity']:
+    Problems.append('MinimumSensitivity must be greater than 0 & lower than MaximumSensitivity.')
+  elif not Settings['MinimumSensitivity'] <= Settings['DefaultSensitivity'] <= Settings['MaximumSensitivity']:
+    Problems.append('DefaultSensitivity must be between MinimumSensitivity & MaximumSensitivity.')
+  if not 0 < Settings['SensitivityChangeAmount']:
+    Problems.append('SensitivityChangeAmount must be greater than 0.')
+  # Each boost amount must not be lower than the matching reduction amount.
+  for Channel in ('Right', 'Left', 'RightLimp', 'LeftLimp'):
+    if Settings[Channel+'BoostAmount'] < Settings[Channel+'ReductionAmount']:
+      Problems.append(Channel+'BoostAmount must not be lower than '+Channel+'ReductionAmount.')
+  # Rates of 0 are allowed & have a special meaning, but negative rates are not.
+  for Name in ('MotionInputRate', 'SpeedInputRate', 'TelemetryRate', 'LoopTrackingRate', 'ConfigWatchRate'):
+    if Settings[Name] < 0:
+      Problems.append(Name+' must not be lower than 0.')
+  return Problems
+#--------------------
+
+#--------------------
+# Read the validated configuration variables from the compiled snapshot.
+# Returns None if the snapshot is missing, damaged or was made for a different configuration file, application or Python version.
+def ReadConfigurationSnapshot(SnapshotFile, SnapshotKey, Marshal):
+  try:
+    with open(SnapshotFile, 'rb') as File:
+      Snapshot = Marshal.load(File)
+  except (OSError, EOFError, ValueError, TypeError):
+    return None
+  if type(Snapshot) is not tuple or len(Snapshot) != 2 or Snapshot[0] != SnapshotKey or type(Snapshot[1]) is not dict:
+    return None
+  return Snapshot[1]
+#--------------------
+
+#--------------------
+# Write the validated configuration variables to the compiled snapshot.
+# The snapshot is replaced in one step so a damaged snapshot is never read. The snapshot is skipped if it cannot be written.
+def WriteConfigurationSnapshot(SnapshotFile, SnapshotKey, Settings, Marshal, OS):
+  try:
+    OS.makedirs(OS.path.dirname(SnapshotFile), exist_ok=True)
+    with open(SnapshotFile+'.tmp', 'wb') as File:
+      Marshal.dump((SnapshotKey, Settings), File)
+    OS.replace(SnapshotFile+'.tmp', SnapshotFile)
+  except OSError:
+    pass
+#--------------------
+
+#--------------------
+# Load, validate & freeze the configuration variables.
+# The compiled snapshot is used when the content of the configuration file & application has not changed since it was written, so the configuration file is not run or checked again.
+# Set Fatal to True to close the application if the configuration cannot be loaded, or False to keep the previous configuration.
+# Returns an immutable named tuple containing every configuration variable, or None if the configuration could not be loaded.
+def LoadConfiguration(LastMessage, ConfigFile, SnapshotFile, ApplicationFile, Fatal):
+  import collections as Collections, hashlib as HashLib, marshal as Marshal, os as OS, sys as Sys
+  try:
+    # The snapshot is only valid for the same configuration file content, application content & Python version.
+    (Source, ConfigHash), ApplicationHash = HashFile(ConfigFile, HashLib), HashFile(ApplicationFile, HashLib)[1]
+    SnapshotKey, Origin = (ConfigFile, ConfigHash, ApplicationHash, Sys.hexversion), 'Snapshot'
+    Settings = ReadConfigurationSnapshot(SnapshotFile, SnapshotKey, Marshal)
+    if Settings is None:
+      Settings, Origin = CompileConfiguration(ConfigFile, Source), 'File'
+      Problems = ValidateConfiguration(Settings)
+      if len(Problems) > 0:
+        LastMessage = PrintError(20 if Fatal == True else 21, ('Invalid Configuration. \n' if Fatal == True else 'Could not Reload Configuration. \n')+' \n'.join(Problems), Fatal)
+        return LastMessage, None
+      WriteConfigurationSnapshot(SnapshotFile, SnapshotKey, Settings, Marshal, OS)
+  # Handle the exception that is raised if the configuration file is missing or cannot be run.
+  except (OSError, SyntaxError, NameError, TypeError, ValueError, ArithmeticError) as ConfigError:
+    # Display the raw exception.
+    LastMessage = PrintError(6, 'Captured Exception, '+str(ConfigError)+'.', False)
+    # Announce a fatal error if the configuration file cannot be loaded at startup.
+    LastMessage = PrintError(7 if Fatal == True else 21, 'Could not Import Configuration File.' if Fatal == True else 'Could not Reload Configuration.', Fatal)
+    return LastMessage, None
+  # Freeze the configuration variables so they cannot be changed by accident.
+  Configuration = Collections.namedtuple('Configuration', sorted(Settings))(**Settings)
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Configuration.Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Configuration Loaded Successfully From '+Origin+'. \n'+str(len(Settings))+' Configuration Variables Validated.')
+  return LastMessage, Configuration
+#--------------------
+
+#--------------------
+# Read the hash of the content of the configuration file.
+# Returns None if the file cannot be read, which happens while some editors save the file.
+def StampConfiguration(ReloadState):
+  try:
+    return HashFile(ReloadState['ConfigFile'], ReloadState['HashLib'])[1]
+  except OSError:
+    return None
+#--------------------
+
+#--------------------
+# Prepare to reload the configuration when the configuration file changes or the SIGHUP signal is received.
+# Returns a dictionary containing the location & last content hash of the configuration file & whether a reload has been requested.
+def InitializeConfigReload(LastMessage, ConfigFile, SnapshotFile, ApplicationFile, Debug):
+  import hashlib as HashLib, os as OS, signal as Signal
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Initializing Configuration Reload...')
+  ReloadState = {'ConfigFile': ConfigFile, 'SnapshotFile': SnapshotFile, 'ApplicationFile': ApplicationFile, 'HashLib': HashLib, 'Requested': False}
+  ReloadState['Stamp'] = StampConfiguration(ReloadState)
+  # Request a reload from the signal handler. The reload itself is performed by the main loop.
+  if hasattr(Signal, 'SIGHUP'):
+    Signal.signal(Signal.SIGHUP, lambda SignalNumber, Frame: ReloadState.__setitem__('Requested', True))
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Configuration Reload Initialized Successfully. \nWatching '+ConfigFile+'. \nSend SIGHUP To Process '+str(OS.getpid())+' To Reload Now.')
+  return LastMessage, ReloadState
+#--------------------
+
+#--------------------
+# Determine if the configuration must be reloaded.
+# A reload is due when the SIGHUP signal has been received or the content of the configuration file has changed since it was last checked.
+# The configuration file is only checked at the config watch rate. Set ConfigWatchRate to 0 to only reload when the SIGHUP signal is received.
+def ConfigReloadDue(ReloadState, Scheduler, ConfigWatchRate, Now):
+  if ReloadState['Requested'] == True:
+    ReloadState['Requested'] = False
+    ReloadState['Stamp'] = StampConfiguration(ReloadState)
+    return True
+  if ConfigWatchRate > 0 and TaskDue(Scheduler, 'Config Watch', Now):
+    Stamp = StampConfiguration(ReloadState)
+    if Stamp is not None and Stamp != ReloadState['Stamp']:
+      ReloadState['Stamp'] = Stamp
+      return True
+  return False
+#--------------------
+
+#--------------------
+# Reload the configuration & select the tuning values that can be changed while the motors are running.
+# Only the tuning values in the ReloadableSettings list are changed. Changes to any other configuration variable are reported & only applied after the application is restarted.
+# The previous configuration is kept if the new configuration cannot be loaded or is not valid.
+# The module level configuration variables are never changed, so threads that read them always see the values loaded at startup.
+# Returns the updated configuration & a dictionary containing the tuning values that were changed.
+# The updated configuration is a new immutable named tuple, so the main loop replaces it with a single assignment & never reads a partially updated configuration.
+def ReloadConfiguration(LastMessage, ReloadState, Configuration, Debug):
+  # Announce the start of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Reloading Configuration...')
+  LastMessage, NewConfiguration = LoadConfiguration(LastMessage, ReloadState['ConfigFile'], ReloadState['SnapshotFile'], ReloadState['ApplicationFile'], False)
+  if NewConfiguration is None:
+    return LastMessage, Configuration, {}
+  # The tuning values that can be changed without restarting the motors.
+  ReloadableSettings = ('DefaultDwellDuration', 'DefaultExecutionDuration', 'DefaultSensitivity', 'MinimumSensitivity', 'MaximumSensitivity', 'SensitivityChangeAmount', \
+    'RightBoostAmount', 'RightReductionAmount', 'LeftBoostAmount', 'LeftReductionAmount', 'RightLimpBoostAmount', 'RightLimpReductionAmount', 'LeftLimpBoostAmount', \
+    'LeftLimpReductionAmount', 'MotionInputRate', 'SpeedInputRate', 'SensitivityRepeatDelay', 'SpeedRepeatDelay', 'TelemetryRate', 'LoopTrackingRate', 'ConfigWatchRate', \
+    'AutoTuneHeadroom', 'AutoTuneMinimumFrequency', 'AutoTuneMaximumFrequency', 'AutoTuneInterval', 'UDPCommandTimeout', 'WebCommandTimeout', 'SharedMemoryCommandTimeout')
+  Changes, RestartRequired = {}, []
+  for Name in sorted(set(Configuration._fields) | set(NewConfiguration._fields)):
+    if getattr(Configuration, Name, None) != getattr(NewConfiguration, Name, None):
+      if Name in ReloadableSettings:
+        Changes[Name] = getattr(NewConfiguration, Name)
+      else:
+        RestartRequired.append(Name)
+  # Report the changes that cannot be applied while the motors are running.
+  if len(RestartRequired) > 0:
+    LastMessage = PrintMessage(LastMessage, 'Restart Required To Apply: '+', '.join(RestartRequired)+'.')
+  Configuration = Configuration._replace(**Changes)
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Configuration Reloaded Successfully. \nChanged: '+(', '.join(Changes) if len(Changes) > 0 else 'Nothing')+'.')
+  return LastMessage, Configuration, Changes
+#--------------------
+
+#--------------------
+# Apply reloaded tuning values to the running application.
+# Called by the main loop at the start of an input cycle, before the duty table is rebuilt & the target state is published.
+# The new clock cycle & sensitivity reach the PWM thread only through the next target state published by PublishPWMTarget(), so they take effect at the start of a clock cycle & the motors are never stopped.
+# Set Changes to the dictionary of changed tuning values returned by ReloadConfiguration().
+# Returns the clock cycle to use from now on.
+def ApplyTuning(LastMessage, Controller, Scheduler, Changes, DwellDuration, EnableAutoTune, DefaultDwellDuration, DefaultSensitivity, MinimumSensitivity, MaximumSensitivity, \
+  MotionInputRate, SpeedInputRate, TelemetryRate, LoopTrackingRate, ConfigWatchRate, Debug):
+  # Use the new clock cycle unless it is selected automatically.
+  if 'DefaultDwellDuration' in Changes and EnableAutoTune == False:
+    DwellDuration = DefaultDwellDuration
+  # Use the new default sensitivity, or keep the current sensitivity inside the new sensitivity range.
+  if 'DefaultSensitivity' in Changes:
+    Controller.CurrentSensitivity = DefaultSensitivity
   else:
-    Time.sleep(DwellDuration)
+    Controller.CurrentSensitivity = max(MinimumSensitivity, min(MaximumSensitivity, Controller.CurrentSensitivity))
+  # Run each task of the main loop at its new rate.
+  SetTaskRate(Scheduler, 'Motion Input', MotionInputRate if MotionInputRate > 0 else 1 / DwellDuration)
+  SetTaskRate(Scheduler, 'Speed Input', SpeedInputRate)
+  SetTaskRate(Scheduler, 'Telemetry', TelemetryRate)
+  SetTaskRate(Scheduler, 'Loop Tracking', LoopTrackingRate)
+  SetTaskRate(Scheduler, 'Config Watch', ConfigWatchRate)
+  # Announce the end of the operation if Debug is enabled by configuration.
+  if Debug == True:
+    LastMessage = PrintMessage(LastMessage, 'Tuning Applied Successfully. \nThe Dwell Duration is '+str(DwellDuration)+'. \nThe Sensitivity is '+str(Controller.CurrentSensitivity)+'.')
   return LastMessage, DwellDuration
 #--------------------
 
 #--------------------
 # The main logic of the application.
 
-# Attempt to import the configuration variables located in Robot_Motion_Config.py. 
-try:
-  from Robot_Motion_Config import *
-# Handle the exception that is raised if the configuration file is missing.
-except ModuleNotFoundError as ConfigError:
-  # Display the raw exception if Debug is enabled by configuration.
-  LastMessage = PrintError(6, 'Captured Exception, '+str(ConfigError)+'.', False)
-  # Announce a fatal error if the configuration file cannot be loaded.
-  LastMessage = PrintError(7, 'Could not Import Configuration File.', True)
+# Load, validate & freeze the configuration variables located in Robot_Motion_Config.py or the configuration file given on the command line.
+import sys as Sys
+ConfigFile, SnapshotFile = LocateConfiguration(__file__, Sys.argv[1:])
+LastMessage, Configuration = LoadConfiguration('', ConfigFile, SnapshotFile, __file__, True)
+
+# Make each configuration variable available to the functions of the application.
+globals().update(Configuration._asdict())
 
 # Print the start text.
 PrintText(StartText)
 
+# Build the duty table used to look up the execution duration for every throttle position.
+DutyTable = UpdateDutyTable({}, DefaultSensitivity, DefaultDwellDuration, ThrottleResolution)
+
 # Initialize the operating environment.
-LastMessage, SensitivityCounter, SpeedCounter, LoopCounter, LoopTracker, ExecutionDuration, CurrentSpeed, OriginalSpeed, CurrentSensitivity, DwellDuration, BreakLoop, Boosted, GPIO, Time, KB = InitializeEnvironment(SpeakerGPIO, \
+LastMessage, SensitivityReadyTime, SpeedReadyTime, LoopCounter, LoopTracker, ExecutionDuration, CurrentSpeed, OriginalSpeed, CurrentSensitivity, DwellDuration, BreakLoop, Boosted, GPIO, Time, KB, Threading, Queue = InitializeEnvironment(SpeakerGPIO, \
   MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO, DefaultSpeed, DefaultExecutionDuration, DefaultDwellDuration, \
   DefaultSensitivity, Debug)
 
+# Collect the state updated by the input functions every input cycle.
+Controller = ControllerState(ExecutionDuration, CurrentSpeed, OriginalSpeed, CurrentSensitivity, SensitivityReadyTime, SpeedReadyTime, Boosted)
+
+# Initialize the backend used to write to the speaker & motor GPIO pins.
+LastMessage, OutputBackend = InitializeOutputBackend(LastMessage, GPIOBackend, GPIORegisterDevice, GPIOChipDevice, (SpeakerGPIO, MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, \
+  MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO), GPIO, GPIOMode, Threading, Debug)
+
+# Measure the precision of the sleep function before any motor timing is performed.
+LastMessage, TimerCalibration, SpinMargin = CalibrateTimer(LastMessage, TimerCalibrationSamples, SpinWaitMargin, Time, Debug)
+
+# Initialize the timing statistics collected by the PWM thread.
+TimingStatistics = InitializeTimingStatistics(TimingHistogramSize, TimingHistogramResolution)
+
+# Initialize the bitmap of pressed keys.
+LastMessage, KeyMasks, KeyState = InitializeKeyState(LastMessage, (ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRightKey, RightLimpLeftKey, LeftLimpRightKey, \
+  LeftLimpLeftKey, IncreaseSensitivityKey, DecreaseSensitivityKey, IncreaseSpeedKey, DecreaseSpeedKey, SpeedOneKey, SpeedTwoKey, SpeedThreeKey, SpeedFourKey, SpeedFiveKey, \
+  SpeedSixKey, SpeedSevenKey, SpeedEightKey, SpeedNineKey, SpeedTenKey, CloseKey, TimingReportKey), EnableKeyboardEvents, KeyboardInputBackend, KeyboardInputDevice, TerminalReleaseTimeout, KB, Threading, Time, Debug)
+
+# Start reading the joystick axes when enabled by configuration.
+if EnableJoystickInput == True:
+  LastMessage, JoystickState = InitializeJoystickInput(LastMessage, JoystickInputDevice, JoystickThrottleAxis, JoystickSteeringAxis, JoystickAxisMinimum, JoystickAxisMaximum, Threading, Debug)
+
+# Start listening for UDP commands when enabled by configuration.
+if EnableUDPInput == True:
+  LastMessage, UDPState = InitializeUDPInput(LastMessage, UDPInputAddress, UDPInputPort, Debug)
+
+# Start serving the control page when enabled by configuration.
+if EnableWebInput == True:
+  LastMessage, WebState = InitializeWebInput(LastMessage, WebInputAddress, WebInputPort, WebSocketRateLimit, WebSocketBurst, JoystickDeadzone, JoystickExpo, Threading, Debug)
+
+# Create the shared memory mailbox when enabled by configuration.
+if EnableSharedMemoryInput == True:
+  LastMessage, MailboxState = InitializeMailbox(LastMessage, SharedMemoryName, Debug)
+
+# Compile the motion keys into a decision table.
+LastMessage, MotionTable, MotionMask = CompileMotionTable(LastMessage, KeyMasks, MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO, \
+  RightBoostAmount, RightReductionAmount, RightLimpBoostAmount, RightLimpReductionAmount, LeftBoostAmount, LeftReductionAmount, LeftLimpBoostAmount, LeftLimpReductionAmount, \
+  ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRightKey, RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug)
+
+# Select the clock cycle from the measured loop cost when enabled by configuration.
+if EnableAutoTune == True:
+  LastMessage, LoopCost = MeasureLoopCost(LastMessage, AutoTuneSamples, KeyState, KeyMasks, OutputBackend, MotorStateToMask((Pin, GPIO.LOW) for Pin in (MotorRelayOnePositiveGPIO, \
+    MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO)), Time, KB, Debug)
+  DwellDuration = SelectDwellDuration(LoopCost, 0, AutoTuneHeadroom, AutoTuneMinimumFrequency, AutoTuneMaximumFrequency)
+  AutoTuneState = {'Histogram': CreateHistogram(TimingHistogramSize, int(TimingHistogramResolution * 1000000000)), 'LastTune': Time.monotonic(), 'Cycles': 0, 'Missed': 0}
+  DutyTable = UpdateDutyTable(DutyTable, Controller.CurrentSensitivity, DwellDuration, ThrottleResolution)
+
+# Prepare the process for real-time operation when enabled by configuration.
+RealTimeState = None
+if EnableRealTime == True:
+  LastMessage, RealTimeState = InitializeRealTime(LastMessage, RealTimeCPU, Debug)
+
+# Prepare the garbage collector & record the duration of every collection.
+LastMessage, GCState = InitializeGCControl(LastMessage, EnableGCControl, GCMinimumWindow, TimingStatistics, Time, Debug)
+
+# Start the PWM & logging threads.
+LastMessage, MotorChannels, ChannelStates, StoppedMotorState, PendingMotorState, PendingChannelThrottles, PWMTarget, MessageQueue, StopEvent, LogThread, PWMThread = InitializeThreads(LastMessage, MotorRelayOnePositiveGPIO, \
+  MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO, Controller.CurrentSpeed, DwellDuration, SpinMargin, TimingStatistics, RealTimeState, GCState, MessageQueueSize, Threading, Queue, Time, Debug)
+
+# Initialize the scheduler that runs each task of the main loop at its own rate.
+LastMessage, Scheduler = InitializeScheduler(LastMessage, (('Motion Input', MotionInputRate if MotionInputRate > 0 else 1 / DwellDuration), ('Speed Input', SpeedInputRate), \
+  ('Telemetry', TelemetryRate), ('Loop Tracking', LoopTrackingRate), ('Config Watch', ConfigWatchRate)), DwellDuration, Time, Debug)
+
+# Watch the configuration file & listen for the SIGHUP signal when enabled by configuration.
+# Reloaded tuning values are read from Configuration by the main loop & are staged in Changes until the start of the next input cycle.
+Changes = {}
+if EnableConfigReload == True:
+  LastMessage, ReloadState = InitializeConfigReload(LastMessage, ConfigFile, SnapshotFile, __file__, Debug)
+
 # Print the welcome text.
 PrintText(WelcomeText)
 
-# Start the loop which defines the timings of the electronic speed control (ESC).
+# Read the keys that are pressed before the first input cycle.
+PressedKeys = ReadKeyState(KeyState, KeyMasks, KB)
+
+# Start the loop which listens for user input & publishes the requested motor state to the PWM thread.
+# Each task of the loop runs at the rate set by configuration & the loop sleeps until the next task is due.
 # Break out of this loop if the max loop counter has been reached or if the Esc key is pressed.
-while BreakLoop == False and not KB.is_pressed(CloseKey):
+while BreakLoop == False and not IsKeyPressed(CloseKey):
+
+  # Read the time once for every task of the current iteration.
+  Now = Time.monotonic_ns()
+
+  # Read input & publish the requested motor state at the motion input rate.
+  if TaskDue(Scheduler, 'Motion Input', Now):
+
+    # Apply reloaded tuning values between input cycles so the clock cycle & sensitivity only change with the next published target state.
+    if len(Changes) > 0:
+      LastMessage, DwellDuration = ApplyTuning(LastMessage, Controller, Scheduler, Changes, DwellDuration, EnableAutoTune, Configuration.DefaultDwellDuration, Configuration.DefaultSensitivity, \
+        Configuration.MinimumSensitivity, Configuration.MaximumSensitivity, Configuration.MotionInputRate, Configuration.SpeedInputRate, Configuration.TelemetryRate, \
+        Configuration.LoopTrackingRate, Configuration.ConfigWatchRate, Debug)
+      # Compile the motion keys again with the new boost & reduction amounts.
+      LastMessage, MotionTable, MotionMask = CompileMotionTable(LastMessage, KeyMasks, MotorRelayOnePositiveGPIO, MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO, \
+        Configuration.RightBoostAmount, Configuration.RightReductionAmount, Configuration.RightLimpBoostAmount, Configuration.RightLimpReductionAmount, Configuration.LeftBoostAmount, \
+        Configuration.LeftReductionAmount, Configuration.LeftLimpBoostAmount, Configuration.LeftLimpReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRightKey, \
+        RightLimpLeftKey, LeftLimpRightKey, LeftLimpLeftKey, Debug)
+      Changes = {}
 
-  # Listen for keyboard input when enabled by configuration.
-  if EnableKeyboardInput == True:
+    # Start timing execution of the current input cycle now.
+    StartTime = Time.monotonic_ns()
+
+    # Listen for keyboard input when enabled by configuration.
+    if EnableKeyboardInput == True:
   
-    # Listen for & process requests from user input.
-    LastMessage, StartTime, ExecutionDuration, CurrentSpeed, OriginalSpeed, CurrentSensitivity, SensitivityCounter, SpeedCounter, Boosted = ListenForKeyboardRequests(LastMessage, DebugStops, MinimumSensitivity, MaximumSensitivity, \
-      SensitivityCounter, SpeedCounter, ExecutionDuration, DwellDuration, DefaultSensitivity, CurrentSpeed, OriginalSpeed, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, MotorRelayOnePositiveGPIO, \
-      MotorRelayOneNegativeGPIO, MotorRelayTwoPositiveGPIO, MotorRelayTwoNegativeGPIO, RightBoostAmount, RightReductionAmount, RightLimpBoostAmount, RightLimpReductionAmount, LeftBoostAmount, \
-      LeftReductionAmount, LeftLimpBoostAmount, LeftLimpReductionAmount, ForwardKey, BackwardKey, TurnRightKey, TurnLeftKey, RightLimpRightKey, RightLimpLeftKey, LeftLimpRightKey, \
-      LeftLimpLeftKey, IncreaseSpeedKey, DecreaseSpeedKey, SpeedOneKey, SpeedTwoKey, SpeedThreeKey, SpeedFourKey, SpeedFiveKey, SpeedSixKey, SpeedSevenKey, SpeedEightKey, \
-      SpeedNineKey, SpeedTenKey, CurrentSensitivity, Boosted, Time, KB, Debug)
-
-  # Track & control application execution for debugging purposes. 
-  LastMessage, LoopCounter, LoopTracker, BreakLoop = TrackLoops(LastMessage, EnableLoopTracking, LoopCounter, LoopTracker, LoopAnnouncementInterval, MaxLoopCount, Debug)
-
-  # Throttle the application according to configuration settings & compute performance.
-  LastMessage, DwellDuration = PauseExecution(LastMessage, StartTime, ExecutionDuration, DefaultDwellDuration, Time, CurrentSpeed)
+      # Listen for & process motion requests from user input.
+      LastMessage = ListenForKeyboardRequests(LastMessage, Controller, DebugStops, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, MotionTable, MotionMask, Debug)
+
+    # Listen for joystick input when enabled by configuration.
+    if EnableJoystickInput == True:
+
+      # Stage the throttle position of each channel from the joystick axes.
+      LastMessage = DetectJoystickMotion(LastMessage, JoystickState, JoystickThrottleAxis, JoystickSteeringAxis, JoystickDeadzone, JoystickExpo, JoystickInvertThrottle, MotorChannels, Controller.CurrentSpeed, Debug)
+
+    # Listen for UDP commands when enabled by configuration.
+    if EnableUDPInput == True:
+
+      # Stage the most recent command from remote operators.
+      LastMessage = DetectUDPCommands(LastMessage, UDPState, MotorChannels, Configuration.UDPCommandTimeout, Time, Debug)
+
+    # Listen for commands from the control page when enabled by configuration.
+    if EnableWebInput == True:
+
+      # Stage the most recent command from the control page.
+      LastMessage = DetectWebCommands(LastMessage, WebState, MotorChannels, Configuration.WebCommandTimeout, Time, Debug)
+
+    # Listen for commands from co-located processes when enabled by configuration.
+    if EnableSharedMemoryInput == True:
+
+      # Stage the most recent command from the shared memory mailbox.
+      LastMessage = DetectMailboxCommands(LastMessage, MailboxState, MotorChannels, Configuration.SharedMemoryCommandTimeout, Time, Debug)
+
+    # Adjust the clock cycle to the measured loop cost when enabled by configuration.
+    if EnableAutoTune == True:
+      LastMessage, DwellDuration = TuneDwellDuration(LastMessage, AutoTuneState, StartTime, DwellDuration, TimingStatistics, Configuration.AutoTuneHeadroom, \
+        Configuration.AutoTuneMinimumFrequency, Configuration.AutoTuneMaximumFrequency, Configuration.AutoTuneInterval, Time, Debug)
+      # Keep reading input at the frequency of the PWM thread unless a motion input rate is set by configuration.
+      if Configuration.MotionInputRate <= 0:
+        SetTaskRate(Scheduler, 'Motion Input', 1 / DwellDuration)
+
+    # Rebuild the duty table if the sensitivity or clock cycle has changed.
+    DutyTable = UpdateDutyTable(DutyTable, Controller.CurrentSensitivity, DwellDuration, ThrottleResolution)
+
+    # Publish the requested motor state to the PWM thread.
+    PWMTarget = PublishPWMTarget(PWMTarget, PendingMotorState, PendingChannelThrottles, MotorChannels, ChannelStates, Controller.CurrentSpeed, DutyTable)
+
+  # Listen for speed & sensitivity requests at the speed input rate when keyboard input is enabled by configuration.
+  if EnableKeyboardInput == True and TaskDue(Scheduler, 'Speed Input', Now):
+    LastMessage = ListenForKeyboardSettings(LastMessage, Controller, Now, Configuration.MinimumSensitivity, Configuration.MaximumSensitivity, Configuration.SensitivityRepeatDelay, \
+      Configuration.SensitivityChangeAmount, Configuration.SpeedRepeatDelay, DwellDuration, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, Debug)
+
+  # Print the timing statistics on demand at the telemetry rate when enabled by configuration.
+  if EnableTimingStatistics == True and TaskDue(Scheduler, 'Telemetry', Now) and IsKeyPressed(TimingReportKey):
+    LastMessage = PrintTimingStatistics(TimingStatistics, DwellDuration)
+    LastMessage = PrintOutputStatistics(OutputBackend)
+
+  # Track & control application execution for debugging purposes at the loop tracking rate.
+  if TaskDue(Scheduler, 'Loop Tracking', Now):
+    LastMessage, LoopCounter, LoopTracker, BreakLoop = TrackLoops(LastMessage, EnableLoopTracking, LoopCounter, LoopTracker, LoopAnnouncementInterval, MaxLoopCount, Debug)
+
+  # Reload the tuning values when the configuration file changes or the SIGHUP signal is received when enabled by configuration.
+  if EnableConfigReload == True and ConfigReloadDue(ReloadState, Scheduler, Configuration.ConfigWatchRate, Now):
+    LastMessage, Configuration, Reloaded = ReloadConfiguration(LastMessage, ReloadState, Configuration, Debug)
+    # Stage the changed tuning values. The PWM thread keeps running the current clock cycle until the next input cycle publishes a new target state.
+    if len(Reloaded) > 0:
+      Changes = dict(Changes, **Reloaded)
+
+  # Pause until the next task is due.
+  PauseScheduler(Scheduler, Time)
+
+  # Read the keys that are pressed for the next iteration.
+  PressedKeys = ReadKeyState(KeyState, KeyMasks, KB)
+
+# Stop listening for keyboard events.
+CloseKeyState(KeyState, KB)
+
+# Stop reading the joystick axes.
+if EnableJoystickInput == True:
+  CloseKeyState(JoystickState, KB)
+
+# Stop listening for UDP commands.
+if EnableUDPInput == True:
+  LastMessage = CloseUDPInput(LastMessage, UDPState, Debug)
+
+# Stop serving the control page.
+if EnableWebInput == True:
+  LastMessage = CloseWebInput(LastMessage, WebState, Debug)
+
+# Remove the shared memory mailbox.
+if EnableSharedMemoryInput == True:
+  LastMessage = CloseMailbox(LastMessage, MailboxState, Debug)
+
+# Stop the PWM & logging threads.
+StopThreads(StopEvent, MessageQueue, PWMThread, LogThread)
+
+# Release the GPIO output backend.
+OutputBackend = CloseOutputBackend(OutputBackend)
+
+# Print the timing statistics if Debug & timing statistics are enabled by configuration.
+if Debug == True and EnableTimingStatistics == True:
+  LastMessage = PrintTimingStatistics(TimingStatistics, DwellDuration)
+  LastMessage = PrintOutputStatistics(OutputBackend)
 
 # Print the goodbye text.
 PrintText(GoodbyeText)
@@ -0,0 +1,132 @@
+#--------------------
+# APPLICATION NAME
+#   Robot_Motion_AllocationCheck.py
+
+# APPLICATION INFORMATION
+#   Written by Daniel Grimes & Justin Grimes.
+#   https://github.com/zelon88/Robot_Motion
+#   Version v4.7, October 17th, 2026
+#   Licensed Under GNU GPLv3
+
+# APPLICATION DESCRIPTION
+#   An allocation check for the main loop of Robot_Motion.py.
+#   Verifies that the main loop stops allocating memory once it is running without any GPIO hardware.
+
+# APPLICATION NOTES
+#   Robot_Motion.py is run in this process with the configuration from Robot_Motion_Config.py, or the configuration file given as the third argument, except that GPIOBackend is set to Mock,
+#   the speaker & debug output are disabled & the main loop ends after the warmup & the checked cycles.
+#   Memory allocations are traced with tracemalloc & compared between the end of the warmup & the end of the main loop.
+#   Only memory allocated by the main thread is counted. A full garbage collection is performed before every snapshot.
+#   Exits with status 0 if the main loop held no new memory blocks when it ended & with status 1 otherwise.
+
+# USAGE
+#   python3 Robot_Motion_AllocationCheck.py [Cycles] [Warmup] [ConfigFile]
+#--------------------
+
+#--------------------
+# Load the functions of Robot_Motion.py into a namespace & split off its main logic so it can be run once the check is prepared.
+def LoadApplication():
+  Source, Namespace = open('Robot_Motion.py').read(), {'__file__': 'Robot_Motion.py', '__name__': '__main__'}
+  Split = Source.index('# The main logic of the application.')
+  exec(compile(Source[:Split], 'Robot_Motion.py', 'exec'), Namespace)
+  # Pad the main logic with blank lines so line numbers in the report match Robot_Motion.py.
+  MainLogic = compile('\n' * Source.count('\n', 0, Split) + Source[Split:], 'Robot_Motion.py', 'exec')
+  return Namespace, MainLogic
+#--------------------
+
+#--------------------
+# Override the configuration variables that would prevent the main loop from running without GPIO hardware or from ending on its own.
+# The main loop ends through MaxLoopCount, which is only counted while loop tracking is enabled.
+def OverrideConfiguration(Namespace, MaxLoopCount):
+  LoadConfiguration = Namespace['LoadConfiguration']
+  def LoadCheckConfiguration(*Arguments):
+    LastMessage, Configuration = LoadConfiguration(*Arguments)
+    return LastMessage, Configuration._replace(GPIOBackend='Mock', EnableSpeakerBeep=False, Debug=False, EnableLoopTracking=True, MaxLoopCount=MaxLoopCount)
+  Namespace['LoadConfiguration'] = LoadCheckConfiguration
+#--------------------
+
+#--------------------
+# Count the iterations of the main loop & take the baseline snapshot once the warmup has finished.
+# PauseScheduler is called once at the end of every iteration of the main loop.
+def TrackAllocations(Namespace, AllocationState, Warmup, GC, TraceMalloc):
+  PauseScheduler = Namespace['PauseScheduler']
+  def PauseAndTrack(Scheduler, Time):
+    PauseScheduler(Scheduler, Time)
+    AllocationState['Cycles'] = AllocationState['Cycles'] + 1
+    if AllocationState['Cycles'] == Warmup:
+      GC.collect()
+      AllocationState['Baseline'] = TraceMalloc.take_snapshot()
+  Namespace['PauseScheduler'] = PauseAndTrack
+#--------------------
+
+#--------------------
+# Count the memory blocks & bytes held by each line of code that were allocated by the main thread.
+# Allocations are attributed to the main loop when their complete traceback starts in this file & continues in the main logic of Robot_Motion.py.
+# Allocations made by tracemalloc itself are ignored.
+def CountMainLoopAllocations(Snapshot, CheckFile, TraceMallocFile):
+  Allocations = {}
+  for Trace in Snapshot.traces:
+    Traceback = Trace.traceback
+    if Traceback.total_nframe == len(Traceback) and len(Traceback) > 1 and Traceback[0].filename == CheckFile and Traceback[1].filename == 'Robot_Motion.py' and \
+      Traceback[-1].filename != TraceMallocFile:
+      Line = Traceback[-1].filename+':'+str(Traceback[-1].lineno)
+      Count, Size = Allocations.get(Line, (0, 0))
+      Allocations[Line] = (Count + 1, Size + Trace.size)
+  return Allocations
+#--------------------
+
+#--------------------
+# Compare the memory held by the main loop when it ended with the memory it held at the end of the warmup.
+# Returns the net number of blocks & bytes that are still allocated & the lines that hold the most new blocks.
+def CompareAllocations(Baseline, Final, CheckFile, TraceMallocFile):
+  Before, After = CountMainLoopAllocations(Baseline, CheckFile, TraceMallocFile), CountMainLoopAllocations(Final, CheckFile, TraceMallocFile)
+  Blocks, Bytes, Lines = 0, 0, []
+  for Line in set(Before) | set(After):
+    BeforeCount, BeforeSize = Before.get(Line, (0, 0))
+    AfterCount, AfterSize = After.get(Line, (0, 0))
+    Blocks, Bytes = Blocks + AfterCount - BeforeCount, Bytes + AfterSize - BeforeSize
+    if AfterCount > BeforeCount:
+      Lines.append((AfterCount - BeforeCount, AfterSize - BeforeSize, Line))
+  # List the lines holding the most new blocks first.
+  Lines.sort(reverse=True)
+  return Blocks, Bytes, Lines[:5]
+#--------------------
+
+#--------------------
+# The main logic of the application.
+
+import sys as Sys, gc as GC, tracemalloc as TraceMalloc
+
+# Read the command line arguments.
+Arguments = Sys.argv[1:] + [None] * 2
+Cycles, Warmup = int(Arguments[0] or 5000), int(Arguments[1] or 1000)
+
+Namespace, MainLogic = LoadApplication()
+AllocationState = {'Cycles': 0, 'Baseline': None}
+OverrideConfiguration(Namespace, Warmup + Cycles)
+TrackAllocations(Namespace, AllocationState, Warmup, GC, TraceMalloc)
+
+# Trace allocations from startup so memory freed during the check is matched with the allocation that created it.
+# Enough frames are traced to tell the main thread apart from the other threads.
+TraceMalloc.start(64)
+# Pass only the configuration file on to Robot_Motion.py as its command line arguments.
+Sys.argv = ['Robot_Motion.py'] + Sys.argv[3:4]
+try:
+  exec(MainLogic, Namespace)
+# Robot_Motion.py closes by calling exit() once the main loop has ended & all motors are stopped.
+except SystemExit:
+  pass
+GC.collect()
+Final = TraceMalloc.take_snapshot()
+TraceMalloc.stop()
+
+# Fail if the main loop ended before the warmup finished because the check could not be performed.
+if AllocationState['Baseline'] is None:
+  print('Allocation Check Did Not Run. \nThe main loop ended after '+str(AllocationState['Cycles'])+' cycles, before '+str(Warmup)+' warmup cycles were completed.')
+  Sys.exit(1)
+Blocks, Bytes, Lines = CompareAllocations(AllocationState['Baseline'], Final, CountMainLoopAllocations.__code__.co_filename, TraceMalloc.__file__)
+print('Allocation Check After '+str(AllocationState['Cycles'] - Warmup)+' Cycles. \nNet Blocks Allocated By The Main Loop: '+str(Blocks)+'. \nNet Bytes Allocated By The Main Loop: '+str(Bytes)+'.')
+for Count, Size, Line in Lines:
+  print(Line+': +'+str(Count)+' blocks, '+str(Size)+' bytes.')
+Sys.exit(1 if Blocks > 0 else 0)
+#--------------------
@@ -0,0 +1,238 @@
+#--------------------
+# APPLICATION NAME
+#   Robot_Motion_Benchmark.py
+
+# APPLICATION INFORMATION
+#   Written by Daniel Grimes & Justin Grimes.
+#   https://github.com/zelon88/Robot_Motion
+#   Version v4.7, October 17th, 2026
+#   Licensed Under GNU GPLv3
+
+# APPLICATION DESCRIPTION
+#   A benchmark for the keyboard input cycle of Robot_Motion.py.
+#   Measures the time spent processing keyboard requests in every input cycle without any GPIO hardware.
+#   Each scenario is measured before & after the keyboard input state was moved into ControllerState so both costs are reported together.
+#   The speed input task is measured separately because it runs at SpeedInputRate instead of every input cycle. It has no before measurement.
+
+# APPLICATION NOTES
+#   The functions of Robot_Motion.py are loaded without running its main logic.
+#   The keys, boost amounts & sensitivity are read from Robot_Motion_Config.py, or the configuration file given as the third argument, & validated the same way as Robot_Motion.py.
+#   The speaker & debug output are disabled while measuring.
+#   The best result of several repetitions is reported for every scenario. The before & after measurements are interleaved so they share the same conditions.
+#   The before measurement runs a pinned copy of the motion request path that passed the controller state in & out as tuples.
+
+# USAGE
+#   python3 Robot_Motion_Benchmark.py [Cycles] [Repetitions] [ConfigFile]
+#--------------------
+
+#--------------------
+# Load the functions & configuration of Robot_Motion.py into a namespace.
+# The source is compiled up to the main logic of the application so no hardware is initialized.
+# Set Arguments to a list containing the configuration file to use, or an empty list to use Robot_Motion_Config.py.
+def LoadApplication(Types, Arguments):
+  Source, Namespace = open('Robot_Motion.py').read(), {}
+  exec(compile(Source[:Source.index('# The main logic of the application.')], 'Robot_Motion.py', 'exec'), Namespace)
+  LastMessage, Configuration = Namespace['LoadConfiguration']('', *Namespace['LocateConfiguration']('Robot_Motion.py', Arguments), 'Robot_Motion.py', True)
+  Namespace.update(Configuration._asdict())
+  Namespace.update(Debug=False, EnableSpeakerBeep=False, GPIO=Types.SimpleNamespace(HIGH=1, LOW=0))
+  return Namespace
+#--------------------
+
+#--------------------
+# Pinned copy of the speed update that returned the execution duration & speed as a tuple.
+def BaselineUpdateSpeed(RequestedSpeed, ExecutionDuration):
+  # Set the upper boundary for the RequestedSpeed variable to 9.
+  if RequestedSpeed > 9:
+    RequestedSpeed = 0
+  # Look up what the execution time should be for the requested speed.
+  if RequestedSpeed >= 0 and RequestedSpeed <= 9:
+    ExecutionDuration = ThrottleToExecutionTime(DutyTable, SpeedToThrottle(RequestedSpeed)) / 1000000000
+  return ExecutionDuration, RequestedSpeed
+#--------------------
+
+#--------------------
+# Pinned copy of the boost removal that passed the controller state in & out as a tuple.
+def BaselineRemoveBoost(Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity):
+  # Detect leftover boost or reduction from completed turn commands.
+  if Boosted == True:
+    ExecutionDuration, CurrentSpeed = BaselineUpdateSpeed(OriginalSpeed, ExecutionDuration)
+    Boosted, OriginalSpeed = False, CurrentSpeed
+  return Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed
+#--------------------
+
+#--------------------
+# Pinned copy of the boost calculation that received the controller state as separate arguments.
+def BaselineCalculateBoost(Boosted, CurrentSpeed, OriginalSpeed, RightTotalBoost, LeftTotalBoost):
+  # Detect if boost is already applied & calculate boost from the original speed instead.
+  if Boosted == True:
+    CurrentSpeed = OriginalSpeed
+  # Set the upper limit for boost to 0.
+  if CurrentSpeed == 0:
+    RightBoosted, LeftBoosted = 10, 10
+  else:
+    RightBoosted, LeftBoosted = CurrentSpeed, CurrentSpeed
+  RightMoving, LeftMoving = RightBoosted + RightTotalBoost, LeftBoosted + LeftTotalBoost
+  # Set the lower limit for reduction.
+  if CurrentSpeed != 0 and RightMoving <= 0:
+    RightMoving = 1
+  if CurrentSpeed != 0 and LeftMoving <= 0:
+    LeftMoving = 1
+  # Reset the upper limit for boost.
+  if RightMoving >= 10:
+    RightMoving = 0
+  if LeftMoving >= 10:
+    LeftMoving = 0
+  return RightMoving, LeftMoving
+#--------------------
+
+#--------------------
+# Pinned copy of the boost application that passed the controller state in & out as a tuple.
+def BaselineAddBoost(Moving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity):
+  # Detect if boost is currently applied.
+  if Moving != CurrentSpeed and Boosted == False:
+    Boosted, OriginalSpeed = True, CurrentSpeed
+    ExecutionDuration, CurrentSpeed = BaselineUpdateSpeed(Moving, ExecutionDuration)
+  return Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed
+#--------------------
+
+#--------------------
+# Pinned copy of the motion request path that passed the controller state in & out as tuples.
+def BaselineDetectKeyboardMotion(LastMessage, DebugStops, CurrentSpeed, OriginalSpeed, BeepDuration, NumberOfBuzzes, EnableSpeakerBeep, SpeakerGPIO, MotionTable, MotionMask, Boosted, \
+  ExecutionDuration, Time, Debug):
+  # Initialize variables for request flags.
+  Pressed = False
+  # Look up & perform each action for the pressed motion keys.
+  for RequestReceived, CommandSent, CommandsIssued, PinValues, Boost in MotionTable[PressedKeys & MotionMask]:
+    if Boost is None:
+      # Remove boost from completed turn operations.
+      Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = BaselineRemoveBoost(Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity)
+      RightMoving, LeftMoving, RightTotalBoost, LeftTotalBoost = CurrentSpeed, CurrentSpeed, 'None', 'None'
+    else:
+      BoostChannel, RightTotalBoost, LeftTotalBoost = Boost
+      # Set boosted speed values.
+      RightMoving, LeftMoving = BaselineCalculateBoost(Boosted, CurrentSpeed, OriginalSpeed, RightTotalBoost, LeftTotalBoost)
+      # Apply boost & reduction.
+      if BoostChannel == 'Right':
+        Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = BaselineAddBoost(RightMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity)
+      else:
+        Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed = BaselineAddBoost(LeftMoving, Boosted, ExecutionDuration, CurrentSpeed, OriginalSpeed, DefaultDwellDuration, DefaultSensitivity)
+    # Stage the motor pin values of this action. The motion table now holds the pin values of each action in a dictionary.
+    for Pin, Value in PinValues.items():
+      WriteMotorPin(Pin, Value)
+    if RequestReceived == 'Stop':
+      # Set the movement flags to stopping.
+      RightMoving, LeftMoving = 'Stopping', 'Stopping'
+      if DebugStops == True:
+        Pressed = True
+    else:
+      Pressed = True
+      # Stage the speed level for each motor channel.
+      WriteChannelSpeeds(RightMoving, LeftMoving)
+  # Determine if a request was received.
+  if Pressed == True and EnableSpeakerBeep == True:
+    Beep(SpeakerGPIO, BeepDuration, NumberOfBuzzes, Time)
+  return LastMessage, ExecutionDuration, CurrentSpeed, OriginalSpeed, Boosted
+#--------------------
+
+#--------------------
+# Bind the pinned copies of the motion request path to the namespace of Robot_Motion.py so they use the same globals as the current path.
+def LoadBaseline(Namespace, Types):
+  for Function in (BaselineUpdateSpeed, BaselineRemoveBoost, BaselineCalculateBoost, BaselineAddBoost, BaselineDetectKeyboardMotion):
+    Namespace[Function.__name__] = Types.FunctionType(Function.__code__, Namespace, Function.__name__)
+#--------------------
+
+#--------------------
+# Build the key bitmap, motion table & pending motor state used by the keyboard input cycle.
+def PrepareInputCycle(Namespace):
+  N = Namespace
+  MotionKeys = (N['ForwardKey'], N['BackwardKey'], N['TurnRightKey'], N['TurnLeftKey'], N['RightLimpRightKey'], N['RightLimpLeftKey'], N['LeftLimpRightKey'], N['LeftLimpLeftKey'])
+  SpeedKeys = (N['SpeedOneKey'], N['SpeedTwoKey'], N['SpeedThreeKey'], N['SpeedFourKey'], N['SpeedFiveKey'], N['SpeedSixKey'], N['SpeedSevenKey'], N['SpeedEightKey'], N['SpeedNineKey'], N['SpeedTenKey'])
+  Pins = (N['MotorRelayOnePositiveGPIO'], N['MotorRelayOneNegativeGPIO'], N['MotorRelayTwoPositiveGPIO'], N['MotorRelayTwoNegativeGPIO'])
+  KeyMasks = {}
+  for Key in MotionKeys + (N['IncreaseSensitivityKey'], N['DecreaseSensitivityKey'], N['IncreaseSpeedKey'], N['DecreaseSpeedKey']) + SpeedKeys + (N['CloseKey'], N['TimingReportKey']):
+    if Key not in KeyMasks:
+      KeyMasks[Key] = 1 << len(KeyMasks)
+  N['KeyMasks'], N['PressedKeys'] = KeyMasks, 0
+  N['DutyTable'] = N['UpdateDutyTable']({}, N['DefaultSensitivity'], N['DefaultDwellDuration'], N['ThrottleResolution'])
+  N['PendingMotorState'], N['PendingChannelThrottles'] = {Pin: 0 for Pin in Pins}, [1.0, 1.0]
+  LastMessage, MotionTable, MotionMask = N['CompileMotionTable']('', KeyMasks, *Pins, N['RightBoostAmount'], N['RightReductionAmount'], N['RightLimpBoostAmount'], N['RightLimpReductionAmount'], \
+    N['LeftBoostAmount'], N['LeftReductionAmount'], N['LeftLimpBoostAmount'], N['LeftLimpReductionAmount'], *MotionKeys, False)
+  return KeyMasks, MotionTable, MotionMask
+#--------------------
+
+#--------------------
+# Measure the average duration of one keyboard input cycle while the specified keys are held.
+def MeasureInputCycle(Namespace, KeyMasks, MotionTable, MotionMask, HeldKeys, Cycles, Repetitions, Time):
+  N, Best = Namespace, None
+  N['PressedKeys'] = 0
+  for Key in HeldKeys:
+    N['PressedKeys'] = N['PressedKeys'] | KeyMasks[Key]
+  Controller, Listen, LastMessage = N['ControllerState'](0.0, N['DefaultSpeed'], N['DefaultSpeed'], N['DefaultSensitivity'], 0, 0, False), N['ListenForKeyboardRequests'], ''
+  for Repetition in range(Repetitions):
+    StartTime = Time.perf_counter_ns()
+    for Cycle in range(Cycles):
+      LastMessage = Listen(LastMessage, Controller, False, 0.1, 1, False, N['SpeakerGPIO'], MotionTable, MotionMask, False)
+    Duration = (Time.perf_counter_ns() - StartTime) / Cycles
+    Best = Duration if Best is None else min(Best, Duration)
+  return Best
+#--------------------
+
+#--------------------
+# Measure the average duration of one keyboard input cycle of the pinned motion request path while the specified keys are held.
+def MeasureBaselineInputCycle(Namespace, KeyMasks, MotionTable, MotionMask, HeldKeys, Cycles, Repetitions, Time):
+  N, Best = Namespace, None
+  N['PressedKeys'] = 0
+  for Key in HeldKeys:
+    N['PressedKeys'] = N['PressedKeys'] | KeyMasks[Key]
+  Detect, LastMessage, ExecutionDuration, CurrentSpeed, OriginalSpeed, Boosted = N['BaselineDetectKeyboardMotion'], '', 0.0, N['DefaultSpeed'], N['DefaultSpeed'], False
+  for Repetition in range(Repetitions):
+    StartTime = Time.perf_counter_ns()
+    for Cycle in range(Cycles):
+      LastMessage, ExecutionDuration, CurrentSpeed, OriginalSpeed, Boosted = Detect(LastMessage, False, CurrentSpeed, OriginalSpeed, 0.1, 1, False, N['SpeakerGPIO'], MotionTable, MotionMask, \
+        Boosted, ExecutionDuration, Time, False)
+    Duration = (Time.perf_counter_ns() - StartTime) / Cycles
+    Best = Duration if Best is None else min(Best, Duration)
+  return Best
+#--------------------
+
+#--------------------
+# Measure the average duration of one run of the speed input task while no keys are held.
+# The speed input task runs at SpeedInputRate, independent of the keyboard input cycle.
+def MeasureSpeedInput(Namespace, Cycles, Repetitions, Time):
+  N, Best = Namespace, None
+  N['PressedKeys'] = 0
+  Controller, ListenSettings, LastMessage = N['ControllerState'](0.0, N['DefaultSpeed'], N['DefaultSpeed'], N['DefaultSensitivity'], 0, 0, False), N['ListenForKeyboardSettings'], ''
+  for Repetition in range(Repetitions):
+    StartTime = Time.perf_counter_ns()
+    for Cycle in range(Cycles):
+      LastMessage = ListenSettings(LastMessage, Controller, 0, N['MinimumSensitivity'], N['MaximumSensitivity'], N['SensitivityRepeatDelay'], N['SensitivityChangeAmount'], \
+        N['SpeedRepeatDelay'], N['DefaultDwellDuration'], 0.1, 1, False, N['SpeakerGPIO'], False)
+    Duration = (Time.perf_counter_ns() - StartTime) / Cycles
+    Best = Duration if Best is None else min(Best, Duration)
+  return Best
+#--------------------
+
+#--------------------
+# The main logic of the application.
+
+import sys as Sys, time as Time, types as Types
+
+# Read the command line arguments.
+Arguments = Sys.argv[1:] + [None] * 2
+Cycles, Repetitions = int(Arguments[0] or 200000), int(Arguments[1] or 5)
+
+Namespace = LoadApplication(Types, Sys.argv[3:4])
+LoadBaseline(Namespace, Types)
+KeyMasks, MotionTable, MotionMask = PrepareInputCycle(Namespace)
+print('Scenario'.ljust(22)+'Before'.rjust(10)+'After'.rjust(10)+'  (ns/cycle)')
+for Scenario, HeldKeys in (('Idle', ()), ('Forward', (Namespace['ForwardKey'],)), ('Turn Right', (Namespace['TurnRightKey'],)), ('Forward + Turn Right', (Namespace['ForwardKey'], Namespace['TurnRightKey']))):
+  # Interleave the before & after measurements so both see the same conditions.
+  Before, After = None, None
+  for Repetition in range(Repetitions):
+    Duration = MeasureBaselineInputCycle(Namespace, KeyMasks, MotionTable, MotionMask, HeldKeys, Cycles, 1, Time)
+    Before = Duration if Before is None else min(Before, Duration)
+    Duration = MeasureInputCycle(Namespace, KeyMasks, MotionTable, MotionMask, HeldKeys, Cycles, 1, Time)
+    After = Duration if After is None else min(After, Duration)
+  print(Scenario.ljust(22)+str(round(Before)).rjust(10)+str(round(After)).rjust(10))
+print('Speed Input Task'.ljust(22)+'-'.rjust(10)+str(round(MeasureSpeedInput(Namespace, Cycles, Repetitions, Time))).rjust(10)+'  (ns/run)')
+#--------------------
@@ -0,0 +1,72 @@
+#--------------------
+# APPLICATION NAME
+#   Robot_Motion_Client.py
+
+# APPLICATION INFORMATION
+#   Written by Daniel Grimes & Justin Grimes.
+#   https://github.com/zelon88/Robot_Motion
+#   Version v4.7, October 17th, 2026
+#   Licensed Under GNU GPLv3
+
+# APPLICATION DESCRIPTION
+#   A client to command Robot_Motion.py over the network using the UDP command protocol.
+
+# APPLICATION NOTES
+#   Robot_Motion.py must be run with EnableUDPInput set to True in Robot_Motion_Config.py.
+#   The port is read from Robot_Motion_Config.py when it is available.
+#   Commands are repeated at the requested rate so they are not released by the UDPCommandTimeout of Robot_Motion.py.
+#   A command that stops all motors is sent when the client finishes or is interrupted.
+
+# USAGE
+#   python3 Robot_Motion_Client.py RightThrottle LeftThrottle [Seconds] [Host] [Port] [Rate]
+#   Throttle positions range from -1 to 1. Positive throttle positions rotate the channel forward.
+#   Example, drive forward at half throttle for 2 seconds:  python3 Robot_Motion_Client.py 0.5 0.5 2
+#   Example, turn right for 1 second:                       python3 Robot_Motion_Client.py -0.5 0.5 1
+#--------------------
+
+#--------------------
+# Build a command datagram.
+# Magic, version, flags, sequence number, right channel throttle & left channel throttle in network byte order.
+def BuildCommand(UDPCommandFormat, Flags, Sequence, RightThrottle, LeftThrottle):
+  return UDPCommandFormat.pack(b'RM', 1, Flags, Sequence % 4294967296, int(max(-1.0, min(1.0, RightThrottle)) * 32767), int(max(-1.0, min(1.0, LeftThrottle)) * 32767))
+#--------------------
+
+#--------------------
+# Send the requested command repeatedly for the requested number of seconds, then stop all motors.
+# The first command resets the sequence number held by Robot_Motion.py so a restarted client is not treated as out of order.
+def SendCommands(Host, Port, RightThrottle, LeftThrottle, Seconds, Rate):
+  import socket as Socket, struct as Struct, time as Time
+  UDPCommandFormat, UDPSocket = Struct.Struct('!2sBBIhh'), Socket.socket(Socket.AF_INET, Socket.SOCK_DGRAM)
+  Sequence, Interval, StartTime = 0, 1 / Rate, Time.monotonic()
+  try:
+    while Time.monotonic() - StartTime < Seconds:
+      UDPSocket.sendto(BuildCommand(UDPCommandFormat, 2 if Sequence == 0 else 0, Sequence, RightThrottle, LeftThrottle), (Host, Port))
+      Sequence = Sequence + 1
+      # Pause until the next command is due.
+      Time.sleep(max(0, StartTime + Sequence * Interval - Time.monotonic()))
+  except KeyboardInterrupt:
+    pass
+  finally:
+    # Send the stop command with a fresh sequence number.
+    UDPSocket.sendto(BuildCommand(UDPCommandFormat, 1 | (2 if Sequence == 0 else 0), Sequence, 0, 0), (Host, Port))
+    UDPSocket.close()
+  print('Sent '+str(Sequence + 1)+' UDP Commands To '+str(Host)+':'+str(Port)+'.')
+#--------------------
+
+#--------------------
+# The main logic of the application.
+
+import sys as Sys
+
+# Read the port from the configuration file when it is available.
+try:
+  from Robot_Motion_Config import UDPInputPort
+except ImportError:
+  UDPInputPort = 5005
+
+# Read the command line arguments.
+if len(Sys.argv) < 3:
+  exit('Usage: python3 Robot_Motion_Client.py RightThrottle LeftThrottle [Seconds] [Host] [Port] [Rate]')
+Arguments = Sys.argv[1:] + [None] * 6
+SendCommands(Arguments[3] or '127.0.0.1', int(Arguments[4] or UDPInputPort), float(Arguments[0]), float(Arguments[1]), float(Arguments[2] or 1), float(Arguments[5] or 50))
+#--------------------
@@ -5,7 +5,7 @@
 # APPLICATION INFORMATION
 #   Written by Daniel Grimes & Justin Grimes.
 #   https://github.com/zelon88/Robot_Motion
-#   Version v4.6, January 1st, 2023
+#   Version v4.7, October 17th, 2026
 #   Licensed Under GNU GPLv3
 
 # APPLICATION DESCRIPTION
@@ -83,7 +83,7 @@ ApplicationName = str('Robot Motion')
 #--------------------
 # Version Information.
 # Set a string containing the version of this application to display to the user.
-VersionInfo = str('Version v4.6, January 1st, 2023')
+VersionInfo = str('Version v4.7, October 17th, 2026')
 #--------------------
 
 #--------------------
@@ -199,6 +199,61 @@ LoopAnnouncementInterval = int(100000)
 MaxLoopCount = int(0)
 #--------------------
 
+#--------------------
+# Message Queue Size.
+# Set the maximum number of console messages that can wait for the logging thread.
+# Messages from the PWM thread are printed by a separate logging thread so they do not affect motor timing.
+# Messages are dropped when the queue is full.
+# Default is 256.
+MessageQueueSize = int(256)
+#--------------------
+
+#--------------------
+# Enable Real-Time Mode.
+# Set whether or not to run the PWM thread with real-time scheduling.
+# Locks all memory to avoid page faults, pins the PWM thread to its own CPU core & sets the SCHED_FIFO scheduling policy for the PWM thread.
+# The main & logging threads are moved off of the CPU core used by the PWM thread.
+# A report of whether each setting took effect is printed at startup.
+# Requires root & Linux.
+# Default is False.
+EnableRealTime = bool(False)
+#--------------------
+
+#--------------------
+# Real-Time Priority.
+# Set the SCHED_FIFO priority of the PWM thread when EnableRealTime is set to True.
+# Valid priorities are 1 through 99. Higher numbers preempt more of the system.
+# Default is 50.
+RealTimePriority = int(50)
+#--------------------
+
+#--------------------
+# Real-Time CPU.
+# Set the CPU core to pin the PWM thread to when EnableRealTime is set to True.
+# Set to -1 to use the first core isolated with the isolcpus kernel parameter, or the last core if no cores are isolated.
+# Default is -1.
+RealTimeCPU = int(-1)
+#--------------------
+
+#--------------------
+# Enable Garbage Collection Control.
+# Set whether or not to control when the Python garbage collector runs.
+# Objects created at startup are frozen out of the collector & automatic collection is disabled.
+# Garbage is collected by the PWM thread in the dwell window after every channel has been deactivated, so a collection never stretches the execution duration.
+# Collections are skipped until a dwell window is long enough to hold them.
+# The duration of every collection is recorded in the timing statistics.
+# Default is False.
+EnableGCControl = bool(False)
+#--------------------
+
+#--------------------
+# Garbage Collection Minimum Window.
+# Set the minimum amount of time that must remain in the dwell window to collect garbage when EnableGCControl is set to True, in seconds.
+# The longest collection measured for each generation is used instead when it is longer.
+# Default is 1 / 2000.
+GCMinimumWindow = float(1 / 2000)
+#--------------------
+
 #--------------------
 # Default Dwell Duration.
 # Set the amount of time for each loop to last.
@@ -206,11 +261,59 @@ MaxLoopCount = int(0)
 # This controls the overall frequency of the speed control.
 # This is basically controlling the MOSFET frequency in a traditional ESC.
 # Must be longer than the Execution Duration.
+# Only used until the loop cost is measured when EnableAutoTune is set to True.
 # Default is 1 / 30.
 # Multiples of the default work well.
 DefaultDwellDuration = float(1 / 30)
 #--------------------
 
+#--------------------
+# Enable Auto Tune.
+# Set whether or not to select the clock cycle automatically from the measured cost of polling input & writing the GPIO pins.
+# The cost is measured at startup & tracked while running. The frequency is lowered if the system slows down & raised again when it recovers.
+# When enabled this replaces DefaultDwellDuration.
+# Default is False.
+EnableAutoTune = bool(False)
+#--------------------
+
+#--------------------
+# Auto Tune Headroom.
+# Set how many times longer than the measured loop cost the clock cycle must be.
+# Higher numbers leave more time for other processes & give lower frequencies.
+# Default is 4.
+AutoTuneHeadroom = float(4)
+#--------------------
+
+#--------------------
+# Auto Tune Minimum Frequency.
+# Set the lowest frequency in Hz that auto tune is allowed to select.
+# Default is 10.
+AutoTuneMinimumFrequency = int(10)
+#--------------------
+
+#--------------------
+# Auto Tune Maximum Frequency.
+# Set the highest frequency in Hz that auto tune is allowed to select.
+# This should not exceed the switching frequency of the relays or motor controllers.
+# Speed levels with an execution duration longer than the clock cycle run at full throttle.
+# Default is 60.
+AutoTuneMaximumFrequency = int(60)
+#--------------------
+
+#--------------------
+# Auto Tune Interval.
+# Set the number of seconds between each adjustment of the clock cycle while running.
+# Default is 5.
+AutoTuneInterval = float(5)
+#--------------------
+
+#--------------------
+# Auto Tune Samples.
+# Set the number of samples to take when measuring the loop cost at startup.
+# Default is 100.
+AutoTuneSamples = int(100)
+#--------------------
+
 #--------------------
 # Default Execution Duration.
 # Set the amount of time for each command to last, in seconds.
@@ -221,6 +324,50 @@ DefaultDwellDuration = float(1 / 30)
 DefaultExecutionDuration = float(DefaultDwellDuration / 10)
 #--------------------
 
+#--------------------
+# Timer Calibration Samples.
+# Set the number of sleeps to measure at startup when calibrating the timer.
+# The calibration measures how precisely the operating system can sleep for short durations.
+# Default is 200.
+TimerCalibrationSamples = int(200)
+#--------------------
+
+#--------------------
+# Spin-Wait Margin.
+# Set how long before each motor on/off deadline to stop sleeping & start spin-waiting, in seconds.
+# Spin-waiting is very precise but keeps one CPU core busy for the duration of the margin.
+# Set to a negative number to use the margin measured during timer calibration.
+# Set to 0 to never spin-wait. This uses the least CPU but short execution durations will overshoot.
+# Set to a positive number to use a fixed margin. Larger margins use more CPU & improve duty cycle accuracy.
+# This configuration entry has a significant impact on performance.
+# Default is -1.
+SpinWaitMargin = float(-1)
+#--------------------
+
+#--------------------
+# Enable Timing Statistics.
+# Set whether or not to record timing statistics for every cycle of the PWM thread.
+# Timing statistics show how accurately the Raspberry Pi is achieving the configured frequency.
+# This configuration entry has a minor impact on performance.
+# Default is True.
+EnableTimingStatistics = bool(True)
+#--------------------
+
+#--------------------
+# Timing Histogram Size.
+# Set the number of buckets in each timing histogram.
+# Errors larger than TimingHistogramSize * TimingHistogramResolution are counted in the last bucket.
+# Default is 1000.
+TimingHistogramSize = int(1000)
+#--------------------
+
+#--------------------
+# Timing Histogram Resolution.
+# Set the width of each bucket in the timing histograms, in seconds.
+# Default is 1 / 100000.
+TimingHistogramResolution = float(1 / 100000)
+#--------------------
+
 #--------------------
 # Default Speed Level
 # Set the default speed to use before a speed has been specified.
@@ -237,6 +384,25 @@ DefaultSpeed = int(0)
 DefaultSensitivity = int(2500)
 #--------------------
 
+#--------------------
+# Throttle Resolution.
+# Set the number of throttle steps between stopped & full throttle.
+# The execution duration for every step is calculated once & looked up when a throttle position is requested.
+# Higher numbers give smoother throttle control at the cost of memory.
+# Default is 1000.
+ThrottleResolution = int(1000)
+#--------------------
+
+#--------------------
+# Modulation Mode.
+# Set how the throttle position of each motor channel is converted into relay switching.
+# PWM activates each channel at the start of every clock cycle & deactivates it when its execution duration has elapsed.
+# SigmaDelta keeps each channel active or inactive for whole clock cycles & spreads the active cycles so the average matches the throttle position.
+# SigmaDelta gives fine average throttle with coarse switching that is easier on relays. The throttle is proportional to the speed level & the sensitivity is not used.
+# Default is PWM.
+ModulationMode = str('PWM')
+#--------------------
+
 #--------------------
 # The minimum sensitivity that is allowed to be set using the increase & decrease inputs.
 # Default is 500
@@ -258,7 +424,7 @@ SensitivityChangeAmount = int(50)
 
 #--------------------
 # Right Turn Boost Amount.
-# The number of steps to boost speed during right turns where both motors are used.
+# The number of steps to boost the speed of the right motor channel during turns where both motors are used.
 # Can help when motors are struggling during turns, making turns too sluggish.
 # Set to 0 to not apply any speed level boost during right turns.
 # Do not set lower than RightReductionAmount.
@@ -268,7 +434,7 @@ RightBoostAmount = int(2)
 
 #--------------------
 # Left Turn Boost Amount.
-# The number of steps to boost speed during left turns where both motors are used.
+# The number of steps to boost the speed of the left motor channel during turns where both motors are used.
 # Can help when motors are struggling during turns, making turns too sluggish.
 # Set to 0 to not apply any speed level boost during left turns.
 # Do not set lower than LeftReductionAmount.
@@ -278,7 +444,7 @@ LeftBoostAmount = int(2)
 
 #--------------------
 # Right Turn Reduction Amount.
-# The number of steps to reduce speed during right turns where both motors are used.
+# The number of steps to reduce the speed of the right motor channel during turns where both motors are used.
 # Can help when motors are too powerful during turns, making turns too rapid.
 # Set to 0 to not apply any speed level reduction during right turns.
 # Do not set higher than RightBoostAmount.
@@ -287,8 +453,8 @@ RightReductionAmount = int(0)
 #--------------------
 
 #--------------------
-# Right Turn Reduction Amount.
-# The number of steps to reduce speed during left turns where both motors are used.
+# Left Turn Reduction Amount.
+# The number of steps to reduce the speed of the left motor channel during turns where both motors are used.
 # Can help when motors are too powerful during turns, making turns too rapid.
 # Set to 0 to not apply any speed level reduction during left turns.
 # Do not set higher than LeftBoostAmount.
@@ -337,31 +503,70 @@ LeftLimpReductionAmount = int(0)
 #--------------------
 
 #--------------------
-# Detect Sensitivity Interval
-# Set the cycle interval for performing sensitivity update detection.
-# Default is 3.
-DetectSensitivityInterval = int(3)
+# Motion Input Rate.
+# Set how many times per second to read the motion keys & remote commands & publish the requested motor state to the PWM thread, in Hz.
+# Set to 0 to read input at the frequency of the PWM thread, which follows DwellDuration & EnableAutoTune.
+# Default is 0.
+MotionInputRate = float(0)
 #--------------------
 
 #--------------------
-# Detect Sensitivity Skip Interval
-# Set the number of cycles to skip sensitivity update detection after a sensitivity change is performed.
-# Default is 8.
-DetectSensitivitySkipInterval = int(8)
+# Speed Input Rate.
+# Set how many times per second to check the speed & sensitivity keys, in Hz.
+# These keys do not need to be checked as often as the motion keys.
+# Default is 10.
+SpeedInputRate = float(10)
 #--------------------
 
 #--------------------
-# Detect Speed Interval
-# Set the cycle interval for performing speed update detection.
-# Default is 3.
-DetectSpeedInterval = int(3)
+# Sensitivity Repeat Delay.
+# Set the amount of time to ignore the sensitivity keys after a sensitivity change is performed, in seconds.
+# Holding a sensitivity key repeats the change once per delay.
+# Default is 1 / 4.
+SensitivityRepeatDelay = float(1 / 4)
 #--------------------
 
 #--------------------
-# Detect Speed Skip Interval
-# Set the number of cycles to skip speed update detection after a speed change is performed.
-# Default is 8.
-DetectSpeedSkipInterval = int(8)
+# Speed Repeat Delay.
+# Set the amount of time to ignore the speed keys after a speed change is performed, in seconds.
+# Holding a speed key repeats the change once per delay.
+# Default is 1 / 4.
+SpeedRepeatDelay = float(1 / 4)
+#--------------------
+
+#--------------------
+# Telemetry Rate.
+# Set how many times per second to check the TimingReportKey, in Hz.
+# Default is 4.
+TelemetryRate = float(4)
+#--------------------
+
+#--------------------
+# Loop Tracking Rate.
+# Set how many times per second to run the loop tracking code when EnableLoopTracking is set to True, in Hz.
+# LoopAnnouncementInterval & MaxLoopCount count the number of times the loop tracking code has run.
+# Set to 0 to run the loop tracking code on every iteration of the main loop.
+# Default is 0.
+LoopTrackingRate = float(0)
+#--------------------
+
+#--------------------
+# Enable Configuration Reload.
+# Set whether or not to reload the tuning values while the application is running.
+# The configuration is reloaded when this file changes or when the SIGHUP signal is sent to the application.
+# The sensitivity, dwell duration, boost & reduction amounts, input rates, repeat delays, auto tune settings & remote command timeouts are applied without stopping the motors.
+# Changes to any other configuration variable are only applied after the application is restarted.
+# A configuration that is not valid is reported & the previous configuration is kept.
+# Default is True.
+EnableConfigReload = bool(True)
+#--------------------
+
+#--------------------
+# Config Watch Rate.
+# Set how many times per second to check if this file has changed when EnableConfigReload is set to True, in Hz.
+# Set to 0 to only reload the configuration when the SIGHUP signal is received.
+# Default is 1.
+ConfigWatchRate = float(1)
 #--------------------
 
 #--------------------
@@ -378,6 +583,45 @@ GPIOMode = str('BCM')
 # Default is False.
 GPIOWarnings = bool(False)
 
+#--------------------
+# GPIO Output Backend.
+# Set the method used to write motor states to the motor GPIO pins.
+# RPi writes every motor pin of a motor state with a single call to the RPi library.
+# Register writes every motor pin of a motor state directly to the memory mapped GPIO set & clear registers. Requires BCM numbering.
+# The Register backend supports the GPIO register layout of the Raspberry Pi 4 & earlier.
+# If the Register backend cannot be initialized the RPi backend is used instead.
+# GPIOChip requests the speaker & motor pins from the Linux GPIO character device as a single handle & writes every pin with a single call to the kernel.
+# GPIOChip does not require the RPi library. Requires BCM numbering.
+# Mock records the motor states in memory without writing to any GPIO pins. Mock does not require the RPi library or any GPIO hardware.
+# Use Mock to test this application on a computer that is not a Raspberry Pi.
+# Default is RPi.
+GPIOBackend = str('RPi')
+#--------------------
+
+#--------------------
+# GPIO Register Device.
+# Set the device that maps the GPIO registers when the Register backend is used.
+# Set to the path of a regular file to use a file that stands in for the GPIO registers when testing without hardware.
+# Default is /dev/gpiomem.
+GPIORegisterDevice = str('/dev/gpiomem')
+#--------------------
+
+#--------------------
+# GPIO Character Device.
+# Set the Linux GPIO character device that provides the GPIO lines when the GPIOChip backend is used.
+# Set to the path of a regular file to use a file that stands in for the device when testing without hardware.
+# Default is /dev/gpiochip0.
+GPIOChipDevice = str('/dev/gpiochip0')
+#--------------------
+
+#--------------------
+# Enable Shadow Register.
+# Set whether or not to keep the last value written to each motor pin & skip writes that would not change the value of a pin.
+# The number of suppressed writes is printed with the timing statistics.
+# Default is True.
+EnableShadowRegister = bool(True)
+#--------------------
+
 #--------------------
 # GPIO Pin Configuration - Speaker.
 # Set the GPIO pin to use for controlling the speaker.
@@ -421,6 +665,42 @@ MotorRelayTwoNegativeGPIO = int(21)
 EnableKeyboardInput = bool(True)
 #--------------------
 
+#--------------------
+# Keyboard Input Configuration - Enable Keyboard Events.
+# Set whether or not to track pressed keys with key down & key up events instead of polling each key.
+# Pressed keys are kept in a bitmap that is read once per input cycle.
+# If keyboard events cannot be hooked each key is polled once per input cycle instead.
+# Default is True.
+EnableKeyboardEvents = bool(True)
+#--------------------
+
+#--------------------
+# Keyboard Input Configuration - Keyboard Input Backend.
+# Set the source of key events.
+# Set to Keyboard to use the keyboard library, which requires root privileges.
+# Set to Evdev to read key events directly from the input event device set by KeyboardInputDevice, which only requires membership of the input group.
+# Set to Terminal to read keys typed on the terminal, which works over SSH where the keyboard library cannot see the keyboard.
+# EnableKeyboardEvents has no effect when set to Evdev or Terminal.
+# Default is Keyboard.
+KeyboardInputBackend = str('Keyboard')
+#--------------------
+
+#--------------------
+# Keyboard Input Configuration - Keyboard Input Device.
+# Set the input event device to read key events from when KeyboardInputBackend is set to Evdev.
+# A pipe can be used to feed recorded key events. A regular file is replayed at the pace of its recorded event timestamps.
+# Default is /dev/input/event0.
+KeyboardInputDevice = str('/dev/input/event0')
+#--------------------
+
+#--------------------
+# Keyboard Input Configuration - Terminal Release Timeout.
+# Set the number of seconds after a key was last typed on the terminal at which it is considered released when KeyboardInputBackend is set to Terminal.
+# A terminal reports a held key by repeating it, so this should be longer than the delay before the keyboard starts repeating.
+# Default is 0.6.
+TerminalReleaseTimeout = float(0.6)
+#--------------------
+
 #--------------------
 # Keyboard Input Configuration - All Motors Forward.
 # The key on the keyboard to command the robot forward.
@@ -579,4 +859,143 @@ SpeedTenKey = str('0')
 # This key is not affected by EnableKeyboardInput,
 # Default is esc.
 CloseKey = str('esc')
+#--------------------
+
+#--------------------
+# Keyboard Input Configuration - Print Timing Statistics.
+# The key on the keyboard to print the timing statistics of the PWM thread.
+# Only takes effect if EnableTimingStatistics is set to True.
+# Default is t.
+TimingReportKey = str('t')
+#--------------------
+
+#--------------------
+# Joystick Input Configuration - Enable Joystick Input.
+# Enable listening for requests from the axes of a joystick or gamepad.
+# The joystick sets a continuous throttle position for each motor channel. Channels the joystick is not driving are controlled by the keyboard.
+# The throttle positions are scaled by the current speed.
+# Default is False.
+EnableJoystickInput = bool(False)
+#--------------------
+
+#--------------------
+# Joystick Input Configuration - Joystick Input Device.
+# Set the input event device to read joystick axes from.
+# A pipe can be used to feed recorded joystick events. A regular file is replayed at the pace of its recorded event timestamps.
+# Default is /dev/input/event1.
+JoystickInputDevice = str('/dev/input/event1')
+#--------------------
+
+#--------------------
+# Joystick Input Configuration - Throttle & Steering Axes.
+# Set the absolute axis codes of the sticks used for throttle & steering.
+# 0 is the X axis & 1 is the Y axis of the left stick. 3 is the X axis & 4 is the Y axis of the right stick on most gamepads.
+# Set JoystickInvertThrottle to True for joysticks that report forward as a negative position.
+# Default is 1, 0 & True.
+JoystickThrottleAxis = int(1)
+JoystickSteeringAxis = int(0)
+JoystickInvertThrottle = bool(True)
+#--------------------
+
+#--------------------
+# Joystick Input Configuration - Axis Range.
+# Set the minimum & maximum axis positions used when the range cannot be read from the device, such as for recorded events.
+# Default is -32768 & 32767.
+JoystickAxisMinimum = int(-32768)
+JoystickAxisMaximum = int(32767)
+#--------------------
+
+#--------------------
+# Joystick Input Configuration - Deadzone & Expo.
+# Set the fraction of axis travel around the center that is ignored.
+# Set the amount of cubic response to blend with the linear response. 0 is linear & 1 is fully cubic, which gives finer control near the center.
+# Default is 0.1 & 0.3.
+JoystickDeadzone = float(0.1)
+JoystickExpo = float(0.3)
+#--------------------
+
+#--------------------
+# UDP Input Configuration - Enable UDP Input.
+# Enable listening for commands from remote operators using the UDP command protocol.
+# Each command sets a throttle position & direction for each motor channel. Channels the command is not driving are controlled by the keyboard & joystick.
+# Robot_Motion_Client.py can be used to send commands.
+# Default is False.
+EnableUDPInput = bool(False)
+#--------------------
+
+#--------------------
+# UDP Input Configuration - Address & Port.
+# Set the address & port to listen for UDP commands on.
+# Set UDPInputAddress to 127.0.0.1 to only accept commands from the local computer.
+# Default is 0.0.0.0 & 5005.
+UDPInputAddress = str('0.0.0.0')
+UDPInputPort = int(5005)
+#--------------------
+
+#--------------------
+# UDP Input Configuration - Command Timeout.
+# Set the number of seconds after the last UDP command at which the command is released & the remote throttle positions return to zero.
+# Remote operators must repeat commands more often than this.
+# Default is 0.25.
+UDPCommandTimeout = float(0.25)
+#--------------------
+
+#--------------------
+# Web Input Configuration - Enable Web Input.
+# Enable serving a control page with an on screen joystick that operators can use from a browser on a phone or laptop.
+# The joystick position is shaped using JoystickDeadzone & JoystickExpo. Channels the control page is not driving are controlled by the keyboard, joystick & UDP commands.
+# Anyone who can reach the control page can drive the robot. Only the control page itself can open a WebSocket connection from a browser, pages from other origins are refused.
+# Default is False.
+EnableWebInput = bool(False)
+#--------------------
+
+#--------------------
+# Web Input Configuration - Address & Port.
+# Set the address & port to serve the control page on. The control page is available at http://<address>:<port>/
+# The control page is only served to the local computer by default. Set WebInputAddress to 0.0.0.0 to serve it to every computer on the network.
+# Default is 127.0.0.1 & 8080.
+WebInputAddress = str('127.0.0.1')
+WebInputPort = int(8080)
+#--------------------
+
+#--------------------
+# Web Input Configuration - Command Timeout.
+# Set the number of seconds after the last command from the control page at which the command is released & the throttle positions return to zero.
+# The control page sends 20 commands per second while the joystick is held.
+# Default is 0.5.
+WebCommandTimeout = float(0.5)
+#--------------------
+
+#--------------------
+# Web Input Configuration - Rate Limit.
+# Set the number of commands per second accepted from each connection to the control page.
+# Set WebSocketBurst to the number of commands that can be accepted at once.
+# Commands that arrive faster are coalesced so only the most recent command is applied. Connections that keep flooding are read more slowly.
+# Default is 30 & 5.
+WebSocketRateLimit = int(30)
+WebSocketBurst = int(5)
+#--------------------
+
+#--------------------
+# Shared Memory Input Configuration - Enable Shared Memory Input.
+# Enable a shared memory mailbox that co-located processes such as vision & planning can write commands to.
+# Each command sets a throttle position & direction for each motor channel. Channels the command is not driving are controlled by the other inputs.
+# Robot_Motion_Mailbox.py can be imported by other processes to write commands.
+# Default is False.
+EnableSharedMemoryInput = bool(False)
+#--------------------
+
+#--------------------
+# Shared Memory Input Configuration - Mailbox Name.
+# Set the name of the shared memory segment used for the mailbox. The segment is available at /dev/shm/<name>.
+# Default is Robot_Motion.
+SharedMemoryName = str('Robot_Motion')
+#--------------------
+
+#--------------------
+# Shared Memory Input Configuration - Command Timeout.
+# Set the number of seconds after the last command written to the mailbox at which the command is released & the throttle positions return to zero.
+# Writers must repeat commands more often than this.
+# Default is 0.25.
+SharedMemoryCommandTimeout = float(0.25)
 #--------------------
\ No newline at end of file
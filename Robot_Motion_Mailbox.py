@@ -0,0 +1,97 @@
+#--------------------
+# APPLICATION NAME
+#   Robot_Motion_Mailbox.py
+
+# APPLICATION INFORMATION
+#   Written by Daniel Grimes & Justin Grimes.
+#   https://github.com/zelon88/Robot_Motion
+#   Version v4.7, October 17th, 2026
+#   Licensed Under GNU GPLv3
+
+# APPLICATION DESCRIPTION
+#   A writer for the shared memory mailbox of Robot_Motion.py.
+#   Lets co-located processes such as vision & planning command Robot_Motion.py without faking keystrokes.
+
+# APPLICATION NOTES
+#   Robot_Motion.py must be run with EnableSharedMemoryInput set to True in Robot_Motion_Config.py.
+#   The mailbox name is read from Robot_Motion_Config.py when it is available.
+#   Only one process may write to the mailbox at a time & it must run on the same computer as Robot_Motion.py.
+#   The mailbox is protected by a sequence lock written with plain stores. Python provides no memory barriers, so the lock relies on the stores becoming visible in the order they are made.
+#   Each field is aligned to its size. The 32 bit fields are written with a single store, the 64 bit throttle positions may be written with two stores on 32 bit processors.
+#   Writers must use the same byte order & floating point format as Robot_Motion.py, which is always the case on the same computer.
+#   Robot_Motion.py validates every command it reads & rejects commands with unknown flags or with throttle positions that are not numbers from -1 to 1.
+#   Commands must be repeated more often than the SharedMemoryCommandTimeout of Robot_Motion.py or they are released.
+
+# USAGE
+#   Import this file & call OpenMailbox(), WriteMailboxCommand() & CloseMailbox().
+#   Or run this file to send a command from the command line.
+#   python3 Robot_Motion_Mailbox.py RightThrottle LeftThrottle [Seconds] [Rate]
+#   Throttle positions range from -1 to 1. Positive throttle positions rotate the channel forward.
+#--------------------
+
+#--------------------
+# Open the shared memory mailbox created by Robot_Motion.py.
+# The mailbox is removed by Robot_Motion.py so it is not tracked for removal when this process exits.
+def OpenMailbox(SharedMemoryName):
+  from multiprocessing import shared_memory as SharedMemory, resource_tracker as ResourceTracker
+  Segment = SharedMemory.SharedMemory(name=SharedMemoryName)
+  try:
+    ResourceTracker.unregister(Segment._name, 'shared_memory')
+  except (AttributeError, KeyError):
+    pass
+  return {'Segment': Segment, 'Words': Segment.buf[0:8].cast('I'), 'Values': Segment.buf[8:24].cast('d')}
+#--------------------
+
+#--------------------
+# Write a command to the mailbox.
+# The sequence number is odd while the command is written so Robot_Motion.py never applies a partially written command.
+# The sequence number skips 0 when it wraps around because 0 means no command was written.
+# Set flag 1 to stop all motors regardless of other input.
+def WriteMailboxCommand(Mailbox, RightThrottle, LeftThrottle, Flags):
+  Words, Values = Mailbox['Words'], Mailbox['Values']
+  Sequence = Words[0] & ~1
+  Words[0] = Sequence + 1
+  Words[1], Values[0], Values[1] = Flags, RightThrottle, LeftThrottle
+  Words[0] = (Sequence + 2) % 4294967296 or 2
+#--------------------
+
+#--------------------
+# Close the mailbox without removing it.
+def CloseMailbox(Mailbox):
+  Mailbox['Words'].release()
+  Mailbox['Values'].release()
+  Mailbox['Segment'].close()
+#--------------------
+
+#--------------------
+# The main logic of the application.
+# Send the requested command repeatedly for the requested number of seconds, then stop all motors.
+if __name__ == '__main__':
+  import sys as Sys, time as Time
+
+  # Read the mailbox name from the configuration file when it is available.
+  try:
+    from Robot_Motion_Config import SharedMemoryName
+  except ImportError:
+    SharedMemoryName = 'Robot_Motion'
+
+  # Read the command line arguments.
+  if len(Sys.argv) < 3:
+    exit('Usage: python3 Robot_Motion_Mailbox.py RightThrottle LeftThrottle [Seconds] [Rate]')
+  Arguments = Sys.argv[1:] + [None] * 4
+  RightThrottle, LeftThrottle, Seconds, Rate = float(Arguments[0]), float(Arguments[1]), float(Arguments[2] or 1), float(Arguments[3] or 50)
+
+  Mailbox, Count, StartTime = OpenMailbox(SharedMemoryName), 0, Time.monotonic()
+  try:
+    while Time.monotonic() - StartTime < Seconds:
+      WriteMailboxCommand(Mailbox, RightThrottle, LeftThrottle, 0)
+      Count = Count + 1
+      # Pause until the next command is due.
+      Time.sleep(max(0, StartTime + Count / Rate - Time.monotonic()))
+  except KeyboardInterrupt:
+    pass
+  finally:
+    WriteMailboxCommand(Mailbox, 0.0, 0.0, 1)
+    CloseMailbox(Mailbox)
+  print('Wrote '+str(Count + 1)+' Shared Memory Commands To '+str(SharedMemoryName)+'.')
+#--------------------